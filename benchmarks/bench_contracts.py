@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the call overhead of contract checked methods under different sampling policies
+and the class creation cost of ContractInterface implementations.
+
+Run from the repository root with (Python 3, PyContracts installed):
+
+    python -m benchmarks.bench_contracts
+"""
+from __future__ import absolute_import, division, print_function
+
+import contracts
+from contracts.main import contracts_decorate
+
+import pure_contracts
+from benchmarks.bench_interface_only import best_ns
+
+
+class IPlant(pure_contracts.ContractInterface):
+    @contracts.contract(height='float,>=0', returns=float)
+    def set_height(self, height):
+        pass
+
+
+class Plant(pure_contracts.Concrete, IPlant):
+    def set_height(self, height):
+        return height
+
+
+class ContractsMetaPlant(Plant):
+    """ Checked with PyContracts' own inheritance for comparison """
+    pass
+
+
+ContractsMetaPlant.set_height = contracts_decorate(Plant.set_height.__wrapped__,
+                                                   **IPlant.__dict__['set_height'].__contracts__)
+
+
+def define_plant():
+    class NewPlant(pure_contracts.Concrete, IPlant):
+        def set_height(self, height):
+            return height
+    return NewPlant
+
+
+def main(number=50000, repeat=5):
+    plant = Plant()
+    namespace = {'plant': plant, 'meta_plant': ContractsMetaPlant(), 'raw': Plant.set_height.__wrapped__}
+    print('{:<28}{:>12}'.format('call', 'ns'))
+    print('{:<28}{:>12.0f}'.format('unchecked', best_ns('raw(plant, 1.0)', namespace, number, repeat)))
+    print('{:<28}{:>12.0f}'.format('ContractsMeta', best_ns('meta_plant.set_height(1.0)', namespace, number, repeat)))
+    for policy in (pure_contracts.CheckAll(), pure_contracts.EveryNth(10),
+                   pure_contracts.EveryNth(100), pure_contracts.FirstN(0)):
+        pure_contracts.set_contract_sampling(policy)
+        ns = best_ns('plant.set_height(1.0)', namespace, number, repeat)
+        print('{:<28}{:>12.0f}'.format(repr(policy), ns))
+    pure_contracts.set_contract_sampling(pure_contracts.CheckAll())
+    namespace = {'define_plant': define_plant}
+    print()
+    print('{:<28}{:>12.0f}'.format('define implementation', best_ns('define_plant()', namespace, 500, repeat)))
+
+
+if __name__ == '__main__':
+    main()
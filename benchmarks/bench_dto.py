@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""
+Compares make_dto() types with hand-written implementations of a data only interface.
+
+Construction time, attribute read time and the memory used by each instance are measured for an implementation
+setting its attributes in __init__ (read through AttributeProperty), the same with __slots__ and the types returned
+by make_dto() and make_dto(frozen=True).  Run from the repository root with (Python 3):
+
+    python -m benchmarks.bench_dto
+"""
+from __future__ import absolute_import, division, print_function
+
+import timeit
+import tracemalloc
+
+import pure_interface
+from pure_interface import PureInterface, Concrete
+
+
+class ICustomer(PureInterface):
+    name = None
+    email = None
+    balance = None
+
+    @property
+    def customer_id(self):
+        pass
+
+
+class Customer(Concrete, ICustomer):
+    def __init__(self, balance, customer_id, email, name):
+        self.balance = balance
+        self.customer_id = customer_id
+        self.email = email
+        self.name = name
+
+
+class SlottedCustomer(Concrete, ICustomer):
+    __slots__ = ('balance', 'customer_id', 'email', 'name')
+
+    def __init__(self, balance, customer_id, email, name):
+        self.balance = balance
+        self.customer_id = customer_id
+        self.email = email
+        self.name = name
+
+
+IMPLEMENTATIONS = [
+    ('hand-written', Customer),
+    ('hand-written __slots__', SlottedCustomer),
+    ('make_dto()', ICustomer.make_dto()),
+    ('make_dto(frozen=True)', ICustomer.make_dto(frozen=True)),
+]
+
+
+def bytes_per_instance(cls, n_instances):
+    """ Returns the memory allocated per instance of cls, including its __dict__ """
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    instances = [cls(0, i, 'a@b.c', 'a') for i in range(n_instances)]
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del instances
+    return used / n_instances - 8  # exclude the list entry
+
+
+def main(number=200000, repeat=5, n_instances=100000):
+    print('pure_interface.is_development = {}'.format(pure_interface.is_development))
+    print('{:<26}{:>12}{:>12}{:>12}'.format('', 'create (us)', 'read (ns)', 'bytes'))
+    for name, cls in IMPLEMENTATIONS:
+        namespace = {'cls': cls, 'obj': cls(0, 1, 'a@b.c', 'a')}
+        create = min(timeit.repeat('cls(0, 1, "a@b.c", "a")', globals=namespace, number=number, repeat=repeat))
+        read = min(timeit.repeat('obj.customer_id', globals=namespace, number=number * 5, repeat=repeat))
+        print('{:<26}{:>12.3f}{:>12.1f}{:>12.0f}'.format(name, create / number * 1e6, read / number / 5 * 1e9,
+                                                         bytes_per_instance(cls, n_instances)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Compares creating implementations at runtime with type(), implement() and implement_all().
+
+Each class implements an interface with a property, an attribute and several methods, using the same functions
+as would happen when generating one class per database table.  Incomplete classes, which issue a warning each,
+are timed separately.  Run from the repository root with (Python 3):
+
+    python -m benchmarks.bench_implement
+"""
+from __future__ import absolute_import, division, print_function
+
+import time
+import warnings
+
+import pure_interface
+from pure_interface import PureInterface, Concrete
+
+
+class IRecord(PureInterface):
+    table = None
+
+    @property
+    def key(self):
+        pass
+
+    def save(self, connection, commit=True):
+        pass
+
+    def load(self, connection):
+        pass
+
+    def delete(self, connection):
+        pass
+
+    def fields(self):
+        pass
+
+
+def __init__(self, key=None):
+    self.table = type(self).__name__
+    self.key = key
+
+
+def save(self, connection, commit=True):
+    return connection
+
+
+def load(self, connection):
+    return connection
+
+
+def delete(self, connection):
+    return connection
+
+
+def fields(self):
+    return ()
+
+
+COMPLETE = {'__init__': __init__, 'save': save, 'load': load, 'delete': delete, 'fields': fields}
+INCOMPLETE = {'__init__': __init__, 'save': save, 'load': load}
+
+
+def with_type(classes):
+    return [type(name, (Concrete, IRecord), namespace) for name, namespace in classes]
+
+
+def with_implement(classes):
+    return [pure_interface.implement(IRecord, name, namespace) for name, namespace in classes]
+
+
+def with_implement_all(classes):
+    return pure_interface.implement_all(IRecord, classes)
+
+
+def best_us(create, classes, repeat):
+    """ Returns the best time to create each class in microseconds """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        create(classes)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best / len(classes) * 1e6
+
+
+def main(n_classes=2000, repeat=5):
+    warnings.simplefilter('ignore')
+    print('Creating {} implementations'.format(n_classes))
+    print('{:<18}{:>16}{:>18}'.format('', 'complete (us)', 'incomplete (us)'))
+    for name, create in (('type()', with_type), ('implement', with_implement), ('implement_all', with_implement_all)):
+        timings = []
+        for namespace in (COMPLETE, INCOMPLETE):
+            classes = [('Table{}'.format(i), dict(namespace)) for i in range(n_classes)]
+            timings.append(best_us(create, classes, repeat))
+        print('{:<18}{:>16.1f}{:>18.1f}'.format(name, *timings))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Measures the time taken to import pure_interface and to define interfaces and implementations compared with plain
+abc.ABCMeta classes.
+
+Each configuration runs in a fresh interpreter so that environment variables read at import take effect.
+Run from the repository root with (Python 3):
+
+    python -m benchmarks.bench_import
+"""
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import subprocess
+import sys
+
+ABC_HEADER = '''
+import abc
+class Concrete(object):
+    pass
+'''
+
+PURE_INTERFACE_HEADER = '''
+from pure_interface import PureInterface, Concrete
+'''
+
+# (name, header, environment)
+CONFIGURATIONS = [
+    ('abc.ABCMeta', ABC_HEADER, {}),
+    ('development', PURE_INTERFACE_HEADER, {}),
+    ('is_development=False', PURE_INTERFACE_HEADER, {'PURE_INTERFACE_DEVELOPMENT': '=0'}),
+    ('strip mode', PURE_INTERFACE_HEADER, {'PURE_INTERFACE_STRIP': '1'}),
+]
+
+TIMER = '''
+import json, time
+source = {source!r}
+code = compile(source, 'generated', 'exec')
+best = None
+for _ in range({repeat}):
+    start = time.perf_counter()
+    exec(code, {{}})
+    elapsed = time.perf_counter() - start
+    best = elapsed if best is None else min(best, elapsed)
+print(json.dumps(best))
+'''
+
+
+def make_source(header, use_abc, n_interfaces, n_methods):
+    lines = [header]
+    for i in range(n_interfaces):
+        lines.append('class I{}({}):'.format(i, 'abc.ABC' if use_abc else 'PureInterface'))
+        lines.append('    @property')
+        if use_abc:
+            lines.append('    @abc.abstractmethod')
+        lines.append('    def value{}(self):'.format(i))
+        lines.append('        pass')
+        for m in range(n_methods):
+            if use_abc:
+                lines.append('    @abc.abstractmethod')
+            lines.append('    def method{}(self, a, b=None):'.format(m))
+            lines.append('        pass')
+        lines.append('class Impl{0}(Concrete, I{0}):'.format(i))
+        lines.append('    def __init__(self):')
+        lines.append('        self.value{} = 1'.format(i))
+        for m in range(n_methods):
+            lines.append('    def method{}(self, a, b=None):'.format(m))
+            lines.append('        return a')
+    return '\n'.join(lines)
+
+
+MODULE_COUNTER = '''
+import sys
+before = set(sys.modules)
+import pure_interface
+print(len(set(sys.modules) - before))
+'''
+
+
+def run_python(arguments, environment, script=None):
+    """ Runs the Python interpreter from the repository root and returns (stdout, stderr) """
+    env = dict(os.environ)
+    for name in ('PURE_INTERFACE_STRIP', 'PURE_INTERFACE_DEVELOPMENT', 'PURE_INTERFACE_DEVELOPMENT_FILE'):
+        env.pop(name, None)
+    env.update(environment)
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    process = subprocess.Popen([sys.executable] + arguments, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE, env=env, cwd=root)
+    out, err = process.communicate(script.encode('utf-8') if script else None)
+    if process.returncode:
+        raise RuntimeError(err.decode('utf-8'))
+    return out.decode('utf-8'), err.decode('utf-8')
+
+
+def run(header, environment, n_interfaces, n_methods, repeat):
+    source = make_source(header, header is ABC_HEADER, n_interfaces, n_methods)
+    script = TIMER.format(source=source, repeat=repeat)
+    out, _ = run_python(['-W', 'ignore', '-'], environment, script)
+    return json.loads(out)
+
+
+COLD_TIMER = '''
+import json, sys, time
+code = compile({source!r}, 'generated', 'exec')
+before = set(sys.modules)
+start = time.perf_counter()
+exec(code, {{}})
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, len(set(sys.modules) - before)]))
+'''
+
+
+def cold_time(header, environment, n_interfaces, n_methods, repeat):
+    """ Returns (best time to run the source in a fresh interpreter in seconds, number of modules it loads).
+    This includes importing pure_interface and any modules loaded while defining the classes, as when importing
+    an application module that defines interfaces.
+    """
+    source = make_source(header, header is ABC_HEADER, n_interfaces, n_methods)
+    best = None
+    for _ in range(repeat):
+        out, _ = run_python(['-W', 'ignore', '-'], environment, COLD_TIMER.format(source=source))
+        elapsed, modules = json.loads(out)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, modules
+
+
+def import_time(environment, repeat):
+    """ Returns (best cumulative import time of pure_interface in seconds, number of modules the import loads) """
+    best = None
+    for _ in range(repeat):
+        _, err = run_python(['-X', 'importtime', '-c', 'import pure_interface'], environment)
+        for line in err.splitlines():
+            fields = line.split('|')
+            if len(fields) == 3 and fields[2].strip() == 'pure_interface':
+                elapsed = int(fields[1]) / 1e6
+                best = elapsed if best is None else min(best, elapsed)
+    out, _ = run_python(['-'], environment, MODULE_COUNTER)
+    return best, int(out)
+
+
+def main(n_interfaces=200, n_methods=5, repeat=5):
+    print('Importing pure_interface')
+    print('{:<24}{:>12}{:>14}'.format('', 'time (ms)', 'new modules'))
+    for name, header, environment in CONFIGURATIONS[1:]:
+        elapsed, modules = import_time(environment, repeat * 3)
+        print('{:<24}{:>12.2f}{:>14}'.format(name, elapsed * 1000, modules))
+    print()
+    print('Importing a module defining {} interfaces with {} methods and one implementation each'.format(
+        n_interfaces, n_methods))
+    print('{:<24}{:>12}{:>14}'.format('', 'time (ms)', 'new modules'))
+    for name, header, environment in CONFIGURATIONS:
+        elapsed, modules = cold_time(header, environment, n_interfaces, n_methods, repeat)
+        print('{:<24}{:>12.2f}{:>14}'.format(name, elapsed * 1000, modules))
+    print()
+    print('Defining {} interfaces with {} methods and one implementation each'.format(n_interfaces, n_methods))
+    print('{:<24}{:>12}{:>14}'.format('', 'time (ms)', 'vs ABCMeta'))
+    baseline = None
+    for name, header, environment in CONFIGURATIONS:
+        elapsed = run(header, environment, n_interfaces, n_methods, repeat)
+        if baseline is None:
+            baseline = elapsed
+        print('{:<24}{:>12.2f}{:>13.2f}x'.format(name, elapsed * 1000, elapsed / baseline))
+
+
+if __name__ == '__main__':
+    main()
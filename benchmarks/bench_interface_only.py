@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Compares attribute and method call overhead of interface_only wrappers.
+
+Run from the repository root with (Python 3):
+
+    python -m benchmarks.bench_interface_only
+"""
+from __future__ import absolute_import, division, print_function
+
+import timeit
+
+import pure_interface
+
+
+class ISpeaker(pure_interface.PureInterface):
+    volume = None
+
+    def speak(self):
+        pass
+
+
+class Speaker(pure_interface.Concrete, ISpeaker):
+    def __init__(self):
+        self.volume = 5
+
+    def speak(self):
+        return self.volume
+
+
+class GetattrWrapper(object):
+    """ The __getattr__ based wrapper previously used by interface_only, for comparison """
+    def __init__(self, implementation, interface):
+        self.__impl = implementation
+        self.__interface = interface
+        self.__interface_attrs = interface._pi.interface_names
+        self.__interface_name = interface.__name__
+
+    def __getattr__(self, attr):
+        impl = self.__impl
+        if attr in self.__interface_attrs:
+            return getattr(impl, attr)
+        else:
+            raise AttributeError("'{}' interface has no attribute '{}'".format(self.__interface_name, attr))
+
+
+def best_ns(stmt, namespace, number, repeat):
+    """ Returns the best time per execution of stmt in nanoseconds """
+    timer = timeit.Timer(stmt, globals=namespace)
+    return min(timer.repeat(repeat, number)) / number * 1e9
+
+
+def main(number=200000, repeat=5):
+    speaker = Speaker()
+    subjects = [
+        ('direct', speaker),
+        ('__getattr__ wrapper', GetattrWrapper(speaker, ISpeaker)),
+        ('interface_only', ISpeaker.interface_only(speaker)),
+    ]
+    print('{:<22}{:>16}{:>16}'.format('', 'attribute (ns)', 'method (ns)'))
+    for name, subject in subjects:
+        namespace = {'subject': subject}
+        attribute = best_ns('subject.volume', namespace, number, repeat)
+        method = best_ns('subject.speak()', namespace, number, repeat)
+        print('{:<22}{:>16.1f}{:>16.1f}'.format(name, attribute, method))
+
+
+if __name__ == '__main__':
+    main()
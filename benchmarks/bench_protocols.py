@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Compares isinstance checks against a runtime_checkable typing.Protocol with checks against its protocol_interface().
+
+typing checks every protocol member of the object on every call, while the interface caches its structural verdict
+per type.  Run from the repository root with (Python 3.8+):
+
+    python -m benchmarks.bench_protocols
+"""
+from __future__ import absolute_import, division, print_function
+
+import timeit
+import typing
+
+import pure_interface
+
+
+@typing.runtime_checkable
+class SupportsStream(typing.Protocol):
+    def read(self, size: int = -1) -> bytes:
+        ...
+
+    def write(self, data: bytes) -> int:
+        ...
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class Stream(object):
+    def read(self, size=-1):
+        return b''
+
+    def write(self, data):
+        return len(data)
+
+    def seek(self, offset, whence=0):
+        return offset
+
+    def close(self):
+        pass
+
+
+class Other(object):
+    pass
+
+
+IStream = pure_interface.protocol_interface(SupportsStream)
+
+
+def main(number=200000, repeat=5):
+    namespace = {'SupportsStream': SupportsStream, 'IStream': IStream, 'stream': Stream(), 'other': Other()}
+    print('{:<28}{:>14}{:>14}'.format('', 'hit (us)', 'miss (us)'))
+    for name, protocol in (('runtime_checkable', 'SupportsStream'), ('protocol_interface', 'IStream')):
+        timings = []
+        for obj in ('stream', 'other'):
+            stmt = 'isinstance({}, {})'.format(obj, protocol)
+            best = min(timeit.repeat(stmt, globals=namespace, number=number, repeat=repeat))
+            timings.append(best / number * 1e6)
+        print('{:<28}{:>14.3f}{:>14.3f}'.format(name, *timings))
+
+
+if __name__ == '__main__':
+    main()
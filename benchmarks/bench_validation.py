@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Compares the call overhead of methods validated against interface annotations with unchecked calls.
+
+Run from the repository root with (Python 3):
+
+    python -m benchmarks.bench_validation
+"""
+from __future__ import absolute_import, division, print_function
+
+from typing import List, Optional
+
+import pure_interface
+from benchmarks.bench_interface_only import best_ns
+
+
+class IShape(pure_interface.PureInterface):
+    def area(self) -> float:
+        pass
+
+
+class Square(pure_interface.Concrete, IShape):
+    def area(self):
+        return 1.0
+
+
+class ICanvas(pure_interface.PureInterface):
+    pi_validate_arguments = True
+
+    def scale(self, factor: float) -> float:
+        pass
+
+    def draw(self, shape: IShape, label: Optional[str] = None, tags: List[str] = ()) -> bool:
+        pass
+
+
+class Canvas(pure_interface.Concrete, ICanvas):
+    def scale(self, factor):
+        return factor
+
+    def draw(self, shape, label=None, tags=()):
+        return True
+
+
+def main(number=200000, repeat=5):
+    canvas = Canvas()
+    namespace = {'canvas': canvas, 'scale': Canvas.scale.__wrapped__, 'draw': Canvas.draw.__wrapped__,
+                 'square': Square(), 'tags': ['a']}
+    calls = [('scale', 'scale(canvas, 2.0)', 'canvas.scale(2.0)'),
+             ('draw', "draw(canvas, square, 'label', tags)", "canvas.draw(square, 'label', tags)")]
+    print('{:<10}{:>16}{:>16}{:>16}'.format('method', 'unchecked (ns)', 'validated (ns)', 'disabled (ns)'))
+    for name, unchecked, checked in calls:
+        pure_interface.set_argument_validation(ICanvas, True)
+        unchecked_ns = best_ns(unchecked, namespace, number, repeat)
+        checked_ns = best_ns(checked, namespace, number, repeat)
+        pure_interface.set_argument_validation(ICanvas, False)
+        disabled_ns = best_ns(checked, namespace, number, repeat)
+        print('{:<10}{:>16.1f}{:>16.1f}{:>16.1f}'.format(name, unchecked_ns, checked_ns, disabled_ns))
+
+
+if __name__ == '__main__':
+    main()
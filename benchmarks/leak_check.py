@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Checks that creating and discarding classes at runtime does not grow the memory used by pure_interface.
+
+Each batch creates dynamic classes that exercise every per-interface cache: concrete and incomplete implementations,
+structural implementations, adapters, interface_only wrappers and, for every tenth class, a sub-interface used with
+adapt_all.  All references are then dropped and the memory still allocated is measured with tracemalloc after a
+garbage collection.  Classes are only freed by the garbage collector and ABCMeta scans the live subclasses of an
+interface when checking a new type, so garbage is also collected every 100 iterations to keep the run time linear.
+Run from the repository root with (Python 3):
+
+    python -m benchmarks.leak_check --classes 100000
+
+Bounded caches fill up during the first half of the run, so the script exits with status 1 if the memory has grown
+by more than --tolerance bytes per iteration over the second half.
+"""
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import gc
+import sys
+import tracemalloc
+import warnings
+
+import pure_interface
+from pure_interface import PureInterface, Concrete
+
+
+class ISpeaker(PureInterface):
+    volume = None
+
+    def speak(self, words):
+        pass
+
+
+def speak(self, words):
+    return words
+
+
+def init(self, *args):
+    self.volume = 1
+
+
+def create_classes(index):
+    """ Creates the dynamic classes for one iteration, uses them and returns nothing so they can be collected """
+    name = 'Dynamic{}'.format(index)
+    implementation = type(name + 'Impl', (Concrete, ISpeaker), {'__init__': init, 'speak': speak})
+    type(name + 'Incomplete', (Concrete, ISpeaker), {'__init__': init})
+    duck = type(name + 'Duck', (object,), {'__init__': init, 'speak': speak})
+    source = type(name + 'Source', (object,), {})
+    pure_interface.register_adapter(implementation, source, ISpeaker)
+    ISpeaker.provided_by(duck())
+    ISpeaker.adapt(source(), interface_only=True)
+    ISpeaker.adapt(duck(), allow_implicit=True, interface_only=True)
+    if index % 10 == 0:
+        interface = type('I' + name, (ISpeaker,), {})
+        pure_interface.adapt_all(implementation(), [ISpeaker, interface], allow_implicit=True, interface_only=True)
+
+
+def run(classes, batch):
+    """ Returns a list of (classes created, bytes allocated, live PureInterfaceType classes) after each batch """
+    warnings.simplefilter('ignore')
+    tracemalloc.start()
+    results = []
+    index = 0
+    while index < classes:
+        for _ in range(min(batch, classes - index)):
+            create_classes(index)
+            index += 1
+            if index % 100 == 0:
+                gc.collect()
+        gc.collect()
+        memory, _ = tracemalloc.get_traced_memory()
+        results.append((index, memory, pure_interface.memory_report()['classes']))
+        print('{:>10}{:>14.2f}{:>14}'.format(index, memory / 1e6, results[-1][2]))
+    tracemalloc.stop()
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pure_interface class churn leak check')
+    parser.add_argument('--classes', type=int, default=100000, help='number of iterations creating dynamic classes')
+    parser.add_argument('--batch', type=int, default=10000, help='iterations between memory measurements')
+    parser.add_argument('--tolerance', type=float, default=10.0, help='allowed growth in bytes per iteration')
+    options = parser.parse_args(argv)
+    print('{:>10}{:>14}{:>14}'.format('classes', 'memory (MB)', 'live classes'))
+    results = run(options.classes, options.batch)
+    first_count, first_memory, _ = results[(len(results) - 1) // 2]
+    last_count, last_memory, _ = results[-1]
+    growth = (last_memory - first_memory) / max(1, last_count - first_count)
+    print('growth over the second half: {:.2f} bytes per iteration'.format(growth))
+    return 1 if growth > options.tolerance else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
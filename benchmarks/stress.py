@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+"""
+Scalability stress harness for large interface hierarchies.
+
+Generates a synthetic module of N interfaces and measures how definition time, memory, adapter lookup and
+provided_by latency grow with N.  Each size runs in a fresh interpreter.
+
+Run from the repository root with (Python 3):
+
+    python -m benchmarks.stress --sizes 10,100,1000,10000,100000 --depth 8 --diamonds 4 --adapters 2
+
+The workload is laid out in rows of ``width`` interfaces.  Interface i inherits from interface i - width in the row
+above, so there are ``width`` chains, restarting every ``depth`` rows.  If ``diamonds`` is non-zero every
+diamonds'th interface also inherits from the next chain.  Every interface has ``methods`` methods and one
+attribute.  The interfaces in the last row of each block are leaves; each leaf has an implementation, ``adapters``
+classes adapted to it and ``structural`` classes that provide it without inheriting from it.
+"""
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+import warnings
+
+
+class Workload(object):
+    def __init__(self, n, width=10, depth=5, diamonds=0, methods=2, adapters=1, structural=1):
+        self.n = n
+        self.width = max(1, min(width, n))
+        self.depth = max(1, depth)
+        self.diamonds = diamonds
+        self.methods = methods
+        self.adapters = adapters
+        self.structural = structural
+        self.bases = []  # interface index -> list of base interface indices
+        self.names = []  # interface index -> frozenset of method and attribute names including inherited ones
+        self.leaves = []
+        for i in range(n):
+            row = i // self.width
+            level = row % self.depth
+            bases = []
+            if level > 0:
+                bases.append(i - self.width)
+                if diamonds and i % diamonds == 0:
+                    other = i - self.width + 1
+                    if other // self.width == row - 1:  # the next chain in the row above
+                        bases.append(other)
+            own = set('m{}_{}'.format(i, k) for k in range(methods))
+            own.add('a{}'.format(i))
+            for base in bases:
+                own.update(self.names[base])
+            self.bases.append(bases)
+            self.names.append(frozenset(own))
+            if level == self.depth - 1 or i + self.width >= n:
+                self.leaves.append(i)
+
+    def chain_root(self, i):
+        """ Returns the index of the interface at the top of the chain containing interface i """
+        row = i // self.width
+        return (row - row % self.depth) * self.width + i % self.width
+
+    def source(self):
+        lines = ['from pure_interface import PureInterface, Concrete, register_adapter',
+                 'def _method(self):',
+                 '    return None']
+        for i in range(self.n):
+            bases = ', '.join('I{}'.format(b) for b in self.bases[i]) or 'PureInterface'
+            lines.append('class I{}({}):'.format(i, bases))
+            lines.append('    a{} = None'.format(i))
+            for k in range(self.methods):
+                lines.append('    def m{}_{}(self):'.format(i, k))
+                lines.append('        pass')
+        for i in self.leaves:
+            names = sorted(self.names[i])
+            methods = [name for name in names if name.startswith('m')]
+            attributes = [name for name in names if name.startswith('a')]
+            lines.append('class Impl{0}(Concrete, I{0}):'.format(i))
+            lines.append('    def __init__(self, *args):')
+            lines.append('        {} = None'.format(' = '.join('self.' + name for name in attributes)))
+            if methods:
+                lines.append('    {} = _method'.format(' = '.join(methods)))
+            for j in range(self.adapters):
+                lines.append('class Source{}_{}(object):'.format(i, j))
+                lines.append('    pass')
+                lines.append('register_adapter(Impl{0}, Source{0}_{1}, I{0})'.format(i, j))
+            for j in range(self.structural):
+                lines.append('class Duck{}_{}(object):'.format(i, j))
+                lines.append('    {} = None'.format(' = '.join(attributes)))
+                if methods:
+                    lines.append('    {} = _method'.format(' = '.join(methods)))
+        return '\n'.join(lines)
+
+
+def mean_ns(func, items, number):
+    """ Returns the mean time in nanoseconds of calling func(item) for each item, number times """
+    start = time.perf_counter()
+    for _ in range(number):
+        for item in items:
+            func(item)
+    return (time.perf_counter() - start) / (number * len(items)) * 1e9
+
+
+def measure(workload, samples=200, number=20, seed=0):
+    """ Defines the workload in this interpreter and returns a dictionary of measurements """
+    warnings.simplefilter('ignore')
+    source = workload.source()
+    code = compile(source, 'stress_workload', 'exec')
+    namespace = {}
+    tracemalloc.start()
+    start = time.perf_counter()
+    exec(code, namespace)
+    define_time = time.perf_counter() - start
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    rng = random.Random(seed)
+    leaves = [rng.choice(workload.leaves) for _ in range(samples)]
+    interfaces = [namespace['I{}'.format(i)] for i in leaves]
+    roots = [namespace['I{}'.format(workload.chain_root(i))] for i in leaves]
+    impls = [namespace['Impl{}'.format(i)]() for i in leaves]
+    results = {
+        'n': workload.n,
+        'define_s': define_time,
+        'memory_bytes': memory,
+        'provided_by_nominal_hit_ns': mean_ns(lambda p: p[0].provided_by(p[1]), list(zip(interfaces, impls)), number),
+        'provided_by_ancestor_hit_ns': mean_ns(lambda p: p[0].provided_by(p[1]), list(zip(roots, impls)), number),
+        'provided_by_nominal_miss_ns': mean_ns(lambda i: i.provided_by(1, allow_implicit=False), interfaces, number),
+    }
+    if workload.structural:
+        ducks = [namespace['Duck{}_0'.format(i)]() for i in leaves]
+        pairs = list(zip(interfaces, ducks))
+        results['provided_by_structural_hit_ns'] = mean_ns(lambda p: p[0].provided_by(p[1]), pairs, number)
+    if workload.adapters:
+        sources = [namespace['Source{}_{}'.format(i, workload.adapters - 1)]() for i in leaves]
+        pairs = list(zip(interfaces, sources))
+        adapt = lambda p: p[0].adapt(p[1], interface_only=False)
+        results['adapt_first_ns'] = mean_ns(adapt, pairs, 1)  # includes building the adapter tables
+        results['adapt_ns'] = mean_ns(adapt, pairs, number)
+        parents = [interface.__bases__[0] for interface in interfaces]
+        pairs = [(parent, source) for parent, source in zip(parents, sources) if parent.__name__ != 'PureInterface']
+        if pairs:  # adapters registered on a sub-interface
+            results['adapt_via_sub_interface_ns'] = mean_ns(adapt, pairs, number)
+    return results
+
+
+def run_worker(size, options):
+    """ Measures one size in a fresh interpreter """
+    argv = [sys.executable, '-m', 'benchmarks.stress', '--worker', str(size)]
+    for name in ('width', 'depth', 'diamonds', 'methods', 'adapters', 'structural', 'samples'):
+        argv.extend(['--' + name, str(getattr(options, name))])
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    output = subprocess.check_output(argv, cwd=root)
+    return json.loads(output.decode('utf-8'))
+
+
+COLUMNS = [
+    ('n', 'N', '{:>8}'),
+    ('define_s', 'define (s)', '{:>12.3f}'),
+    ('define_us_per_interface', 'us/iface', '{:>10.1f}'),
+    ('memory_bytes', 'MB', '{:>9.1f}'),
+    ('provided_by_nominal_hit_ns', 'pb hit', '{:>9.0f}'),
+    ('provided_by_ancestor_hit_ns', 'pb anc', '{:>9.0f}'),
+    ('provided_by_nominal_miss_ns', 'pb miss', '{:>9.0f}'),
+    ('provided_by_structural_hit_ns', 'pb struct', '{:>10.0f}'),
+    ('adapt_first_ns', 'adapt 1st', '{:>10.0f}'),
+    ('adapt_ns', 'adapt', '{:>9.0f}'),
+    ('adapt_via_sub_interface_ns', 'adapt sub', '{:>10.0f}'),
+]
+
+
+def print_table(rows):
+    header = ''
+    for key, title, fmt in COLUMNS:
+        width = len(fmt.format(0))
+        header += title.rjust(width)
+    print(header)
+    for row in rows:
+        line = ''
+        for key, title, fmt in COLUMNS:
+            width = len(fmt.format(0))
+            if key == 'define_us_per_interface':
+                value = row['define_s'] / row['n'] * 1e6
+            elif key == 'memory_bytes':
+                value = row['memory_bytes'] / 1e6
+            else:
+                value = row.get(key)
+            line += fmt.format(value) if value is not None else '-'.rjust(width)
+        print(line)
+    print('latencies in ns, pb = provided_by')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pure_interface scalability stress harness')
+    parser.add_argument('--sizes', default='10,100,1000,10000', help='comma separated numbers of interfaces')
+    parser.add_argument('--width', type=int, default=10, help='number of inheritance chains')
+    parser.add_argument('--depth', type=int, default=5, help='length of the inheritance chains')
+    parser.add_argument('--diamonds', type=int, default=0, help='every n\'th interface also inherits the next chain')
+    parser.add_argument('--methods', type=int, default=2, help='methods per interface')
+    parser.add_argument('--adapters', type=int, default=1, help='adapters per leaf interface')
+    parser.add_argument('--structural', type=int, default=1, help='structural implementations per leaf interface')
+    parser.add_argument('--samples', type=int, default=200, help='leaf interfaces sampled for latency measurements')
+    parser.add_argument('-o', '--output', help='write the results to this JSON file')
+    parser.add_argument('--worker', type=int, help=argparse.SUPPRESS)
+    options = parser.parse_args(argv)
+
+    if options.worker is not None:
+        workload = Workload(options.worker, options.width, options.depth, options.diamonds, options.methods,
+                            options.adapters, options.structural)
+        print(json.dumps(measure(workload, options.samples)))
+        return 0
+
+    rows = []
+    for size in (int(s) for s in options.sizes.split(',')):
+        rows.append(run_worker(size, options))
+    print_table(rows)
+    if options.output:
+        with open(options.output, 'w') as f:
+            json.dump({'options': vars(options), 'results': rows}, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
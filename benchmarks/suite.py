@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark suite for the pure_interface hot paths with JSON baselines and a regression gate.
+
+Run from the repository root with (Python 3):
+
+    python -m benchmarks.suite run -o before.json
+    ... make changes ...
+    python -m benchmarks.suite run -o after.json
+    python -m benchmarks.suite compare before.json after.json --threshold 0.1
+
+compare exits with status 1 if any benchmark is slower than the baseline by more than the threshold.
+run --compare BASELINE does both steps in one go.  Timings are only comparable between runs on the same machine
+and Python version.
+"""
+from __future__ import absolute_import, division, print_function
+
+import abc
+import argparse
+import json
+import platform
+import re
+import sys
+import warnings
+
+import pure_interface
+from pure_interface import PureInterface, Concrete
+from benchmarks.bench_interface_only import best_ns
+
+
+class ISpeaker(PureInterface):
+    volume = None
+
+    def speak(self, words):
+        pass
+
+
+class Speaker(Concrete, ISpeaker):
+    def __init__(self):
+        self.volume = 5  # volume is an AttributeProperty
+
+    def speak(self, words):
+        return words
+
+
+class IStructuralSpeaker(PureInterface):
+    """ Checked structurally by isinstance, Duck sets volume in __init__ so it is not part of this interface """
+    pi_structural = True
+
+    def speak(self, words):
+        pass
+
+
+class Duck(object):
+    """ Provides ISpeaker structurally """
+    def __init__(self):
+        self.volume = 5
+
+    def speak(self, words):
+        return words
+
+
+class Talker(object):
+    def talk(self, words):
+        return words
+
+
+@pure_interface.adapts(Talker, ISpeaker)
+class TalkerToSpeaker(Concrete, ISpeaker):
+    def __init__(self, talker):
+        self._talker = talker
+        self.volume = 1
+
+    def speak(self, words):
+        return self._talker.talk(words)
+
+
+def define_interface():
+    class IAnimal(PureInterface):
+        height = None
+
+        @property
+        def weight(self):
+            pass
+
+        def speak(self, volume):
+            pass
+
+        def move(self, x, y=None):
+            pass
+    return IAnimal
+
+
+def define_implementation():
+    class Animal(Concrete, ISpeaker):
+        def __init__(self):
+            self.volume = 1
+
+        def speak(self, words):
+            return words
+    return Animal
+
+
+class ABCMover(abc.ABC):
+    """ A plain ABC interface, scanned for empty functions when used as a base """
+    @abc.abstractmethod
+    def move(self, x, y=None):
+        pass
+
+
+class SpeakerMixin(object):
+    """ A non-interface base whose methods are checked against the interface """
+    def speak(self, words):
+        return words
+
+
+def define_abc_sub_interface():
+    class IMover(PureInterface, ABCMover):
+        def stop(self):
+            pass
+    return IMover
+
+
+def define_mixin_implementation():
+    class Animal(SpeakerMixin, Concrete, ISpeaker):
+        def __init__(self):
+            self.volume = 1
+    return Animal
+
+
+@pure_interface.interface_dispatch
+def describe(obj):
+    return None
+
+
+@describe.register(ISpeaker, adapt=True)
+def describe_speaker(speaker):
+    return speaker
+
+
+def make_namespace():
+    speaker = Speaker()
+    return {
+        'ISpeaker': ISpeaker,
+        'Speaker': Speaker,
+        'speaker': speaker,
+        'duck': Duck(),
+        'IStructuralSpeaker': IStructuralSpeaker,
+        'talker': Talker(),
+        'other': object(),
+        'objects': [Speaker(), Talker(), object(), Speaker(), Talker()] * 2,
+        'wrapper': ISpeaker.interface_only(speaker),
+        'define_interface': define_interface,
+        'define_implementation': define_implementation,
+        'describe': describe,
+        'define_abc_sub_interface': define_abc_sub_interface,
+        'define_mixin_implementation': define_mixin_implementation,
+    }
+
+
+# (name, statement, number of executions per timing)
+BENCHMARKS = [
+    ('interface_class_creation', 'define_interface()', 2000),
+    ('concrete_class_creation', 'define_implementation()', 2000),
+    ('abc_sub_interface_creation', 'define_abc_sub_interface()', 2000),
+    ('mixin_class_creation', 'define_mixin_implementation()', 2000),
+    ('instantiation', 'Speaker()', 100000),
+    ('provided_by_nominal_hit', 'ISpeaker.provided_by(speaker)', 100000),
+    ('provided_by_nominal_miss', 'ISpeaker.provided_by(other, allow_implicit=False)', 100000),
+    ('provided_by_structural_hit', 'ISpeaker.provided_by(duck)', 100000),
+    ('provided_by_structural_miss', 'ISpeaker.provided_by(other)', 100000),
+    ('isinstance_structural_hit', 'isinstance(duck, IStructuralSpeaker)', 1000000),
+    ('isinstance_structural_miss', 'isinstance(other, IStructuralSpeaker)', 1000000),
+    ('adapt_provided', 'ISpeaker.adapt(speaker, interface_only=False)', 100000),
+    ('adapt_adapter', 'ISpeaker.adapt(talker, interface_only=False)', 100000),
+    ('adapt_interface_only', 'ISpeaker.adapt(speaker, interface_only=True)', 100000),
+    ('adapt_or_none_miss', 'ISpeaker.adapt_or_none(other)', 100000),
+    ('can_adapt_adapter', 'ISpeaker.can_adapt(talker)', 100000),
+    ('interface_dispatch', 'describe(speaker)', 1000000),
+    ('interface_dispatch_adapt', 'describe(talker)', 100000),
+    ('interface_dispatch_default', 'describe(other)', 1000000),
+    ('filter_adapt_10', 'list(ISpeaker.filter_adapt(objects, interface_only=False))', 20000),
+    ('interface_only_attribute', 'wrapper.volume', 1000000),
+    ('interface_only_method', 'wrapper.speak(1)', 1000000),
+    ('attribute_property_read', 'speaker.volume', 1000000),
+    ('attribute_property_write', 'speaker.volume = 3', 1000000),
+]
+
+
+def run(pattern=None, repeat=5, scale=1.0):
+    """ Runs the benchmarks with names matching the regular expression pattern and returns the results dictionary """
+    warnings.simplefilter('ignore')  # structural type check warnings
+    namespace = make_namespace()
+    results = {}
+    for name, stmt, number in BENCHMARKS:
+        if pattern and not re.search(pattern, name):
+            continue
+        results[name] = best_ns(stmt, namespace, max(1, int(number * scale)), repeat)
+        print('{:<32}{:>12.1f} ns'.format(name, results[name]))
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'pure_interface': pure_interface.__version__,
+            'is_development': pure_interface.is_development,
+            'is_stripped': pure_interface.is_stripped,
+        },
+        'results': results,
+    }
+
+
+def compare(baseline, current, threshold):
+    """ Compares two results dictionaries.
+    Returns a list of (name, baseline_ns, current_ns, ratio, regressed) for benchmarks in both, ordered by name.
+    A benchmark has regressed if it is slower than the baseline by more than threshold (a fraction).
+    """
+    comparison = []
+    baseline_results = baseline['results']
+    current_results = current['results']
+    for name in sorted(set(baseline_results).intersection(current_results)):
+        before = baseline_results[name]
+        after = current_results[name]
+        ratio = after / before if before else float('inf')
+        comparison.append((name, before, after, ratio, ratio > 1.0 + threshold))
+    return comparison
+
+
+def report(baseline, current, threshold):
+    """ Prints a comparison of current against baseline and returns the number of regressions """
+    if baseline.get('meta', {}).get('python') != current.get('meta', {}).get('python'):
+        print('Warning: comparing results from different Python versions')
+    print('{:<32}{:>14}{:>14}{:>9}'.format('benchmark', 'baseline (ns)', 'current (ns)', 'ratio'))
+    regressions = 0
+    for name, before, after, ratio, regressed in compare(baseline, current, threshold):
+        regressions += regressed
+        print('{:<32}{:>14.1f}{:>14.1f}{:>9.2f}{}'.format(name, before, after, ratio, '  REGRESSION' if regressed else ''))
+    for name in sorted(set(baseline['results']).symmetric_difference(current['results'])):
+        print('{:<32}  only in {}'.format(name, 'baseline' if name in baseline['results'] else 'current'))
+    print('{} regression(s) beyond {:.0%}'.format(regressions, threshold))
+    return regressions
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='pure_interface micro-benchmarks')
+    commands = parser.add_subparsers(dest='command')
+    run_parser = commands.add_parser('run', help='run the benchmarks')
+    run_parser.add_argument('-o', '--output', help='write the results to this JSON file')
+    run_parser.add_argument('-k', '--filter', help='only run benchmarks with names matching this regular expression')
+    run_parser.add_argument('--repeat', type=int, default=5, help='number of timings per benchmark, the best is kept')
+    run_parser.add_argument('--scale', type=float, default=1.0, help='scale the number of executions per timing')
+    run_parser.add_argument('--compare', metavar='BASELINE', help='compare the results with a baseline JSON file')
+    run_parser.add_argument('--threshold', type=float, default=0.1, help='allowed slow down as a fraction')
+    compare_parser = commands.add_parser('compare', help='compare two JSON result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.1, help='allowed slow down as a fraction')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = run(args.filter, args.repeat, args.scale)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2, sort_keys=True)
+        if args.compare:
+            print()
+            return 1 if report(load(args.compare), results, args.threshold) else 0
+    elif args.command == 'compare':
+        return 1 if report(load(args.baseline), load(args.current), args.threshold) else 0
+    else:
+        parser.print_help()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
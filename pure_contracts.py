@@ -1,12 +1,223 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 
+import abc
+import functools
+import inspect
+import timeit
+import types
 import warnings
+import weakref
 
 import pure_interface
 from pure_interface import InterfaceError, Concrete  # alias for convenience
 import six
 
+
+class CheckAll(object):
+    """ Sampling policy that checks the contracts on every call. """
+    def __call__(self, stats):
+        return True
+
+    def __repr__(self):
+        return 'CheckAll()'
+
+
+class EveryNth(object):
+    """ Sampling policy that checks one call in every n calls to each method, starting with the first. """
+    def __init__(self, n):
+        if n < 1:
+            raise ValueError('n must be at least 1')
+        self.n = n
+
+    def __call__(self, stats):
+        return (stats.calls - 1) % self.n == 0
+
+    def __repr__(self):
+        return 'EveryNth({})'.format(self.n)
+
+
+class FirstN(object):
+    """ Sampling policy that checks the first n calls made to each implementation class. """
+    def __init__(self, n):
+        if n < 0:
+            raise ValueError('n must not be negative')
+        self.n = n
+
+    def __call__(self, stats):
+        return stats.owner.checked < self.n
+
+    def __repr__(self):
+        return 'FirstN({})'.format(self.n)
+
+
+_default_sampling = CheckAll()
+_interface_sampling = weakref.WeakKeyDictionary()
+_method_stats = weakref.WeakSet()
+
+
+class _ClassContractStats(object):
+    __slots__ = ('checked',)
+
+    def __init__(self):
+        self.checked = 0
+
+
+class _MethodContractStats(object):
+    """ Counters and sampling policy for one contract checked method of an implementation class.
+    interface is the class the contracts were inherited from.
+    """
+    __slots__ = ('name', 'interface', 'owner', 'policy', 'calls', 'checked', 'violations', 'check_time', '__weakref__')
+
+    def __init__(self, name, interface, owner):
+        self.name = name
+        self.interface = interface
+        self.owner = owner
+        self.policy = _sampling_for(interface)
+        self.calls = 0
+        self.checked = 0
+        self.violations = 0
+        self.check_time = 0.0
+
+
+class _ContractSpec(object):
+    """ Parsed contracts of an interface method.
+    Built once per interface method and shared by all implementations of it.
+    """
+    __slots__ = ('accepts', 'returns')
+
+    def __init__(self, contracts_dict):
+        self.returns = contracts_dict.get('returns')
+        self.accepts = dict((name, contract) for name, contract in contracts_dict.items()
+                            if name != 'returns' and contract is not None)
+
+
+def _sampling_for(interface):
+    for cls in interface.__mro__:
+        try:
+            return _interface_sampling[cls]
+        except KeyError:
+            pass
+    return _default_sampling
+
+
+def _contract_spec(func):
+    """ Returns the cached _ContractSpec for a function carrying PyContracts' __contracts__ or None """
+    if not isinstance(func, types.FunctionType):
+        return None
+    spec = func.__dict__.get('_pi_contract_spec')
+    if spec is None and '__contracts__' in func.__dict__:
+        spec = _ContractSpec(func.__contracts__)
+        func._pi_contract_spec = spec
+    return spec
+
+
+def _display_name(func, args, has_self):
+    name = '%s()' % func.__name__
+    if has_self:
+        name = type(args[0]).__name__ + ':' + name
+    return name
+
+
+def _sampled_method(func, spec, stats, clsname):
+    """ Returns a function that calls func, checking its contracts when the sampling policy asks for it. """
+    arg_names = pure_interface.getargspec(func).args
+    for name in spec.accepts:
+        if name not in arg_names:
+            raise contracts.ContractException('Error while applying contracts.\n'
+                                              '  subclass:  {}\n'
+                                              '  function:  {}()\n'
+                                              'Contract for unknown argument "{}"'.format(clsname, func.__name__, name))
+    accepts = [(name, spec.accepts[name]) for name in arg_names if name in spec.accepts]
+    returns = spec.returns
+    has_self = 'self' in arg_names
+    getcallargs = inspect.getcallargs
+    timer = timeit.default_timer
+    ContractNotRespected = contracts.ContractNotRespected
+
+    def checked_call(args, kwargs):
+        stats.checked += 1
+        stats.owner.checked += 1
+        start = timer()
+        bound = getcallargs(func, *args, **kwargs)
+        context = {'self': bound['self']} if has_self else {}
+        for name, contract in accepts:
+            try:
+                contract._check_contract(context, bound[name], silent=False)
+            except ContractNotRespected as e:
+                stats.violations += 1
+                stats.check_time += timer() - start
+                e.error = 'Breach for argument %r to %s.\n' % (name, _display_name(func, args, has_self)) + e.error
+                raise e
+        stats.check_time += timer() - start
+        result = func(*args, **kwargs)
+        if returns is not None:
+            start = timer()
+            try:
+                returns._check_contract(context, result, silent=False)
+            except ContractNotRespected as e:
+                stats.violations += 1
+                e.error = 'Breach for return value of %s.\n' % _display_name(func, args, has_self) + e.error
+                raise e
+            finally:
+                stats.check_time += timer() - start
+        return result
+
+    @functools.wraps(func)
+    def method(*args, **kwargs):
+        stats.calls += 1
+        if stats.policy(stats) and not contracts.all_disabled():
+            return checked_call(args, kwargs)
+        return func(*args, **kwargs)
+
+    method.__wrapped__ = func
+    method._pi_contract_spec = spec
+    method.__contracts__ = dict(returns=returns, **spec.accepts)
+    return method
+
+
+def set_contract_sampling(policy, interface=None):
+    """ Sets the sampling policy used to check contracts.
+    If interface is None the policy becomes the default, otherwise it applies to implementations of interface
+    (and its sub-interfaces).  Passing a policy of None removes an interface's policy.
+    Existing implementation classes are updated.
+    """
+    global _default_sampling
+    if interface is None:
+        if policy is None:
+            raise ValueError('The default sampling policy cannot be None')
+        _default_sampling = policy
+    elif policy is None:
+        _interface_sampling.pop(interface, None)
+    else:
+        _interface_sampling[interface] = policy
+    for stats in list(_method_stats):
+        stats.policy = _sampling_for(stats.interface)
+
+
+def contract_stats():
+    """ Returns a dictionary of counters for each contract checked method keyed by 'module.Class.method'.
+    Counters of classes with the same name are added together.
+    """
+    result = {}
+    for stats in list(_method_stats):
+        counters = result.setdefault(stats.name, {'calls': 0, 'checked': 0, 'violations': 0, 'check_time': 0.0})
+        counters['calls'] += stats.calls
+        counters['checked'] += stats.checked
+        counters['violations'] += stats.violations
+        counters['check_time'] += stats.check_time
+    return result
+
+
+def reset_contract_stats():
+    """ Sets all the counters returned by contract_stats() to zero """
+    for stats in list(_method_stats):
+        stats.calls = 0
+        stats.checked = 0
+        stats.violations = 0
+        stats.check_time = 0.0
+
+
 try:
     import contracts  # https://pypi.python.org/pypi/PyContracts
 
@@ -14,7 +225,27 @@ try:
         # we need to unwrap the decorators because otherwise we fail the empty function body test
         # inspecting the wrapper.
         _pi_unwrap_decorators = True
-        pass
+
+        def __init__(cls, clsname, bases, attributes):
+            # replaces ContractsMeta.__init__ which re-parses the contracts for every implementation
+            # and checks every call.
+            abc.ABCMeta.__init__(cls, clsname, bases, attributes)
+            if cls._pi.type_is_pure_interface:
+                return
+            owner = _ClassContractStats()
+            mro = cls.__mro__[1:]
+            for name, func in attributes.items():
+                if name == '__init__' or not isinstance(func, types.FunctionType):
+                    continue
+                for base in mro:
+                    if name in base.__dict__:
+                        spec = _contract_spec(base.__dict__[name])
+                        if spec is not None:
+                            full_name = '{}.{}.{}'.format(cls.__module__, clsname, name)
+                            stats = _MethodContractStats(full_name, base, owner)
+                            _method_stats.add(stats)
+                            setattr(cls, name, _sampled_method(func, spec, stats, clsname))
+                            break
 
 except ImportError:
     warnings.warn('PyContracts not found')
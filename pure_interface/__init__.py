@@ -0,0 +1,2045 @@
+# -*- coding: utf-8 -*-
+"""
+pure_interface enforces empty functions and properties on interfaces and provides adaption and structural type checking.
+"""
+from __future__ import division, print_function, absolute_import
+
+import abc
+import collections
+import itertools
+import operator
+import os
+import types
+import sys
+import time
+import warnings
+import weakref
+
+import six
+from six.moves import _thread
+
+from typing import Any, Callable, List, Optional, Iterable, FrozenSet, Type, TypeVar, Tuple
+
+__all__ = [
+    'PureInterface', 'PureInterfaceType', 'Concrete', 'InterfaceError', 'AttributeProperty', 'PI',
+    'abstractmethod', 'abstractproperty', 'abstractclassmethod', 'abstractstaticmethod',
+    'adapts', 'register_adapter', 'adapt_all', 'no_adaption', 'implement', 'implement_all', 'interface_dispatch',
+    'protocol_interface', 'set_argument_validation', 'unwrap',
+    'type_is_pure_interface', 'get_type_interfaces', 'implementations_of', 'get_interface_method_names',
+    'get_interface_property_names', 'get_interface_attribute_names', 'get_interface_properties_and_attribute_names',
+    'is_interface_ancestor', 'get_interface_ancestors', 'get_interface_descendants', 'least_common_interfaces',
+    'export_interface_hierarchy', 'memory_report', 'MEMORY_CATEGORIES',
+    'ADAPTER_VERIFY_ALWAYS', 'ADAPTER_VERIFY_ONCE', 'ADAPTER_VERIFY_NEVER', 'DevelopmentPolicy', 'development_policy',
+    'missing_method_warnings', 'enable_stats', 'stats', 'reset_stats',
+    'subscribe', 'unsubscribe', 'flush_events', 'EVENT_TYPES', 'InterfaceDefined', 'ImplementationDefined',
+    'IncompleteImplementation', 'StructuralMatch', 'AdapterInvoked', 'AdaptionFailed',
+]
+
+# Development checks, argument validation and diagnostics live in sub-modules that are imported on first use
+# so that importing pure_interface in production only loads what adaption and type checks need.
+
+if six.PY3:
+    from abc import abstractmethod, abstractproperty, abstractclassmethod, abstractstaticmethod
+else:
+    from abc import abstractmethod, abstractproperty
+
+
+    class abstractclassmethod(classmethod):
+        __isabstractmethod__ = True
+
+        def __init__(self, callable):
+            callable.__isabstractmethod__ = True
+            super(abstractclassmethod, self).__init__(callable)
+
+
+    class abstractstaticmethod(staticmethod):
+        __isabstractmethod__ = True
+
+        def __init__(self, callable):
+            callable.__isabstractmethod__ = True
+            super(abstractstaticmethod, self).__init__(callable)
+
+
+__version__ = '3.1.1'
+
+
+# strip mode does only what is needed for correct runtime behaviour, it must be selected before import
+is_stripped = os.environ.get('PURE_INTERFACE_STRIP', '').lower() in ('1', 'true', 'yes', 'on')
+is_development = not hasattr(sys, 'frozen') and not is_stripped
+# the most recent incomplete implementation warnings, bounded so that generating classes at runtime does not leak
+missing_method_warnings = collections.deque(maxlen=1000)
+
+# policies for checking that objects returned by adapters provide the interface
+ADAPTER_VERIFY_ALWAYS = 'always'  # check every adapted object
+ADAPTER_VERIFY_ONCE = 'once'  # check the first object of each type returned by an adapter, then trust it
+ADAPTER_VERIFY_NEVER = 'never'  # trust adapters completely
+adapter_verification = ADAPTER_VERIFY_ALWAYS
+
+if six.PY2:
+    @six.add_metaclass(abc.ABCMeta)
+    class ABC(object):
+        pass
+else:
+    ABC = abc.ABC
+
+ArgSpec = collections.namedtuple('ArgSpec', 'args varargs keywords defaults')
+
+
+def getargspec(func):
+    # type: (Callable) -> ArgSpec
+    """ Returns the ArgSpec of func """
+    from pure_interface import _checks
+    return _checks.getargspec(func)
+
+
+class InterfaceError(Exception):
+    pass
+
+
+class DevelopmentPolicy(object):
+    """ Resolves the development settings for a module from rules keyed on module name prefixes.
+    A rule for "pkg" applies to "pkg" and "pkg.sub" (but not "pkgx") and the longest matching prefix wins.
+    The empty prefix applies to all modules.  Settings not given by any rule follow is_development.
+    Resolved settings are cached per module.
+    """
+    settings = ('check_signatures', 'warn_incomplete', 'warn_structural', 'interface_only')
+
+    _true_values = ('1', 'true', 'yes', 'on')
+    _false_values = ('0', 'false', 'no', 'off')
+
+    def __init__(self):
+        self._rules = {}  # prefix -> {setting: bool}
+        self._cache = {}  # module name -> _DevelopmentSettings
+
+    def set(self, prefix, development=None, **settings):
+        # type: (str, Optional[bool], **Optional[bool]) -> None
+        """ Sets the rule for modules starting with prefix.
+        development sets all settings, individual settings may be given as keyword arguments.
+        A setting of None removes it from the rule.
+        """
+        unknown = set(settings).difference(self.settings)
+        if unknown:
+            raise ValueError('Unknown development settings: {}'.format(', '.join(sorted(unknown))))
+        rule = self._rules.setdefault(prefix, {})
+        if development is not None:
+            for name in self.settings:
+                rule[name] = bool(development)
+        for name, value in settings.items():
+            if value is None:
+                rule.pop(name, None)
+            else:
+                rule[name] = bool(value)
+        self._cache.clear()
+
+    def clear(self):
+        """ Removes all rules so that all settings follow is_development """
+        self._rules.clear()
+        self._cache.clear()
+
+    def resolve(self, module):
+        # type: (str) -> _DevelopmentSettings
+        """ Returns the settings for module.  Settings that are None follow is_development. """
+        try:
+            return self._cache[module]
+        except KeyError:
+            pass
+        resolved = dict.fromkeys(self.settings)
+        for prefix in sorted(self._rules, key=len):
+            if not prefix or module == prefix or module.startswith(prefix + '.'):
+                resolved.update(self._rules[prefix])
+        settings = self._cache[module] = _DevelopmentSettings(**resolved)
+        return settings
+
+    def load(self, text):
+        # type: (str) -> None
+        """ Adds rules from text containing comma or newline separated entries of the form
+            <prefix>=<value>  or  <prefix>:<setting>=<value>
+        where value is one of 1/0, true/false, yes/no or on/off.  Lines starting with # are ignored.
+        """
+        for entry in text.replace('\n', ',').split(','):
+            entry = entry.strip()
+            if not entry or entry.startswith('#'):
+                continue
+            try:
+                key, value = entry.split('=')
+            except ValueError:
+                raise ValueError('Invalid development policy entry "{}"'.format(entry))
+            value = value.strip().lower()
+            if value in self._true_values:
+                value = True
+            elif value in self._false_values:
+                value = False
+            else:
+                raise ValueError('Invalid development policy value in "{}"'.format(entry))
+            prefix, _, setting = key.strip().partition(':')
+            if setting:
+                self.set(prefix, **{setting: value})
+            else:
+                self.set(prefix, value)
+
+    def load_file(self, path):
+        # type: (str) -> None
+        """ Adds rules from a file in the format accepted by load() """
+        with open(path) as f:
+            self.load(f.read())
+
+    def load_environment(self, environ=None):
+        """ Adds rules from the PURE_INTERFACE_DEVELOPMENT_FILE and PURE_INTERFACE_DEVELOPMENT environment variables.
+        PURE_INTERFACE_DEVELOPMENT_FILE is the path to a rules file, PURE_INTERFACE_DEVELOPMENT contains rules.
+        """
+        if environ is None:
+            environ = os.environ
+        path = environ.get('PURE_INTERFACE_DEVELOPMENT_FILE')
+        if path:
+            self.load_file(path)
+        text = environ.get('PURE_INTERFACE_DEVELOPMENT')
+        if text:
+            self.load(text)
+
+
+_DevelopmentSettings = collections.namedtuple('_DevelopmentSettings', DevelopmentPolicy.settings)
+
+development_policy = DevelopmentPolicy()
+development_policy.load_environment()
+
+
+def _development_setting(module, setting):
+    value = getattr(development_policy.resolve(module or ''), setting)
+    return is_development if value is None else value
+
+
+class _Statistics(object):
+    """ Usage counters collected while statistics are enabled, see enable_stats() """
+    __slots__ = ('structural_checks', 'structural_matches', 'instance_structural_checks', 'adapt_calls',
+                 'adapter_tables_built', 'adaption_failures', 'adapter_calls', 'verifications',
+                 'verifications_skipped', 'wrappers_created')
+
+    def __init__(self):
+        self.structural_checks = 0  # uncached class structural type checks
+        self.structural_matches = 0  # classes found to provide an interface structurally
+        self.instance_structural_checks = 0
+        self.adapt_calls = 0
+        self.adapter_tables_built = 0
+        self.adaption_failures = 0
+        self.adapter_calls = collections.defaultdict(int)  # (interface, _AdapterRegistration) -> number of calls
+        self.verifications = 0  # adapted objects checked for providing the interface
+        self.verifications_skipped = 0  # checks skipped by the adapter_verification policy
+        self.wrappers_created = 0
+
+    def snapshot(self):
+        adapters = []
+        for (interface, registration), calls in sorted(self.adapter_calls.items(), key=lambda item: -item[1]):
+            try:
+                adapter = getattr(registration.adapter, '__name__', repr(registration.adapter))
+            except ReferenceError:
+                adapter = '<dead adapter>'
+            adapters.append({'interface': interface.__name__, 'adapter': adapter, 'calls': calls})
+        instances = {}
+        if _stats is self:
+            for cls in list(_pure_interface_types):
+                if cls._pi.instances_created:
+                    instances['{}.{}'.format(cls.__module__, cls.__name__)] = cls._pi.instances_created
+        return {
+            'enabled': _stats is self,
+            'adapter_verification': adapter_verification,
+            'structural_checks': self.structural_checks,
+            'structural_matches': self.structural_matches,
+            'instance_structural_checks': self.instance_structural_checks,
+            'adapt_calls': self.adapt_calls,
+            'adapter_lookups': sum(self.adapter_calls.values()) + self.adaption_failures,
+            'adapter_tables_built': self.adapter_tables_built,
+            'adaption_failures': self.adaption_failures,
+            'hot_adapters': adapters,
+            'verifications': self.verifications,
+            'verifications_skipped': self.verifications_skipped,
+            'wrappers_created': self.wrappers_created,
+            'instances': instances,
+        }
+
+
+# counters are only collected while _stats is not None so there is nothing to pay when they are disabled
+_stats = _Statistics() if os.environ.get('PURE_INTERFACE_STATS', '').lower() in ('1', 'true', 'yes', 'on') else None
+
+
+def _clear_instance_counts():
+    """ Zeroes the number of instances created of every class, these are kept on the class to keep counting cheap """
+    for cls in list(_pure_interface_types):
+        cls._pi.instances_created = 0
+
+
+# event records passed to listeners registered with subscribe()
+InterfaceDefined = collections.namedtuple('InterfaceDefined', 'interface')
+ImplementationDefined = collections.namedtuple('ImplementationDefined', 'cls interfaces')
+IncompleteImplementation = collections.namedtuple('IncompleteImplementation', 'cls missing')
+StructuralMatch = collections.namedtuple('StructuralMatch', 'interface cls')
+AdapterInvoked = collections.namedtuple('AdapterInvoked', 'interface obj_type adapter duration')
+AdaptionFailed = collections.namedtuple('AdaptionFailed', 'interface obj reason')
+EVENT_TYPES = (InterfaceDefined, ImplementationDefined, IncompleteImplementation, StructuralMatch, AdapterInvoked,
+               AdaptionFailed)
+
+_timer = getattr(time, 'perf_counter', time.time)
+_subscriptions = {}  # event type -> list of (listener, deliver function)
+# event type -> tuple of deliver functions.  Only event types with listeners are present so
+# nothing is paid for events nobody listens to.
+_listeners = {}
+_event_queue = None  # queue of (listener, event) for asynchronous listeners
+_event_thread = None
+_event_thread_lock = _thread.allocate_lock()  # so that only one event thread is started
+
+
+def _emit(listeners, event):
+    # a broken listener must not break the class definition or adaption that raised the event
+    for deliver in listeners:
+        try:
+            deliver(event)
+        except Exception as exc:
+            message = '{} listener {!r} raised {}: {}'.format(type(event).__name__, deliver, type(exc).__name__, exc)
+            warnings.warn(message, RuntimeWarning)
+
+
+def _deliver_queued_events():
+    import traceback
+    while True:
+        listener, event = _event_queue.get()
+        try:
+            listener(event)
+        except Exception:
+            traceback.print_exc()
+        finally:
+            _event_queue.task_done()
+
+
+def _queued_listener(listener):
+    """ Returns a function that queues events for delivery to listener on the event thread """
+    global _event_queue, _event_thread
+    with _event_thread_lock:
+        if _event_thread is None:
+            import threading
+            from six.moves import queue
+            _event_queue = queue.Queue()
+            _event_thread = threading.Thread(target=_deliver_queued_events, name='pure_interface events')
+            _event_thread.daemon = True
+            _event_thread.start()
+    put = _event_queue.put
+
+    def deliver(event):
+        put((listener, event))
+    return deliver
+
+
+def no_adaption(obj):
+    return obj
+
+
+class _PIAttributes(object):
+    """ rather than clutter the class namespace with lots of _pi_XXX attributes, collect them all here"""
+    def __init__(self, type_is_interface, interface_method_functions, interface_property_names,
+                 interface_attribute_names):
+        self.type_is_pure_interface = type_is_interface
+        self.abstractproperties = frozenset()  # properties that must be provided by instances
+        self.interface_method_names = frozenset(interface_method_functions.keys())  # type: FrozenSet[str]
+        self.interface_property_names = frozenset(interface_property_names)  # type: FrozenSet[str]
+        self.interface_attribute_names = frozenset(interface_attribute_names)  # type: FrozenSet[str]
+        self.interface_method_functions = interface_method_functions  # name -> function declaring the method
+        self._interface_method_signatures = None
+        self.impl_wrapper_type = None
+        self.dto_types = None  # frozen -> type generated by make_dto
+        self.type_interfaces = ()  # interfaces in the class MRO, see get_type_interfaces
+        self.hierarchy_id = None  # integer id of an interface in the interface hierarchy index
+        if type_is_interface:
+            # adaption and registry state is only needed by interfaces and weak containers are slow to create
+            self.adapters = weakref.WeakKeyDictionary()  # from_type -> list of _AdapterRegistration
+            self.adapter_table = weakref.WeakKeyDictionary()  # obj_type -> tuple of candidate _AdapterRegistration
+            self.verified_results = weakref.WeakKeyDictionary()  # result type -> {(registration, allow_implicit)}
+            self.wrappers = weakref.WeakValueDictionary()  # id(implementation) -> live interface_only wrapper
+            self.implementations = weakref.WeakSet()  # classes inheriting or registered with this interface
+            self.argument_checks = {}  # method name -> (checks, namespace) built from annotations
+            self.structural_subclasses = weakref.WeakSet()  # classes found to provide this interface structurally
+            self.implementation_properties = None  # abstract property name -> names of its functions, see implement
+            self.verified_signatures = None  # (name, code, number of defaults) of functions checked by implement
+        else:
+            self.adapters = self.adapter_table = self.verified_results = self.wrappers = None
+            self.implementations = self.argument_checks = self.structural_subclasses = None
+            self.implementation_properties = self.verified_signatures = None
+        self.validate_arguments = None  # None if argument validation is not declared, otherwise if it is enabled
+        self.structural = False  # isinstance and issubclass also check structurally, see pi_structural
+        self.instances_created = 0  # counted while statistics are enabled, see stats()
+
+    @property
+    def interface_method_signatures(self):
+        """ name -> ArgSpec of the interface methods, computed on first use as only development checks need them """
+        if self._interface_method_signatures is None:
+            self._interface_method_signatures = _get_signatures(self.interface_method_functions)
+        return self._interface_method_signatures
+
+    @property
+    def interface_names(self):
+        return self.interface_method_names.union(self.interface_attribute_names).union(self.interface_property_names)
+
+    @property
+    def props_and_attrs(self):
+        return self.interface_attribute_names.union(self.interface_property_names)
+
+
+class _AdapterRegistration(object):
+    """ An adapter registered for a (from_type, interface) pair together with its selection criteria """
+    __slots__ = ('adapter', 'priority', 'predicate', 'sequence')
+
+    _sequence = itertools.count()
+
+    def __init__(self, adapter, priority, predicate):
+        self.adapter = adapter
+        self.priority = priority
+        self.predicate = predicate
+        self.sequence = next(self._sequence)  # registration order breaks ties
+
+
+class AttributeProperty(object):
+    """ Property that stores it's value in the instance dict under the same name.
+        Abstract properties for concrete classes are replaced with these in the type definition to allow
+        implementations to use attributes.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        super(AttributeProperty, self).__init__()
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
+class _ImplementationWrapper(object):
+    """ Base class of the types returned by PureInterface.interface_only.
+    Sub-types are generated for each interface with a forwarding descriptor per interface attribute.
+    """
+    __slots__ = ('__impl', '__interface', '__weakref__')
+
+    def __init__(self, implementation, interface):
+        self.__impl = implementation
+        self.__interface = interface
+
+    def __getattr__(self, attr):
+        # only called for names without a forwarding descriptor or when the implementation raised AttributeError
+        if attr in self.__interface._pi.interface_names:
+            return getattr(self.__impl, attr)
+        raise AttributeError("'{}' interface has no attribute '{}'".format(self.__interface.__name__, attr))
+
+
+class _CompositeWrapper(object):
+    """ Base class of the types returned by adapt_all that provide several interfaces.
+    Sub-types are generated for each tuple of interfaces with a slot per interface holding the object
+    that provides it, and forwarding descriptors for the names of each interface.
+    """
+    __slots__ = ('_pi_impls', '__weakref__')
+    _pi_interfaces = ()
+
+    def __init__(self, implementations):
+        self._pi_impls = implementations
+        for i, implementation in enumerate(implementations):
+            setattr(self, '_pi_impl{}'.format(i), implementation)
+
+    def __getattr__(self, attr):
+        # only called for names without a forwarding descriptor or when an implementation raised AttributeError
+        for interface, implementation in zip(self._pi_interfaces, self._pi_impls):
+            if attr in interface._pi.interface_names:
+                return getattr(implementation, attr)
+        names = ', '.join(interface.__name__ for interface in self._pi_interfaces)
+        raise AttributeError("'{}' interfaces have no attribute '{}'".format(names, attr))
+
+
+# tuple of interfaces -> _CompositeWrapper sub-type, least recently used first.  The least recently used types are
+# evicted beyond the maximum size so that adapting to interfaces generated at runtime does not keep them alive forever.
+_composite_wrapper_types = collections.OrderedDict()
+_MAX_COMPOSITE_WRAPPER_TYPES = 256
+
+
+def _get_composite_wrapper_type(interfaces):
+    try:
+        wrapper_type = _composite_wrapper_types[interfaces]
+    except KeyError:
+        pass
+    else:
+        if six.PY3:
+            _composite_wrapper_types.move_to_end(interfaces)
+        else:
+            _composite_wrapper_types[interfaces] = _composite_wrapper_types.pop(interfaces)
+        return wrapper_type
+    attributes = {}
+    # reversed so that earlier interfaces take precedence for names defined by several interfaces
+    for i in range(len(interfaces) - 1, -1, -1):
+        attributes.update(_forwarding_namespace(interfaces[i], '_pi_impl{}'.format(i)))
+    attributes['__module__'] = interfaces[0].__module__
+    attributes['__slots__'] = tuple('_pi_impl{}'.format(i) for i in range(len(interfaces)))
+    attributes['_pi_interfaces'] = interfaces
+    type_name = 'And'.join(interface.__name__ for interface in interfaces) + 'Only'
+    wrapper_type = type(type_name, (_CompositeWrapper,), attributes)
+    for interface in interfaces:
+        interface.register(wrapper_type)
+    _composite_wrapper_types[interfaces] = wrapper_type
+    if len(_composite_wrapper_types) > _MAX_COMPOSITE_WRAPPER_TYPES:
+        _composite_wrapper_types.popitem(last=False)
+    return wrapper_type
+
+
+def _forwarding_method(impl_attr, name):
+    def method(self, *args, **kwargs):
+        return getattr(getattr(self, impl_attr), name)(*args, **kwargs)
+    method.__name__ = str(name)
+    return method
+
+
+def _forwarding_property(impl_attr, name, writable):
+    """ Returns a property that reads (and optionally writes) name on the object stored in impl_attr.
+    Reads use a dotted attrgetter so they are done entirely in C.
+    """
+    getter = operator.attrgetter('{}.{}'.format(impl_attr, name))
+    if not writable:
+        return property(getter)
+
+    def setter(self, value):
+        setattr(getattr(self, impl_attr), name, value)
+
+    def deleter(self):
+        delattr(getattr(self, impl_attr), name)
+
+    return property(getter, setter, deleter)
+
+
+# names the wrapper types define or rely on themselves, these are never forwarded
+_WRAPPER_ATTRS = frozenset(('__init__', '__new__', '__getattr__', '__getattribute__', '__setattr__', '__delattr__',
+                            '__slots__'))
+
+
+def _forwarding_namespace(interface, impl_attr):
+    """ Returns a class namespace that forwards the attributes of interface to the object stored in impl_attr """
+    namespace = {}
+    pi = interface._pi
+    for name in pi.interface_method_names:
+        if name in _WRAPPER_ATTRS:
+            continue
+        if name.startswith('__') and name.endswith('__'):
+            # special methods are looked up on the type so must be real methods
+            namespace[name] = _forwarding_method(impl_attr, name)
+        else:
+            namespace[name] = _forwarding_property(impl_attr, name, False)
+    for name in pi.props_and_attrs.difference(_WRAPPER_ATTRS):
+        namespace[name] = _forwarding_property(impl_attr, name, True)
+    if '__eq__' in namespace and '__hash__' not in namespace:
+        # a class defining __eq__ without __hash__ is unhashable, hash as the implementation does to match __eq__
+        namespace['__hash__'] = _forwarding_method(impl_attr, '__hash__')
+    return namespace
+
+
+def _builtin_attrs(name):
+    """ These attributes are ignored when checking ABC types for emptyness.
+    """
+    return name in ('__doc__', '__module__', '__qualname__', '__abstractmethods__', '__dict__',
+                    '__metaclass__', '__weakref__',
+                    '_abc_cache', '_abc_impl', '_abc_registry', '_abc_negative_cache_version', '_abc_negative_cache',
+                    '_pi', '_pi_unwrap_decorators')
+
+
+def _get_pi_attribute(cls, attr_name, default=None):
+    if hasattr(cls, '_pi'):
+        return getattr(cls._pi, attr_name)
+    else:
+        return default
+
+
+def _type_is_pure_interface(cls):
+    """ Return True if cls is a pure interface or an empty ABC class"""
+    if cls is object:
+        return False
+    if hasattr(cls, '_pi'):
+        return cls._pi.type_is_pure_interface
+    if issubclass(type(cls), abc.ABCMeta):
+        for attr, value in six.iteritems(cls.__dict__):
+            if _builtin_attrs(attr):
+                continue
+            if callable(value):
+                if not _is_empty_function(value):
+                    return False
+            elif isinstance(value, property):
+                for func in (value.fget, value.fset, value.fdel):
+                    if func is not None and not _is_empty_function(func):
+                        return False
+        return True
+
+    return False
+
+
+_signature_cache = weakref.WeakKeyDictionary()  # function -> ArgSpec
+
+
+def _get_signatures(functions):
+    """ Returns {name: ArgSpec} for the {name: function} dictionary functions.
+    Signatures are only used by development checks so they are computed when first needed and cached per function.
+    """
+    signatures = {}
+    for name, func in six.iteritems(functions):
+        try:
+            signatures[name] = _signature_cache[func]
+        except KeyError:
+            signatures[name] = _signature_cache[func] = getargspec(func)
+    return signatures
+
+
+def _get_abc_interface_props_and_funcs(cls):
+    properties = set()
+    functions = {}
+    if not hasattr(cls, '__abstractmethods__'):
+        return properties, functions
+    for name in cls.__abstractmethods__:
+        if _builtin_attrs(name):
+            pass  # shortcut
+        value = getattr(cls, name)
+        if isinstance(value, (staticmethod, classmethod, types.MethodType)):
+            functions[name] = six.get_method_function(value)
+        elif isinstance(value, types.FunctionType):
+            functions[name] = value
+        elif isinstance(value, property):
+            properties.add(name)
+
+    return properties, functions
+
+
+def _is_empty_function(func, unwrap=False):
+    """ Return True if func is considered empty, see _checks._is_empty_function """
+    from pure_interface import _checks
+    return _checks._is_empty_function(func, unwrap)
+
+
+def _is_descriptor(obj):  # in our context we only care about __get__
+    return hasattr(obj, '__get__')
+
+
+def _ensure_everything_is_abstract(attributes):
+    # all methods and properties are abstract on a pure interface
+    namespace = {}
+    functions = []
+    interface_method_functions = {}
+    interface_property_names = set()
+    interface_attribute_names = set()
+    for name, value in six.iteritems(attributes):
+        if _builtin_attrs(name):
+            pass  # shortcut
+        elif name == '__annotations__':
+            interface_attribute_names.update(value.keys())
+        elif value is None:
+            interface_attribute_names.add(name)
+            continue  # do not add to class namespace
+        elif getattr(value, '__isabstractmethod__', False):
+            if isinstance(value, (staticmethod, classmethod, types.FunctionType)):
+                if isinstance(value, (staticmethod, classmethod)):
+                    func = value.__func__
+                else:
+                    func = value
+                functions.append(func)
+                interface_method_functions[name] = func
+            elif isinstance(value, property):
+                interface_property_names.add(name)
+        elif isinstance(value, staticmethod):
+            func = value.__func__
+            functions.append(func)
+            interface_method_functions[name] = func
+            value = abstractstaticmethod(func)
+        elif isinstance(value, classmethod):
+            func = value.__func__
+            interface_method_functions[name] = func
+            functions.append(func)
+            value = abstractclassmethod(func)
+        elif isinstance(value, types.FunctionType):
+            functions.append(value)
+            interface_method_functions[name] = value
+            value = abstractmethod(value)
+        elif isinstance(value, property):
+            interface_property_names.add(name)
+            functions.extend([value.fget, value.fset, value.fdel])  # may contain Nones
+            value = abstractproperty(value.fget, value.fset, value.fdel)
+        else:
+            raise ValueError('Interface class attributes must have a value of None\n{}={}'.format(name, value))
+        namespace[name] = value
+    return namespace, functions, interface_method_functions, interface_property_names, interface_attribute_names
+
+
+def _patch_properties(cls, base_abstract_properties):
+    """ Create an AttributeProperty for interface properties not provided by an implementation.
+    """
+    abstract_properties = set()
+    functions = []
+    for attr in cls.__abstractmethods__:
+        value = getattr(cls, attr)
+        if isinstance(value, abstractproperty):
+            functions.extend([value.fget, value.fset, value.fdel])  # may contain Nones
+            setattr(cls, attr, AttributeProperty(attr))
+            abstract_properties.add(attr)
+    cls._pi.abstractproperties = frozenset(abstract_properties | base_abstract_properties)
+    abstractmethods = set(cls.__abstractmethods__) - abstract_properties
+    for func in functions:
+        if func is not None and func.__name__ in abstractmethods:
+            abstractmethods.discard(func.__name__)
+    cls.__abstractmethods__ = frozenset(abstractmethods)
+
+
+class _InterfaceHierarchy(object):
+    """ Index of all interfaces created by PureInterfaceType.
+    Each interface gets an integer id in creation order.  The ids of every interface's ancestors are precomputed when
+    the interface is created and its id is added to the descendants of each ancestor, so ancestor and descendant
+    queries never walk the class hierarchy.
+    The entries of garbage collected interfaces are removed when the next interface is added.
+    """
+    def __init__(self):
+        self.interfaces = {}  # id -> weakref to interface
+        self.parents = {}  # id -> tuple of ids of direct base interfaces
+        self.ancestors = {}  # id -> frozenset of ids of all ancestor interfaces including itself
+        self.descendants = {}  # id -> set of ids of all descendant interfaces including itself
+        self.next_id = 0
+        self.dead = []  # ids of garbage collected interfaces still to be cleared
+
+    def add(self, interface):
+        self.clear_dead()
+        index = self.next_id
+        self.next_id += 1
+        interface._pi.hierarchy_id = index
+        ancestors = {index}
+        for base in interface._pi.type_interfaces[1:]:
+            ancestors.add(base._pi.hierarchy_id)
+        parents = tuple(base._pi.hierarchy_id for base in interface.__bases__
+                        if type_is_pure_interface(base) and base._pi.hierarchy_id is not None)
+        # the callback only records the id, the dicts are not changed while the garbage collector is running
+        self.interfaces[index] = weakref.ref(interface, lambda ref, index=index, dead=self.dead: dead.append(index))
+        self.parents[index] = parents
+        self.ancestors[index] = frozenset(ancestors)
+        self.descendants[index] = {index}
+        for ancestor in ancestors:
+            self.descendants[ancestor].add(index)
+
+    def clear_dead(self):
+        # an interface's descendants keep it alive so they are already dead too
+        while self.dead:
+            index = self.dead.pop()
+            for ancestor in self.ancestors[index]:
+                if ancestor in self.descendants:
+                    self.descendants[ancestor].discard(index)
+            del self.interfaces[index], self.parents[index], self.ancestors[index], self.descendants[index]
+
+    def resolve(self, ids):
+        """ Returns the live interfaces for ids in creation order """
+        interfaces = (self.interfaces[i]() for i in sorted(ids) if i in self.interfaces)
+        return [interface for interface in interfaces if interface is not None]
+
+    def type_ids(self, cls):
+        """ Returns the set of ids of all interfaces provided by cls """
+        ids = set()
+        for interface in get_type_interfaces(cls):
+            ids.update(self.ancestors[interface._pi.hierarchy_id])
+        return ids
+
+
+_hierarchy = _InterfaceHierarchy()
+_pure_interface_types = weakref.WeakSet()  # every class created by PureInterfaceType, see memory_report
+# base class -> (PureInterface is in its MRO, _type_is_pure_interface(base)), see _analyse_base
+_base_analysis = weakref.WeakKeyDictionary()
+# non-interface base -> set of tuples of the hierarchy ids of interfaces its methods have been checked against
+_verified_mixins = weakref.WeakKeyDictionary()
+_MAX_VERIFIED_MIXIN_SETS = 64
+
+
+def _analyse_base(base):
+    """ Returns (PureInterface is in the MRO of base, base is a pure interface), computed once per base class.
+    Plain ABC bases are scanned for non-empty functions, so they are assumed not to change after they are first used
+    as a base.
+    """
+    try:
+        return _base_analysis[base]
+    except KeyError:
+        pass
+    analysis = (PureInterface in base.__mro__, _type_is_pure_interface(base))
+    _base_analysis[base] = analysis
+    return analysis
+
+
+def _check_mixin_signatures(mixin, interface_method_signatures, interface_ids):
+    """ Checks the methods of a non-interface base against interface_method_signatures.
+    interface_ids is the list of hierarchy ids of the interfaces providing the signatures in the order they were merged,
+    or None if some are ABC interfaces that are not in the hierarchy.  The order matters as later interfaces override
+    the signatures of methods with the same name.  The check is only done once for each mixin and list of interfaces.
+    """
+    key = None if interface_ids is None else tuple(interface_ids)
+    verified = _verified_mixins.get(mixin)
+    if verified is not None and key in verified:
+        return
+    from pure_interface import _checks
+    _checks._check_method_signatures(mixin.__dict__, mixin.__name__, interface_method_signatures)
+    if key is not None:
+        if verified is None or len(verified) >= _MAX_VERIFIED_MIXIN_SETS:
+            verified = _verified_mixins[mixin] = set()
+        verified.add(key)
+
+
+class PureInterfaceType(abc.ABCMeta):
+    """
+    Meta-Class for PureInterface.
+    This type:
+        * determines if the new class is an interface or a concrete class.
+        * if the type is an interface:
+            * mark all methods and properties as abstract
+            * ensure all method and property bodies are empty
+        * optionally check overriding method signatures match those on base class.
+        * if the type is a concrete class then patch the abstract properties with AttributeProperies.
+    """
+
+    def __new__(mcs, clsname, bases, attributes):
+        # PureInterface is not in globals() when we are constructing the PureInterface class itself.
+        if 'PureInterface' in globals():
+            analyses = [_analyse_base(base) for base in bases]
+            has_interface = any(in_mro for in_mro, is_interface in analyses)
+        else:
+            analyses = [(True, _type_is_pure_interface(base)) for base in bases]
+            has_interface = True
+        if not has_interface:
+            # Don't interfere if meta class is only included to permit interface inheritance,
+            # but no actual interface is being used.
+            cls = super(PureInterfaceType, mcs).__new__(mcs, clsname, bases, attributes)
+            cls._pi = _PIAttributes(False, {}, (), ())
+            _pure_interface_types.add(cls)
+            return cls
+
+        base_types = [(cls, is_interface) for cls, (in_mro, is_interface) in zip(bases, analyses)]
+        type_is_interface = all(is_interface for cls, is_interface in base_types)
+
+        if clsname == 'PureInterface' and attributes.get('__module__', '') == 'pure_interface':
+            type_is_interface = True
+        if len(bases) > 1 and bases[0] is object:
+            bases = bases[1:]  # create a consistent MRO order
+            base_types = base_types[1:]
+
+        module = attributes.get('__module__')
+        check_signatures = not is_stripped and _development_setting(module, 'check_signatures')
+        interface_method_functions = dict()
+        interface_property_names = set()
+        interface_attribute_names = set()
+        base_abstract_properties = set()
+        interface_ids = []  # hierarchy ids of the interfaces in interface_method_functions, in merge order
+        for i in range(len(bases)-1, -1, -1):  # start at back end
+            base, base_is_interface = base_types[i]
+            if base is object:
+                continue
+            abstract_properties = _get_pi_attribute(base, 'abstractproperties', set())
+            base_abstract_properties.update(abstract_properties)
+            if base_is_interface:
+                if hasattr(base, '_pi'):
+                    method_functions = _get_pi_attribute(base, 'interface_method_functions', {})
+                    property_names = _get_pi_attribute(base, 'interface_property_names', set())
+                    attribute_names = _get_pi_attribute(base, 'interface_attribute_names', set())
+                    if interface_ids is not None:
+                        interface_ids.append(base._pi.hierarchy_id)
+                else:
+                    property_names, method_functions = _get_abc_interface_props_and_funcs(base)
+                    attribute_names = set()
+                    interface_ids = None  # ABC interfaces are not in the hierarchy
+                interface_method_functions.update(method_functions)
+                interface_property_names.update(property_names)
+                interface_attribute_names.update(attribute_names)
+            elif not issubclass(base, PureInterface) and check_signatures and interface_method_functions:
+                _check_mixin_signatures(base, _get_signatures(interface_method_functions), interface_ids)
+
+        if check_signatures and interface_method_functions:
+            from pure_interface import _checks
+            _checks._check_method_signatures(attributes, clsname, _get_signatures(interface_method_functions))
+
+        validate_arguments = structural = None
+        if type_is_interface:
+            validate_arguments = attributes.pop('pi_validate_arguments', None)
+            structural = attributes.pop('pi_structural', None)
+            if clsname == 'PureInterface' and attributes.get('__module__', '') == 'pure_interface':
+                namespace = attributes
+                functions = []
+                method_functions = {}
+                property_names = set()
+                attribute_names = set()
+            else:
+                r = _ensure_everything_is_abstract(attributes)
+                namespace, functions, method_functions, property_names, attribute_names = r
+            partial_implementation = False
+            interface_method_functions.update(method_functions)
+            interface_property_names.update(property_names)
+            interface_attribute_names.update(attribute_names)
+            if functions and not is_stripped:
+                unwrap = getattr(mcs, '_pi_unwrap_decorators', False)
+                for func in functions:
+                    if func is not None and not _is_empty_function(func, unwrap):
+                        raise InterfaceError('Function "{}" is not empty.\n'
+                                             'Did you forget to inherit from object to make the class concrete?'.format(func.__name__))
+        else:  # concrete sub-type
+            namespace = attributes
+            partial_implementation = 'pi_partial_implementation' in namespace
+            if partial_implementation:
+                value = namespace.pop('pi_partial_implementation')
+                if not value:
+                    warnings.warn('Partial implmentation is indicated by presence of '
+                                  'pi_partial_implementation attribute, not it''s value')
+        # create class
+        cls = super(PureInterfaceType, mcs).__new__(mcs, clsname, bases, namespace)
+        cls._pi = _PIAttributes(type_is_interface, interface_method_functions,
+                                interface_property_names, interface_attribute_names)
+        _pure_interface_types.add(cls)
+        if 'PureInterface' in globals():
+            cls._pi.type_interfaces = tuple(base for base in cls.__mro__
+                                            if isinstance(base, PureInterfaceType) and base is not PureInterface
+                                            and base._pi.type_is_pure_interface)
+            if type_is_interface:
+                if validate_arguments is None:  # inherit the declaration from a base interface
+                    validate_arguments = next((base._pi.validate_arguments for base in cls._pi.type_interfaces[1:]
+                                               if base._pi.validate_arguments is not None), None)
+                cls._pi.validate_arguments = None if validate_arguments is None else bool(validate_arguments)
+                if structural is None:
+                    structural = any(base._pi.structural for base in cls._pi.type_interfaces[1:])
+                cls._pi.structural = bool(structural)
+                _hierarchy.add(cls)
+                if _listeners and InterfaceDefined in _listeners:
+                    _emit(_listeners[InterfaceDefined], InterfaceDefined(cls))
+            else:
+                validated = False
+                for interface in cls._pi.type_interfaces:
+                    interface._pi.implementations.add(cls)
+                    validated = validated or interface._pi.validate_arguments is not None
+                if validated:
+                    from pure_interface import _validation
+                    _validation._install_argument_validators(cls)
+                if _listeners and ImplementationDefined in _listeners:
+                    _emit(_listeners[ImplementationDefined], ImplementationDefined(cls, cls._pi.type_interfaces))
+
+        if not type_is_interface:
+            class_properties = set(k for k, v in namespace.items() if _is_descriptor(v))
+            base_abstract_properties.difference_update(class_properties)
+            _patch_properties(cls, base_abstract_properties)
+            if cls.__abstractmethods__ and not partial_implementation and not is_stripped and \
+                    _development_setting(module, 'warn_incomplete'):
+                from pure_interface import _checks
+                stacklevel = _checks.incomplete_implementation_stacklevel()
+                for method_name in cls.__abstractmethods__:
+                    message = 'Incomplete Implementation: {clsname} does not implement {method_name}'
+                    message = message.format(clsname=clsname, method_name=method_name)
+                    missing_method_warnings.append(message)
+                    warnings.warn(message, stacklevel=stacklevel)
+            if cls.__abstractmethods__ and not partial_implementation and _listeners and \
+                    IncompleteImplementation in _listeners:
+                event = IncompleteImplementation(cls, frozenset(cls.__abstractmethods__))
+                _emit(_listeners[IncompleteImplementation], event)
+
+        if type_is_interface and not cls.__abstractmethods__:
+            cls.__abstractmethods__ = frozenset({''})  # empty interfaces still should not be instantiated
+        return cls
+
+    if not is_stripped:
+        # In strip mode instantiation is left to type.__call__; interfaces are still not instantiable
+        # as they always have abstract methods.
+        def __call__(cls, *args, **kwargs):
+            """ Check that abstract properties are created in constructor """
+            if cls._pi.type_is_pure_interface:
+                raise TypeError('Interfaces cannot be instantiated')
+            self = super(PureInterfaceType, cls).__call__(*args, **kwargs)
+            if _stats is not None:
+                cls._pi.instances_created += 1
+            for attr in cls._pi.abstractproperties:
+                if not hasattr(self, attr):
+                    raise TypeError('{}.__init__ does not create required attribute "{}"'.format(cls.__name__, attr))
+            for attr in cls._pi.interface_attribute_names:
+                if not hasattr(self, attr):
+                    raise TypeError('{}.__init__ does not create required attribute "{}"'.format(cls.__name__, attr))
+            return self
+
+    def register(cls, subclass):
+        """ Register a virtual subclass, recording it as an implementation of the interfaces of cls """
+        result = super(PureInterfaceType, cls).register(subclass)
+        if not issubclass(subclass, (_ImplementationWrapper, _CompositeWrapper)):
+            for interface in cls._pi.type_interfaces:
+                interface._pi.implementations.add(subclass)
+        if _dispatchers:
+            _clear_dispatch_caches()
+        return result
+
+    def __dir__(cls):
+        listing = set(cls._pi.interface_attribute_names)
+        for base in cls.mro():
+            listing.update(base.__dict__.keys())
+        listing = sorted(listing)
+        return listing
+
+
+PI = TypeVar('PI', bound='PureInterface')
+
+
+@six.add_metaclass(PureInterfaceType)
+class PureInterface(ABC):
+    _pi = _PIAttributes(True, {}, (), ())
+
+    @classmethod
+    def _structural_type_check(cls, instance):
+        if _stats is not None:
+            _stats.instance_structural_checks += 1
+        subclass = type(instance)
+        for attr in cls._pi.interface_method_names:
+            subtype_value = getattr(subclass, attr, None)
+            if not callable(subtype_value):
+                return False
+        for attr in cls._pi.props_and_attrs:
+            if not hasattr(instance, attr):
+                return False
+        return True
+
+    @classmethod
+    def _class_structural_type_check(cls, subclass, warn=True):
+        if subclass in cls._pi.structural_subclasses:
+            return True
+        if _stats is not None:
+            _stats.structural_checks += 1
+
+        for attr in cls._pi.interface_method_names:
+            subtype_value = getattr(subclass, attr, None)
+            if not callable(subtype_value):
+                return False
+        for attr in cls._pi.props_and_attrs:
+            if not hasattr(subclass, attr):
+                return False
+
+        cls._pi.structural_subclasses.add(subclass)
+        if _stats is not None:
+            _stats.structural_matches += 1
+        if _listeners and StructuralMatch in _listeners:
+            _emit(_listeners[StructuralMatch], StructuralMatch(cls, subclass))
+        if warn and _development_setting(cls.__module__, 'warn_structural'):
+            from pure_interface import _checks
+            stacklevel = _checks.structural_warning_stacklevel()
+            warnings.warn('Class {module}.{sub_name} implements {cls_name}.\n'
+                          'Consider inheriting {cls_name} or using {cls_name}.register({sub_name})'
+                          .format(cls_name=cls.__name__, sub_name=subclass.__name__, module=cls.__module__),
+                          stacklevel=stacklevel)
+        return True
+
+    @classmethod
+    def __subclasshook__(cls, subclass):
+        """ Makes isinstance and issubclass check classes structurally for interfaces declaring pi_structural.
+        abc.ABCMeta caches the result for each class so the structural check is only done once per class.
+        """
+        pi = cls._pi
+        if not pi.structural or not pi.type_is_pure_interface:
+            return NotImplemented
+        if cls in getattr(subclass, '__mro__', ()) or subclass in pi.implementations or \
+                issubclass(subclass, (_ImplementationWrapper, _CompositeWrapper)):
+            return NotImplemented  # nominal implementations and wrappers are found by ABCMeta
+        if cls._class_structural_type_check(subclass, warn=False):
+            return True
+        return NotImplemented
+
+    @classmethod
+    def provided_by(cls, obj, allow_implicit=True):
+        # type: (Any, bool) -> bool
+        """ Returns True if obj provides this interface.
+        provided_by(cls, obj) is equivalent to isinstance(obj, cls) unless allow_implicit is True
+        If allow_implicit is True then returns True if interface duck-type check passes.
+        Returns False otherwise.
+        """
+        if not cls._pi.type_is_pure_interface:
+            raise ValueError('provided_by() can only be called on interfaces')
+        if type(obj) is cls._pi.impl_wrapper_type or isinstance(obj, cls):
+            return True
+        if not allow_implicit:
+            return False
+        if cls._class_structural_type_check(type(obj)):
+            return True
+        return cls._structural_type_check(obj)
+
+    @classmethod
+    def interface_only(cls, implementation):
+        # type: (Type[PI], Any) -> PI
+        """ Returns a wrapper around implementation that provides ONLY this interface.
+        While a wrapper is alive, wrapping the same implementation again returns the same wrapper.
+        """
+        wrapper_type = cls._pi.impl_wrapper_type
+        if wrapper_type is None:
+            type_name = cls.__name__ + 'Only'
+            attributes = _forwarding_namespace(cls, '_ImplementationWrapper__impl')
+            attributes['__module__'] = cls.__module__
+            attributes['__slots__'] = ()
+            wrapper_type = cls._pi.impl_wrapper_type = type(type_name, (_ImplementationWrapper,), attributes)
+            cls.register(wrapper_type)
+        if type(implementation) is wrapper_type:
+            return implementation
+        if isinstance(implementation, _ImplementationWrapper):
+            if issubclass(implementation._ImplementationWrapper__interface, cls):
+                implementation = implementation._ImplementationWrapper__impl
+        # the wrapper keeps the implementation alive so its id cannot be reused while the entry exists
+        key = id(implementation)
+        wrapper = cls._pi.wrappers.get(key)
+        if wrapper is None or wrapper._ImplementationWrapper__impl is not implementation:
+            wrapper = wrapper_type(implementation, cls)
+            cls._pi.wrappers[key] = wrapper
+            if _stats is not None:
+                _stats.wrappers_created += 1
+        return wrapper
+
+    @classmethod
+    def make_dto(cls, frozen=False):
+        # type: (Type[PI], bool) -> Type[PI]
+        """ Returns a class registered as an implementation of this interface for interfaces with only properties and
+        attributes.  The class has a slot for each of them, an __init__ taking them as arguments in alphabetical order,
+        and __repr__ and __eq__ comparing their values.  If frozen is True the objects are read-only and hashable.
+        The same type is returned for every call with the same frozen argument.
+        Raises ValueError if the interface has methods, or an attribute name that cannot be an argument name.
+        """
+        if not cls._pi.type_is_pure_interface:
+            raise ValueError('make_dto() can only be called on interfaces')
+        dto_types = cls._pi.dto_types
+        if dto_types is None:
+            dto_types = cls._pi.dto_types = {}
+        frozen = bool(frozen)
+        try:
+            return dto_types[frozen]
+        except KeyError:
+            pass
+        from pure_interface import _dto
+        dto_type = dto_types[frozen] = _dto.make_dto_type(cls, frozen)
+        return dto_type
+
+    @classmethod
+    def _compile_adapters(cls, obj_type):
+        # type: (Type[PI], Type[Any]) -> Tuple[_AdapterRegistration, ...]
+        """ Builds the ordered tuple of adapter registrations that may adapt objects of type obj_type.
+        Candidates are ordered by the position of their from_type in the obj_type MRO, then by priority (highest first),
+        then preferring this interface over sub-interfaces and finally by registration order.
+        The tuple ends at the first unconditional adapter as later candidates can never be selected.
+        """
+        candidate_interfaces = [cls] + [subcls for subcls in cls.__subclasses__() if type_is_pure_interface(subcls)]
+        candidates = []
+        for mro_index, obj_class in enumerate(obj_type.__mro__):
+            for interface_index, interface in enumerate(candidate_interfaces):
+                for registration in interface._pi.adapters.get(obj_class, ()):
+                    key = (mro_index, -registration.priority, interface_index, registration.sequence)
+                    candidates.append((key, registration))
+        candidates.sort(key=lambda candidate: candidate[0])
+        table = []
+        for _, registration in candidates:
+            table.append(registration)
+            if registration.predicate is None:
+                break
+        table = tuple(table)
+        cls._pi.adapter_table[obj_type] = table
+        if _stats is not None:
+            _stats.adapter_tables_built += 1
+        return table
+
+    @classmethod
+    def _get_adapter(cls, obj):
+        # type: (Type[PI], Any) -> Optional[_AdapterRegistration]
+        """ Returns the adapter registration to use for adapting obj to this interface or None if no adapter exists.
+        """
+        obj_type = type(obj)
+        try:
+            table = cls._pi.adapter_table[obj_type]
+        except KeyError:
+            table = cls._compile_adapters(obj_type)
+        for registration in table:
+            if registration.predicate is None or registration.predicate(obj):
+                return registration
+        return None
+
+    @classmethod
+    def _verify_adapted(cls, registration, adapted, allow_implicit):
+        # type: (Type[PI], _AdapterRegistration, Any, bool) -> None
+        """ Raises ValueError if the object returned by an adapter does not provide this interface.
+        Honours the adapter_verification policy.
+        """
+        policy = adapter_verification
+        if policy == ADAPTER_VERIFY_NEVER:
+            if _stats is not None:
+                _stats.verifications_skipped += 1
+            return
+        result_type = type(adapted)
+        verify_once = policy == ADAPTER_VERIFY_ONCE
+        if verify_once:
+            verified = cls._pi.verified_results.get(result_type, ())
+            if (registration, False) in verified or (registration, allow_implicit) in verified:
+                if _stats is not None:
+                    _stats.verifications_skipped += 1
+                return
+        if _stats is not None:
+            _stats.verifications += 1
+        if isinstance(adapted, cls) or (allow_implicit and cls._class_structural_type_check(result_type)):
+            # verdict depends only on the result type so it can be trusted for future results of this type
+            if verify_once:
+                cls._pi.verified_results.setdefault(result_type, set()).add((registration, allow_implicit))
+        elif not cls.provided_by(adapted, allow_implicit):
+            if _listeners and AdaptionFailed in _listeners:
+                event = AdaptionFailed(cls, adapted, 'adapter result does not provide interface')
+                _emit(_listeners[AdaptionFailed], event)
+            raise ValueError('Adapter {} does not implement interface {}'.format(registration.adapter, cls.__name__))
+
+    @classmethod
+    def adapt(cls, obj, allow_implicit=False, interface_only=None):
+        # type: (Type[PI], Any, bool, Optional[bool]) -> PI
+        """ Adapts obj to interface, returning obj if to_interface.provided_by(obj, allow_implicit) is True
+        and raising ValueError if no adapter is found
+        If interface_only is True, or interface_only is None and the interface_only development setting for the
+        interface's module is True (by default is_development) then the returned object is wrapped by an object
+        that only provides the methods and properties defined by to_interface.
+        """
+        stats = _stats
+        if stats is not None:
+            stats.adapt_calls += 1
+        if interface_only is None:
+            interface_only = _development_setting(cls.__module__, 'interface_only')
+        if isinstance(obj, _ImplementationWrapper) and issubclass(obj._ImplementationWrapper__interface, cls):
+            adapted = obj  # already wrapped by this interface or a sub-interface
+        elif cls.provided_by(obj, allow_implicit=allow_implicit):
+            adapted = obj
+        else:
+            registration = cls._get_adapter(obj)
+            if registration is None:
+                if stats is not None:
+                    stats.adaption_failures += 1
+                if _listeners and AdaptionFailed in _listeners:
+                    _emit(_listeners[AdaptionFailed], AdaptionFailed(cls, obj, 'no adapter'))
+                raise ValueError('Cannot adapt {} to {}'.format(obj, cls.__name__))
+            if stats is not None:
+                stats.adapter_calls[(cls, registration)] += 1
+            adapted = _call_adapter(cls, registration, obj)
+            cls._verify_adapted(registration, adapted, allow_implicit)
+        if interface_only:
+            adapted = cls.interface_only(adapted)
+        return adapted
+
+    @classmethod
+    def adapt_or_none(cls, obj, allow_implicit=False, interface_only=None):
+        # type: (Type[PI], Any, bool, Optional[bool]) -> Optional[PI]
+        """ Adapt obj to to_interface or return None if adaption fails """
+        try:
+            return cls.adapt(obj, allow_implicit=allow_implicit, interface_only=interface_only)
+        except ValueError:
+            return None
+
+    @classmethod
+    def can_adapt(cls, obj, allow_implicit=False):
+        # type: (Any, bool) -> bool
+        """ Returns True if adapt(obj, allow_implicit) will succeed."""
+        try:
+            cls.adapt(obj, allow_implicit=allow_implicit)
+        except ValueError:
+            return False
+        return True
+
+    @classmethod
+    def filter_adapt(cls, objects, allow_implicit=False, interface_only=None):
+        # type: (Type[PI], Iterable[Any], bool, Optional[bool]) -> Iterable[PI]
+        """ Generates adaptions of the given objects to this interface.
+        Objects that cannot be adapted to this interface are silently skipped.
+        """
+        for obj in objects:
+            try:
+                f = cls.adapt(obj, allow_implicit=allow_implicit, interface_only=interface_only)
+            except ValueError:
+                continue
+            yield f
+
+
+def _call_adapter(interface, registration, obj):
+    """ Calls the adapter of registration with obj, timing the call if there are AdapterInvoked listeners """
+    if not _listeners or AdapterInvoked not in _listeners:
+        return registration.adapter(obj)
+    start = _timer()
+    adapted = registration.adapter(obj)
+    event = AdapterInvoked(interface, type(obj), registration.adapter, _timer() - start)
+    _emit(_listeners[AdapterInvoked], event)
+    return adapted
+
+
+class Concrete(object):
+    """
+    Inheriting from object to define an implementation technically creates an inconsistent MRO.  This is handled by
+    the PureInterfaceType meta-class by removing object from the front of the bases list.
+    However static checkers such as mypy will complain.  To get around this, use this class instead
+
+        class Implemenation(Concrete, Interface):
+    """
+    pass
+
+
+# adaption
+def adapts(from_type, to_interface=None, priority=0, predicate=None):
+    # type: (Any, Type[PI], int, Optional[Callable[[Any], bool]]) -> Callable
+    """Class or function decorator for declaring an adapter from a type to an interface.
+    E.g.
+        @adapts(MyClass, MyInterface)
+        def interface_factory(obj):
+            ....
+
+    If decorating a class to_interface may be None to use the first interface in the class's MRO.
+    E.g.
+        @adapts(MyClass)
+        class MyClassToInterfaceAdapter(object, MyInterface):
+            def __init__(self, obj):
+                ....
+            ....
+        will adapt MyClass to MyInterface using MyClassToInterfaceAdapter
+
+    priority and predicate are passed to register_adapter.
+    """
+
+    def decorator(cls):
+        if to_interface is None:
+            interfaces = get_type_interfaces(cls)
+            if interfaces:
+                interface = interfaces[0]
+            elif isinstance(cls, type):
+                raise InterfaceError('Class {} does not provide any interfaces'.format(cls.__name__))
+            else:
+                raise InterfaceError('to_interface must be specified when decorating non-classes')
+        else:
+            interface = to_interface
+        register_adapter(cls, from_type, interface, priority=priority, predicate=predicate)
+        return cls
+
+    return decorator
+
+
+def register_adapter(adapter, from_type, to_interface, priority=0, predicate=None):
+    # type: (Callable, Any, Type[PureInterface], int, Optional[Callable[[Any], bool]]) -> None
+    """ Registers adapter to convert instances of from_type to objects that provide to_interface
+    for the to_interface.adapt() method.
+
+    :param adapter: callable that takes an instance of from_type and returns an object providing to_interface.
+    :param from_type: a type to adapt from
+    :param to_interface: a (non-concrete) PureInterface subclass or a typing.Protocol class to adapt to.
+    :param priority: adapters with a higher priority are preferred when adapters for the same from_type are
+        registered on several interfaces in the hierarchy.
+    :param predicate: optional callable taking the object to adapt and returning True if this adapter should be used.
+        Any number of predicate-guarded adapters may be registered for a (from_type, to_interface) pair,
+        but only one adapter without a predicate.
+    """
+    to_interface = _as_interface(to_interface)
+    if not callable(adapter):
+        raise ValueError('adapter must be callable')
+    if not isinstance(from_type, type):
+        raise ValueError('{} must be a type'.format(from_type))
+    if not (isinstance(to_interface, type) and _get_pi_attribute(to_interface, 'type_is_pure_interface', False)):
+        raise ValueError('{} is not an interface'.format(to_interface))
+    if predicate is not None and not callable(predicate):
+        raise ValueError('predicate must be callable')
+    adapters = _get_pi_attribute(to_interface, 'adapters')
+    registrations = adapters.setdefault(from_type, [])
+    if predicate is None and any(r.predicate is None for r in registrations):
+        raise ValueError('{} already has an adapter to {}'.format(from_type, to_interface))
+    registrations.append(_AdapterRegistration(weakref.proxy(adapter), priority, predicate))
+    # adapt() on an interface also considers adapters of its direct sub-interfaces
+    for interface in (to_interface,) + to_interface.__bases__:
+        if type_is_pure_interface(interface):
+            interface._pi.adapter_table.clear()
+    if _dispatchers:
+        _clear_dispatch_caches()
+
+
+def _common_adapter(obj, interfaces):
+    """ Returns (interface, registration) for an adapter of obj to an interface derived from all of interfaces,
+    or None if there is no such adapter.  Interfaces are tried in creation order, so the most general first.
+    """
+    common = None
+    for interface in interfaces:
+        descendants = _hierarchy.descendants[_hierarchy_id(interface)]
+        common = set(descendants) if common is None else common.intersection(descendants)
+    for interface in _hierarchy.resolve(common):
+        registration = interface._get_adapter(obj)
+        if registration is not None:
+            return interface, registration
+    return None
+
+
+def adapt_all(obj, interfaces, allow_implicit=False, interface_only=None):
+    # type: (Any, Iterable[Type[PureInterface]], bool, Optional[bool]) -> Any
+    """ Adapts obj to all of interfaces, returning a single object that provides every one of them.
+    An adapter to an interface derived from every interface that obj does not provide is preferred, otherwise each
+    interface uses its own adapter.  An adapter is called at most once and its result is used for every interface it
+    provides.  As for adapt(), a wrapper passed as obj is never unwrapped and only provides its own interfaces.
+    If different objects are needed for different interfaces, or interface_only is True (or None and the
+    interface_only development setting for the first interface is True) then a wrapper providing only the given
+    interfaces is returned.
+    Raises ValueError if obj cannot be adapted to one of the interfaces.
+    """
+    interfaces = tuple(_as_interface(interface) for interface in interfaces)
+    if not interfaces:
+        raise ValueError('adapt_all() requires at least one interface')
+    if interface_only is None:
+        interface_only = _development_setting(interfaces[0].__module__, 'interface_only')
+    results = []
+    adapted = collections.OrderedDict()  # registration -> result
+    missing = [interface for interface in interfaces if not interface.provided_by(obj, allow_implicit=allow_implicit)]
+    if len(missing) > 1:
+        common = _common_adapter(obj, missing)
+        if common is not None:
+            interface, registration = common
+            if _stats is not None:
+                _stats.adapter_calls[(interface, registration)] += 1
+            result = adapted[registration] = _call_adapter(interface, registration, obj)
+            interface._verify_adapted(registration, result, allow_implicit)
+    for interface in interfaces:
+        if interface not in missing:
+            results.append(obj)
+            continue
+        for result in adapted.values():
+            if interface.provided_by(result, allow_implicit=allow_implicit):
+                results.append(result)
+                break
+        else:
+            registration = interface._get_adapter(obj)
+            if registration is None:
+                if _stats is not None:
+                    _stats.adaption_failures += 1
+                if _listeners and AdaptionFailed in _listeners:
+                    _emit(_listeners[AdaptionFailed], AdaptionFailed(interface, obj, 'no adapter'))
+                raise ValueError('Cannot adapt {} to {}'.format(obj, interface.__name__))
+            try:
+                result = adapted[registration]
+            except KeyError:
+                if _stats is not None:
+                    _stats.adapter_calls[(interface, registration)] += 1
+                result = adapted[registration] = _call_adapter(interface, registration, obj)
+            interface._verify_adapted(registration, result, allow_implicit)
+            results.append(result)
+
+    first = results[0]
+    single = all(result is first for result in results)
+    if single and not interface_only:
+        return first
+    if len(interfaces) == 1:
+        return interfaces[0].interface_only(first)
+    if _stats is not None:
+        _stats.wrappers_created += 1
+    return _get_composite_wrapper_type(interfaces)(tuple(results))
+
+
+# implement() remembers this many verified functions per interface before starting again
+_MAX_VERIFIED_SIGNATURES = 1024
+
+
+def _implementation_properties(interface):
+    """ Returns {property name: names of the property functions} for the abstract properties of interface.
+    These are the properties _patch_properties replaces with an AttributeProperty, computed once per interface.
+    """
+    properties = interface._pi.implementation_properties
+    if properties is None:
+        properties = {}
+        for name in interface.__abstractmethods__:
+            value = getattr(interface, name, None)
+            if isinstance(value, abstractproperty):
+                functions = (value.fget, value.fset, value.fdel)
+                properties[name] = frozenset(func.__name__ for func in functions if func is not None)
+        interface._pi.implementation_properties = properties
+    return properties
+
+
+def _check_implementation_signatures(interface, clsname, namespace):
+    """ Checks the signatures of the interface methods in namespace.
+    Functions whose code and number of defaults have already been checked against interface are skipped.
+    """
+    pi = interface._pi
+    if pi.verified_signatures is None:
+        pi.verified_signatures = set()
+    unverified = {}
+    keys = []
+    for name, value in six.iteritems(namespace):
+        if name not in pi.interface_method_functions:
+            continue
+        func = value.__func__ if isinstance(value, (staticmethod, classmethod)) else value
+        if isinstance(func, types.FunctionType):
+            key = (name, six.get_function_code(func), len(func.__defaults__ or ()))
+            if key in pi.verified_signatures:
+                continue
+            keys.append(key)
+        unverified[name] = pi.interface_method_signatures[name]
+    if unverified:
+        from pure_interface import _checks
+        _checks._check_method_signatures(namespace, clsname, unverified)
+        if len(pi.verified_signatures) + len(keys) > _MAX_VERIFIED_SIGNATURES:
+            pi.verified_signatures.clear()
+        pi.verified_signatures.update(keys)
+
+
+def _implement(interface, classes, module):
+    """ Creates the implementations of interface for the (name, namespace) pairs in classes.
+    Returns (list of classes, list of incomplete implementation messages to warn about).
+    """
+    if not type_is_pure_interface(interface):
+        raise ValueError('implement() can only be called on interfaces')
+    if type(interface) is not PureInterfaceType:
+        # sub-meta-classes may change class creation so go through the meta-class, which issues its own warnings
+        created = []
+        for name, namespace in classes:
+            namespace = dict(namespace)
+            namespace.setdefault('__module__', module)
+            created.append(type(interface)(str(name), (Concrete, interface), namespace))
+        return created, []
+
+    properties = _implementation_properties(interface)
+    check_signatures = not is_stripped and _development_setting(module, 'check_signatures')
+    prepared = []
+    for name, namespace in classes:
+        namespace = dict(namespace)
+        namespace.setdefault('__module__', module)
+        partial_implementation = 'pi_partial_implementation' in namespace
+        if partial_implementation and not namespace.pop('pi_partial_implementation'):
+            warnings.warn('Partial implmentation is indicated by presence of '
+                          'pi_partial_implementation attribute, not it''s value', stacklevel=3)
+        patched = [attr for attr in properties if attr not in namespace]
+        for attr in patched:
+            namespace[attr] = AttributeProperty(attr)
+        if check_signatures and interface._pi.interface_method_functions:
+            _check_implementation_signatures(interface, name, namespace)
+        prepared.append((str(name), namespace, partial_implementation, patched))
+
+    # every namespace has been checked before any class is created
+    pi = interface._pi
+    validated = any(base._pi.validate_arguments is not None for base in pi.type_interfaces)
+    created = []
+    messages = []
+    for name, namespace, partial_implementation, patched in prepared:
+        cls = abc.ABCMeta.__new__(PureInterfaceType, name, (Concrete, interface), namespace)
+        cls._pi = _PIAttributes(False, pi.interface_method_functions, pi.interface_property_names,
+                                pi.interface_attribute_names)
+        _pure_interface_types.add(cls)
+        cls._pi.type_interfaces = pi.type_interfaces
+        cls._pi.abstractproperties = frozenset(patched)
+        for base in pi.type_interfaces:
+            base._pi.implementations.add(cls)
+        if validated:
+            from pure_interface import _validation
+            _validation._install_argument_validators(cls)
+        if _listeners and ImplementationDefined in _listeners:
+            _emit(_listeners[ImplementationDefined], ImplementationDefined(cls, pi.type_interfaces))
+        if cls.__abstractmethods__ and patched:
+            # the functions of a patched property may have been named differently to the property
+            function_names = set()
+            for attr in patched:
+                function_names.update(properties[attr])
+            cls.__abstractmethods__ = frozenset(cls.__abstractmethods__ - function_names)
+        if cls.__abstractmethods__ and not partial_implementation:
+            if not is_stripped and _development_setting(module, 'warn_incomplete'):
+                for method_name in cls.__abstractmethods__:
+                    message = 'Incomplete Implementation: {clsname} does not implement {method_name}'
+                    message = message.format(clsname=name, method_name=method_name)
+                    missing_method_warnings.append(message)
+                    messages.append(message)
+            if _listeners and IncompleteImplementation in _listeners:
+                event = IncompleteImplementation(cls, frozenset(cls.__abstractmethods__))
+                _emit(_listeners[IncompleteImplementation], event)
+        created.append(cls)
+    return created, messages
+
+
+def implement(interface, name, namespace, module=None):
+    # type: (Type[PI], str, dict, Optional[str]) -> Type[PI]
+    """ Returns a new concrete class implementing interface.
+    This is equivalent to type(name, (Concrete, interface), namespace) but reuses what is already known about
+    interface instead of analysing the bases again, and skips signature checks of functions that have already been
+    checked against interface.  Use it when generating many implementations at runtime.
+    module is the __module__ of the new class and defaults to the module calling implement().
+    """
+    if module is None:
+        module = sys._getframe(1).f_globals.get('__name__')
+    created, messages = _implement(interface, [(name, namespace)], module)
+    for message in messages:
+        warnings.warn(message, stacklevel=2)
+    return created[0]
+
+
+def implement_all(interface, classes, module=None):
+    # type: (Type[PI], Iterable[Tuple[str, dict]], Optional[str]) -> List[Type[PI]]
+    """ Returns a list of new concrete classes implementing interface, one for each (name, namespace) pair in classes.
+    Every namespace is checked before any class is created and incomplete implementations are reported in a single
+    warning.  See implement().
+    """
+    if module is None:
+        module = sys._getframe(1).f_globals.get('__name__')
+    created, messages = _implement(interface, classes, module)
+    if messages:
+        warnings.warn('\n'.join(messages), stacklevel=2)
+    return created
+
+
+# typing.Protocol interoperability
+_protocol_interfaces = weakref.WeakKeyDictionary()  # typing.Protocol class -> interface, see protocol_interface
+
+# attributes that typing and abc add to protocol classes, these are not protocol members
+_PROTOCOL_SPECIAL_ATTRS = frozenset((
+    '__abstractmethods__', '__annotations__', '__weakref__', '_is_protocol', '_is_runtime_protocol', '__dict__',
+    '__args__', '__slots__', '__next_in_mro__', '__parameters__', '__origin__', '__orig_bases__', '__extra__',
+    '__tree_hash__', '__doc__', '__subclasshook__', '__init__', '__new__', '__module__', '__qualname__',
+    '_MutableMapping__marker', '_gorg', '__protocol_attrs__', '__non_callable_proto_members__',
+    '__init_subclass__', '__class_getitem__', '__callable_proto_members_only__', '__type_params__',
+))
+
+
+def _is_protocol(cls):
+    """ Return True if cls is a typing.Protocol (or typing_extensions.Protocol) class """
+    return isinstance(cls, type) and bool(getattr(cls, '_is_protocol', False)) and \
+        not isinstance(cls, PureInterfaceType)
+
+
+def _protocol_members(protocol):
+    """ Returns (methods, property names, attribute names) of protocol, methods maps name -> function """
+    methods = {}
+    property_names = set()
+    attribute_names = set()
+    for base in reversed(protocol.__mro__):
+        if not base.__dict__.get('_is_protocol', False) or \
+                (base.__name__ in ('Protocol', 'Generic') and base.__module__ in ('typing', 'typing_extensions')):
+            continue
+        members = [(name, None) for name in base.__dict__.get('__annotations__', {})]
+        members.extend(base.__dict__.items())
+        for name, value in members:
+            if name in _PROTOCOL_SPECIAL_ATTRS or name.startswith('_abc_'):
+                continue
+            methods.pop(name, None)
+            property_names.discard(name)
+            attribute_names.discard(name)
+            if isinstance(value, (staticmethod, classmethod)):
+                methods[name] = value.__func__
+            elif isinstance(value, types.FunctionType):
+                methods[name] = value
+            elif isinstance(value, property):
+                property_names.add(name)
+            else:
+                attribute_names.add(name)
+    return methods, property_names, attribute_names
+
+
+def _protocol_stub(name):
+    """ Returns an empty function to stand in for a protocol member, which may have a default implementation """
+    def stub(self, *args, **kwargs):
+        pass
+    stub.__name__ = str(name)
+    return stub
+
+
+def _as_interface(cls):
+    """ Returns the interface for cls if it is a typing.Protocol class, otherwise cls """
+    if _is_protocol(cls):
+        return protocol_interface(cls)
+    return cls
+
+
+def protocol_interface(protocol):
+    # type: (type) -> Type[PureInterface]
+    """ Returns a PureInterface with the same members as the typing.Protocol class protocol.
+    The interface is created on first use and then reused.  It is structural (see pi_structural), so isinstance
+    checks against it are cached per type, unlike those against runtime_checkable protocols.
+    Protocols may be used instead of their interfaces with register_adapter, adapts, adapt_all and
+    interface_dispatch.  To use a protocol as the base of an interface, inherit from its interface.
+    """
+    try:
+        return _protocol_interfaces[protocol]
+    except (KeyError, TypeError):
+        pass
+    if not _is_protocol(protocol):
+        raise ValueError('{} is not a typing.Protocol class'.format(protocol))
+    methods, property_names, attribute_names = _protocol_members(protocol)
+    namespace = {'__module__': protocol.__module__, '__doc__': protocol.__doc__, 'pi_structural': True}
+    namespace.update((name, _protocol_stub(name)) for name in methods)
+    namespace.update((name, property(_protocol_stub(name))) for name in property_names)
+    namespace.update((name, None) for name in attribute_names)
+    interface = PureInterfaceType(str(protocol.__name__), (PureInterface,), namespace)
+    # signatures are checked against the protocol's own functions
+    interface._pi.interface_method_functions = methods
+    _protocol_interfaces[protocol] = interface
+    return interface
+
+
+_dispatchers = weakref.WeakSet()  # interface_dispatch functions, their caches are cleared by registrations
+
+
+def _clear_dispatch_caches():
+    for dispatcher in list(_dispatchers):
+        dispatcher.cache_clear()
+
+
+def _adapting_function(candidates, default):
+    """ Returns a function that calls the implementation for the first (interface, implementation) in candidates that
+    its first argument can be adapted to, with the adapted argument.  default is called if none can be adapted.
+    """
+    if len(candidates) == 1 and default is None:
+        interface, implementation = candidates[0]
+        adapt = interface.adapt
+
+        def call_adapted(obj, *args, **kwargs):
+            return implementation(adapt(obj), *args, **kwargs)
+        return call_adapted
+
+    def call_first_adapted(obj, *args, **kwargs):
+        for interface, implementation in candidates:
+            adapted = interface.adapt_or_none(obj)
+            if adapted is not None:
+                return implementation(adapted, *args, **kwargs)
+        if default is None:
+            names = ', '.join(interface.__name__ for interface, implementation in candidates)
+            raise ValueError('Cannot adapt {} to {}'.format(obj, names))
+        return default(obj, *args, **kwargs)
+    return call_first_adapted
+
+
+def _dispatch_function(registry, obj_type, default):
+    """ Returns the function an interface_dispatch function calls for arguments of type obj_type.
+    The most specific registered interface provided by obj_type is preferred, then interfaces registered with
+    adapt=True that obj_type has adapters to, in registration order.
+    """
+    provided = [interface for interface in registry if issubclass(obj_type, interface)]
+    provided = [interface for interface in provided
+                if not any(is_interface_ancestor(interface, other) for other in provided)]
+    if len(provided) > 1:
+        names = ', '.join(interface.__name__ for interface in provided)
+        raise RuntimeError('Ambiguous dispatch for {}: {}'.format(obj_type.__name__, names))
+    if provided:
+        return registry[provided[0]][0]
+    candidates = []
+    for interface, (implementation, adapt) in registry.items():
+        if not adapt:
+            continue
+        try:
+            table = interface._pi.adapter_table[obj_type]
+        except KeyError:
+            table = interface._compile_adapters(obj_type)
+        if table:
+            candidates.append((interface, implementation))
+            if table[-1].predicate is None:
+                return _adapting_function(candidates, None)
+    if candidates:
+        return _adapting_function(candidates, default)
+    return default
+
+
+def interface_dispatch(func):
+    """ Function decorator that dispatches on the interfaces provided by the first argument, like
+    functools.singledispatch does on its type.  Implementations are added with the register attribute:
+
+        @interface_dispatch
+        def draw(obj):
+            raise TypeError('Cannot draw {}'.format(obj))
+
+        @draw.register(IShape)
+        def draw_shape(shape):
+            ...
+
+    The decorated function is called if no registered interface applies.
+    The function to call is cached for each argument type, so after the first call with a type, dispatch costs one
+    dictionary lookup.  The cache is cleared by registrations with this function, with interfaces and of adapters.
+    """
+    registry = collections.OrderedDict()  # interface -> (implementation, adapt)
+    cache = {}  # id(argument type) -> function
+    type_refs = {}  # id(argument type) -> weakref that removes the cache entry when the type is collected
+
+    def dispatch(obj_type):
+        """ Returns the function called for arguments of type obj_type """
+        key = id(obj_type)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        function = _dispatch_function(registry, obj_type, func)
+
+        def forget(ref, key=key):
+            cache.pop(key, None)
+            type_refs.pop(key, None)
+        type_refs[key] = weakref.ref(obj_type, forget)
+        cache[key] = function
+        return function
+
+    def register(interface, implementation=None, adapt=False):
+        """ Registers implementation for arguments providing interface.
+        If adapt is True it is also used for arguments that can be adapted to interface, with the adapted argument.
+        Can be used as a decorator if implementation is not given.
+        """
+        interface = _as_interface(interface)
+        if not type_is_pure_interface(interface):
+            raise ValueError('{} is not an interface'.format(interface))
+        if interface is PureInterface:
+            raise ValueError('PureInterface cannot be registered, {} is called for arguments that provide no '
+                             'registered interface'.format(func.__name__))
+        if implementation is None:
+            return lambda f: register(interface, f, adapt)
+        registry[interface] = (implementation, adapt)
+        cache_clear()
+        return implementation
+
+    def cache_clear():
+        cache.clear()
+        type_refs.clear()
+
+    @six.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not args:
+            raise TypeError('{} requires at least 1 positional argument'.format(func.__name__))
+        try:
+            function = cache[id(type(args[0]))]
+        except KeyError:
+            function = dispatch(type(args[0]))
+        return function(*args, **kwargs)
+
+    wrapper.register = register
+    wrapper.dispatch = dispatch
+    wrapper.cache_clear = cache_clear
+    _dispatchers.add(wrapper)
+    return wrapper
+
+
+def set_argument_validation(interface, enabled):
+    # type: (Type[PureInterface], bool) -> None
+    """ Turns the checking of arguments and return values against the annotations of interface methods on or off.
+    The interface must declare pi_validate_arguments as implementation methods are only replaced with validating
+    methods for interfaces that declare it.
+    """
+    if not type_is_pure_interface(interface):
+        raise ValueError('{} is not an interface'.format(interface.__name__))
+    if interface._pi.validate_arguments is None:
+        raise ValueError('{} does not declare pi_validate_arguments'.format(interface.__name__))
+    interface._pi.validate_arguments = bool(enabled)
+
+
+def enable_stats(enabled=True):
+    # type: (bool) -> None
+    """ Turns the collection of usage statistics on or off.  Turning statistics off discards the counters.
+    Statistics can also be enabled by setting the PURE_INTERFACE_STATS environment variable to 1.
+    """
+    global _stats
+    if not enabled:
+        _stats = None
+        _clear_instance_counts()
+    elif _stats is None:
+        _stats = _Statistics()
+
+
+def stats():
+    # type: () -> dict
+    """ Returns a snapshot of the usage statistics as a dictionary.  All counters are zero if statistics are disabled.
+    """
+    return (_stats or _Statistics()).snapshot()
+
+
+def reset_stats():
+    # type: () -> None
+    """ Sets all the usage statistics counters to zero """
+    global _stats
+    if _stats is not None:
+        _stats = _Statistics()
+        _clear_instance_counts()
+
+
+def subscribe(event_type, listener, asynchronous=False):
+    # type: (type, Callable[[Any], None], bool) -> None
+    """ Calls listener with an event_type record each time that event happens.
+    event_type is one of the types in EVENT_TYPES.
+    If asynchronous is True events are queued and delivered to listener on a background thread so a slow
+    listener does not hold up the code raising the event.  Exceptions raised by listeners do not propagate,
+    they are issued as a RuntimeWarning, or printed for asynchronous listeners.
+    """
+    if event_type not in EVENT_TYPES:
+        raise ValueError('Unknown event type {}'.format(event_type))
+    deliver = _queued_listener(listener) if asynchronous else listener
+    _subscriptions.setdefault(event_type, []).append((listener, deliver))
+    _listeners[event_type] = tuple(deliver for _, deliver in _subscriptions[event_type])
+
+
+def unsubscribe(event_type, listener):
+    # type: (type, Callable[[Any], None]) -> None
+    """ Stops calling listener for event_type events.  Raises ValueError if listener is not subscribed. """
+    subscriptions = _subscriptions.get(event_type, [])
+    for i, (subscribed, _) in enumerate(subscriptions):
+        if subscribed == listener:
+            del subscriptions[i]
+            break
+    else:
+        raise ValueError('{} is not subscribed to {} events'.format(listener, event_type.__name__))
+    if subscriptions:
+        _listeners[event_type] = tuple(deliver for _, deliver in subscriptions)
+    else:
+        _listeners.pop(event_type, None)
+
+
+def flush_events():
+    # type: () -> None
+    """ Waits until all queued events have been delivered to asynchronous listeners """
+    if _event_queue is not None:
+        _event_queue.join()
+
+
+def unwrap(obj):
+    # type: (Any) -> Any
+    """ Returns the implementation wrapped by an interface_only or adapt_all wrapper, or obj if it is not a wrapper.
+    adapt_all wrappers around several different objects are returned unchanged.
+    """
+    if isinstance(obj, _ImplementationWrapper):
+        return obj._ImplementationWrapper__impl
+    if isinstance(obj, _CompositeWrapper):
+        first = obj._pi_impls[0]
+        if all(implementation is first for implementation in obj._pi_impls):
+            return first
+    return obj
+
+
+def type_is_pure_interface(cls):
+    # type: (Type[Any]) -> bool
+    """ Return True if cls is a pure interface"""
+    try:
+        if not issubclass(cls, PureInterface):
+            return False
+    except TypeError:  # handle non-classes
+        return False
+    return _get_pi_attribute(cls, 'type_is_pure_interface', False)
+
+
+def get_type_interfaces(cls):
+    # type: (Type[Any]) -> List[Type[PureInterface]]
+    """ Returns all interfaces in the cls mro including cls itself if it is an interface """
+    # only classes created by PureInterfaceType can have interfaces in their MRO.
+    if isinstance(cls, PureInterfaceType):
+        return list(cls._pi.type_interfaces)
+    return []
+
+
+def implementations_of(interface, include_structural=False):
+    # type: (Type[PureInterface], bool) -> FrozenSet[Type[Any]]
+    """ Returns a frozen set of the live classes that inherit from or are registered with the interface.
+    If include_structural is True then classes found to provide the interface by structural type checks are included.
+    if interface is not a PureInterface subtype then an empty set is returned
+    """
+    if not type_is_pure_interface(interface):
+        return frozenset()
+    implementations = frozenset(interface._pi.implementations)
+    if include_structural:
+        implementations = implementations.union(interface._pi.structural_subclasses)
+    return implementations
+
+
+def get_interface_method_names(interface):
+    # type: (Type[PureInterface]) -> FrozenSet[str]
+    """ returns a frozen set of names of methods defined by the interface.
+    if interface is not a PureInterface subtype then an empty set is returned
+    """
+    if type_is_pure_interface(interface):
+        return _get_pi_attribute(interface, 'interface_method_names')
+    else:
+        return frozenset()
+
+
+def get_interface_property_names(interface):
+    # type: (Type[PureInterface]) -> FrozenSet[str]
+    """ returns a frozen set of names of properties defined by the interface
+    if interface is not a PureInterface subtype then an empty set is returned
+    """
+    if type_is_pure_interface(interface):
+        return _get_pi_attribute(interface, 'interface_property_names')
+    else:
+        return frozenset()
+
+
+def get_interface_attribute_names(interface):
+    # type: (Type[PureInterface]) -> FrozenSet[str]
+    """ returns a frozen set of names of attributes defined by the interface
+    if interface is not a PureInterface subtype then an empty set is returned
+    """
+    if type_is_pure_interface(interface):
+        return _get_pi_attribute(interface, 'interface_attribute_names')
+    else:
+        return frozenset()
+
+
+def get_interface_properties_and_attribute_names(interface):
+    # type: (Type[PureInterface]) -> FrozenSet[str]
+    """ returns a frozen set of names of properties or attributes defined by the interface
+    if interface is not a PureInterface subtype then an empty set is returned
+    """
+    if type_is_pure_interface(interface):
+        return _get_pi_attribute(interface, 'props_and_attrs')
+    else:
+        return frozenset()
+
+
+def _hierarchy_id(interface):
+    if not type_is_pure_interface(interface) or interface is PureInterface:
+        raise ValueError('{} is not an interface'.format(interface))
+    return interface._pi.hierarchy_id
+
+
+def is_interface_ancestor(ancestor, interface):
+    # type: (Type[PureInterface], Type[PureInterface]) -> bool
+    """ Returns True if ancestor is a base interface (directly or indirectly) of interface """
+    ancestor_id = _hierarchy_id(ancestor)
+    interface_id = _hierarchy_id(interface)
+    return ancestor_id != interface_id and ancestor_id in _hierarchy.ancestors[interface_id]
+
+
+def get_interface_ancestors(interface):
+    # type: (Type[PureInterface]) -> List[Type[PureInterface]]
+    """ Returns all base interfaces (direct and indirect) of interface in creation order """
+    interface_id = _hierarchy_id(interface)
+    return _hierarchy.resolve(_hierarchy.ancestors[interface_id] - {interface_id})
+
+
+def get_interface_descendants(interface):
+    # type: (Type[PureInterface]) -> List[Type[PureInterface]]
+    """ Returns all interfaces derived (directly or indirectly) from interface in creation order """
+    interface_id = _hierarchy_id(interface)
+    return _hierarchy.resolve(_hierarchy.descendants[interface_id] - {interface_id})
+
+
+def least_common_interfaces(types):
+    # type: (Iterable[Type[Any]]) -> List[Type[PureInterface]]
+    """ Returns the most derived interfaces provided by all of types.
+    There may be more than one if the common interfaces do not form a single inheritance chain.
+    """
+    common = None
+    for cls in types:
+        ids = _hierarchy.type_ids(cls)
+        common = ids if common is None else common & ids
+        if not common:
+            return []
+    if not common:
+        return []
+    # an interface is least if none of its descendants are also common
+    least = [i for i in common if len(_hierarchy.descendants[i] & common) == 1]
+    return _hierarchy.resolve(least)
+
+
+MEMORY_CATEGORIES = ('metadata', 'signatures', 'adapter_tables', 'structural_caches', 'wrappers',
+                     'attribute_properties')
+
+
+def export_interface_hierarchy(format='json'):
+    # type: (str) -> str
+    """ Returns the interface hierarchy as a JSON or DOT (graphviz) string.
+    Edges point from an interface to its direct base interfaces.
+    """
+    from pure_interface import _diagnostics
+    return _diagnostics.export_interface_hierarchy(format)
+
+
+def memory_report(top=10):
+    # type: (int) -> dict
+    """ Returns a report of the memory used by pure_interface for every live class created by PureInterfaceType.
+    The report is a dictionary with these entries:
+        total: total bytes
+        categories: bytes for each of MEMORY_CATEGORIES over all classes
+        classes: number of classes
+        interfaces: 'module.name' -> bytes for each category, the total and the count of interfaces with that name
+        global: bytes used by module level registries
+        top: the top consumers, a list of (total bytes, 'module.name') for the largest classes
+    Sizes are measured with sys.getsizeof and include the containers owned by pure_interface but not the
+    classes, functions and strings they refer to.
+    """
+    from pure_interface import _diagnostics
+    return _diagnostics.memory_report(top)
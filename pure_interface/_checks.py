@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+"""
+Development checks: empty function body detection, signature comparison and warning stack levels.
+This module is only imported when a check is first needed.  Interface bodies are checked outside strip mode even
+when is_development is False, so inspect is only imported by the signature and stack level functions.
+"""
+from __future__ import division, print_function, absolute_import
+
+import collections
+import dis
+import types
+
+import six
+
+from pure_interface import ArgSpec, InterfaceError, _is_descriptor
+
+MYPY = False
+if MYPY:
+    from typing import List, Tuple
+
+if six.PY2:
+    _six_ord = ord
+
+    def getargspec(func):
+        import inspect
+        return ArgSpec(*inspect.getargspec(func))
+else:
+    _six_ord = lambda x: x
+
+    def getargspec(func):
+        # getargspec is deprecated, but getfullargspec is not a drop-in replacement as advertised
+        # as the keywords attribute has been renamed
+        import inspect
+        full_spec = inspect.getfullargspec(func)
+        return ArgSpec(*full_spec[:4])
+
+
+def _unwrap_function(func):
+    """ Look for decorated functions and return the wrapped function.
+    """
+    while hasattr(func, '__wrapped__'):
+        func = func.__wrapped__
+    return func
+
+
+def _is_empty_function(func, unwrap=False):
+    """ Return True if func is considered empty.
+     All functions with no return statement have an implicit return None - this is explicit in the code object.
+    """
+    if isinstance(func, (staticmethod, classmethod, types.MethodType)):
+        func = six.get_method_function(func)
+    if isinstance(func, property):
+        func = property.fget
+    if unwrap:
+        func = _unwrap_function(func)
+    try:
+        code_obj = six.get_function_code(func)
+    except AttributeError:
+        # This callable is something else - assume it is OK.
+        return True
+
+    # quick check
+    if code_obj.co_code == b'd\x00\x00S' and code_obj.co_consts[0] is None:
+        return True
+    if code_obj.co_code == b'd\x01\x00S' and code_obj.co_consts[1] is None:
+        return True
+    # convert bytes to instructions
+    instructions = _get_instructions(code_obj)
+    if len(instructions) < 2:
+        return True  # this never happens as there is always the implicit return None which is 2 instructions
+    assert instructions[-1].opname == 'RETURN_VALUE'  # returns TOS (top of stack)
+    instruction = instructions[-2]
+    if not (instruction.opname == 'LOAD_CONST' and code_obj.co_consts[instruction.arg] is None):  # TOS is None
+        return False  # return is not None
+    instructions = instructions[:-2]
+    if len(instructions) == 0:
+        return True
+    # look for raise NotImplementedError
+    if instructions[-1].opname == 'RAISE_VARARGS':
+        # the thing we are raising should be the result of __call__  (instantiating exception object)
+        if instructions[-2].opname == 'CALL_FUNCTION':
+            for instr in instructions[:-2]:
+                if instr.opname == 'LOAD_GLOBAL' and code_obj.co_names[instr.arg] == 'NotImplementedError':
+                    return True
+
+    return False
+
+
+_Instruction = collections.namedtuple('_Instruction', ('opcode', 'opname', 'arg', 'argval'))
+
+
+def _get_instructions(code_obj):
+    if hasattr(dis, 'get_instructions'):
+        return list(dis.get_instructions(code_obj))
+
+    instructions = []
+    instruction = None
+    for byte in code_obj.co_code:
+        byte = _six_ord(byte)
+        if instruction is None:
+            instruction = [byte]
+        else:
+            instruction.append(byte)
+        if instruction[0] < dis.HAVE_ARGUMENT or len(instruction) == 3:
+            op_code = instruction[0]
+            op_name = dis.opname[op_code]
+            if instruction[0] < dis.HAVE_ARGUMENT:
+                instructions.append(_Instruction(op_code, op_name, None, None))
+            else:
+                arg = instruction[1]
+                instructions.append(_Instruction(op_code, op_name, arg, arg))
+            instruction = None
+    return instructions
+
+
+def _signature_info(arg_spec):
+    # type: (ArgSpec) -> Tuple[List[str], List[str], bool, bool]
+    """ returns (req_args, def_args, has_varargs, has_keywords)"""
+    if arg_spec.defaults:
+        n_defaults = len(arg_spec.defaults)
+        def_args = arg_spec.args[-n_defaults:]
+        req_args = arg_spec.args[:-n_defaults]
+    else:
+        req_args = arg_spec.args
+        def_args = []
+    return req_args, def_args, bool(arg_spec.varargs), bool(arg_spec.keywords)
+
+
+def _signatures_are_consistent(func_sig, base_sig):
+    # type: (ArgSpec, ArgSpec) -> bool
+    """
+    :param func_sig: ArgSpec named tuple for overriding function
+    :param base_sig: ArgSpec named tuple for base class function
+    :return: True if signatures are consistent.
+    """
+    base_required_args, base_default_args, base_varargs, base_keywords = _signature_info(base_sig)
+    func_required_args, func_default_args, func_varargs, func_keywords = _signature_info(func_sig)
+    if func_varargs:
+        shortest_len = min(len(base_required_args), len(func_required_args))
+        req_names_match = func_required_args[:shortest_len] == base_required_args[:shortest_len]
+    else:
+        # (a, b, c) can be overridden with (a, b, c=0) so need to check entire args sequence here
+        req_names_match = func_sig.args[:len(base_required_args)] == base_required_args
+    no_new_required_args = len(func_required_args) <= len(base_required_args)
+    if func_keywords:
+        def_names_match = True
+    else:
+        def_names_match = func_default_args[:len(base_default_args)] == base_default_args
+    if base_default_args and func_varargs:
+        # need to check that we don't have multiple values for keyword arguments
+        # e.g. base(a, b, c=None)  func(a, c=4, *args)
+        # base can be called with (a, b, c) but func cannot.
+        for arg in func_default_args:
+            if arg in base_sig.args:
+                base_index = base_sig.args.index(arg)
+                func_index = func_sig.args.index(arg)
+                if base_index != func_index:
+                    def_names_match = False
+                    break
+    varargs_ok = True
+    if base_varargs:
+        varargs_ok = func_varargs
+    if base_keywords:
+        varargs_ok &= func_keywords
+    return req_names_match and def_names_match and no_new_required_args and varargs_ok
+
+
+def _check_method_signatures(attributes, clsname, interface_method_signatures):
+    """ Scan attributes dict for interface method overrides and check the function signatures are consistent """
+    for name, base_sig in interface_method_signatures.items():
+        if name not in attributes:
+            continue
+        value = attributes[name]
+        if not isinstance(value, (staticmethod, classmethod, types.FunctionType)):
+            if _is_descriptor(value):
+                continue
+            else:
+                raise InterfaceError('Interface method over-ridden with non-method')
+        if isinstance(value, (staticmethod, classmethod)):
+            func = value.__func__
+        else:
+            func = value
+        func_sig = getargspec(func)
+        if not _signatures_are_consistent(func_sig, base_sig):
+            msg = '{module}.{clsname}.{name} argments does not match base class'.format(
+                module=attributes['__module__'], clsname=clsname, name=name)
+            raise InterfaceError(msg)
+
+
+def _outside_stacklevel(stack, stacklevel):
+    """ Returns the first stack level from stacklevel that is outside the pure_interface package """
+    while stacklevel < len(stack) and 'pure_interface' in stack[stacklevel][1]:
+        stacklevel += 1
+    return stacklevel
+
+
+def incomplete_implementation_stacklevel():
+    """ Returns the warnings stack level for an incomplete implementation warning issued by PureInterfaceType.__new__ """
+    import inspect
+    stack = inspect.stack()[1:]  # so that stack[0] is PureInterfaceType.__new__
+    stacklevel = _outside_stacklevel(stack, 2)
+    # add extra levels for sub-meta-classes
+    stack.pop(0)
+    while stack and stack[0][0].f_code.co_name == '__new__':
+        stacklevel += 1
+        stack.pop(0)
+    return stacklevel
+
+
+def structural_warning_stacklevel():
+    """ Returns the warnings stack level for a structural type check warning """
+    import inspect
+    return _outside_stacklevel(inspect.stack()[1:], 2)
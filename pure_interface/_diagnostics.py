@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""
+Diagnostics: interface hierarchy export and memory reports.
+This module is only imported when one of these is first asked for.
+"""
+from __future__ import division, print_function, absolute_import
+
+import json
+import sys
+import weakref
+
+import pure_interface
+from pure_interface import (MEMORY_CATEGORIES, AttributeProperty, _AdapterRegistration, _composite_wrapper_types,
+                            _hierarchy, _pure_interface_types, _signature_cache)
+
+
+def export_interface_hierarchy(format='json'):
+    nodes = []
+    edges = []
+    for i, ref in sorted(_hierarchy.interfaces.items()):
+        interface = ref()
+        if interface is None:
+            continue
+        nodes.append((i, '{}.{}'.format(interface.__module__, interface.__name__)))
+        edges.extend((i, parent) for parent in _hierarchy.parents[i])
+    live = set(i for i, name in nodes)
+    edges = [(child, parent) for child, parent in edges if parent in live]
+    if format == 'json':
+        return json.dumps({'nodes': [{'id': i, 'name': name} for i, name in nodes],
+                           'edges': [{'source': child, 'target': parent} for child, parent in edges]})
+    if format == 'dot':
+        lines = ['digraph interfaces {']
+        lines.extend('    n{} [label="{}"];'.format(i, name) for i, name in nodes)
+        lines.extend('    n{} -> n{};'.format(child, parent) for child, parent in edges)
+        lines.append('}')
+        return '\n'.join(lines)
+    raise ValueError('Unknown format {!r}, expected "json" or "dot"'.format(format))
+
+
+def _container_size(obj):
+    """ Returns the size of obj and of the containers and records it contains.
+    Classes, functions and strings are shared with the rest of the program so are not counted.
+    """
+    if isinstance(obj, (weakref.WeakKeyDictionary, weakref.WeakValueDictionary, weakref.WeakSet)):
+        return sys.getsizeof(obj) + _container_size(obj.data)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(key, tuple):
+                size += _container_size(key)
+            size += _container_size(value) if isinstance(value, (tuple, list, set, frozenset, dict)) else 0
+    elif isinstance(obj, (tuple, list, set, frozenset)):
+        for item in obj:
+            if isinstance(item, (tuple, list, set, frozenset, dict)):
+                size += _container_size(item)
+            elif isinstance(item, _AdapterRegistration):
+                size += sys.getsizeof(item)
+    return size
+
+
+def _class_memory(cls):
+    """ Returns a dictionary of category -> bytes used by pure_interface for cls """
+    pi = cls._pi
+    sizes = dict.fromkeys(MEMORY_CATEGORIES, 0)
+    sizes['metadata'] = (sys.getsizeof(pi) + sys.getsizeof(pi.__dict__) + _container_size(pi.abstractproperties) +
+                         _container_size(pi.interface_method_names) + _container_size(pi.interface_property_names) +
+                         _container_size(pi.interface_attribute_names) + _container_size(pi.type_interfaces))
+    if pi.argument_checks:
+        sizes['metadata'] += _container_size(pi.argument_checks)
+    sizes['metadata'] += _container_size(pi.interface_method_functions)
+    if pi._interface_method_signatures is not None:
+        sizes['signatures'] = _container_size(pi._interface_method_signatures)
+    if pi.type_is_pure_interface:
+        sizes['structural_caches'] = _container_size(pi.structural_subclasses)
+        sizes['metadata'] += _container_size(pi.implementations)
+        if pi.implementation_properties is not None:
+            sizes['metadata'] += _container_size(pi.implementation_properties)
+        if pi.verified_signatures is not None:
+            sizes['signatures'] += _container_size(pi.verified_signatures)
+        sizes['adapter_tables'] = (_container_size(pi.adapters) + _container_size(pi.adapter_table) +
+                                   _container_size(pi.verified_results))
+        sizes['wrappers'] = _container_size(pi.wrappers)
+        sizes['wrappers'] += sum(sys.getsizeof(wrapper) for wrapper in list(pi.wrappers.values()))
+        if pi.impl_wrapper_type is not None:
+            sizes['wrappers'] += sys.getsizeof(pi.impl_wrapper_type)
+    sizes['attribute_properties'] = sum(sys.getsizeof(value) for value in cls.__dict__.values()
+                                        if isinstance(value, AttributeProperty))
+    return sizes
+
+
+def memory_report(top):
+    categories = dict.fromkeys(MEMORY_CATEGORIES, 0)
+    interfaces = {}
+    consumers = []
+    classes = list(_pure_interface_types)
+    for cls in classes:
+        sizes = _class_memory(cls)
+        total = sum(sizes.values())
+        name = '{}.{}'.format(cls.__module__, cls.__name__)
+        for category, size in sizes.items():
+            categories[category] += size
+        if cls._pi.type_is_pure_interface:
+            # interfaces with the same name are added together, a growing count may point to a leak
+            entry = interfaces.setdefault(name, dict.fromkeys(MEMORY_CATEGORIES + ('total', 'count'), 0))
+            for category, size in sizes.items():
+                entry[category] += size
+            entry['total'] += total
+            entry['count'] += 1
+        consumers.append((total, name))
+    global_sizes = {
+        'hierarchy': (_container_size(_hierarchy.interfaces) + _container_size(_hierarchy.parents) +
+                      _container_size(_hierarchy.ancestors) + _container_size(_hierarchy.descendants)),
+        'composite_wrapper_types': (_container_size(_composite_wrapper_types) +
+                                    sum(sys.getsizeof(t) for t in _composite_wrapper_types.values())),
+        'class_registry': _container_size(_pure_interface_types),
+        'signature_cache': _container_size(_signature_cache),
+        'missing_method_warnings': _container_size(pure_interface.missing_method_warnings),
+    }
+    consumers.sort(key=lambda consumer: -consumer[0])
+    return {
+        'total': sum(categories.values()) + sum(global_sizes.values()),
+        'categories': categories,
+        'classes': len(classes),
+        'interfaces': interfaces,
+        'global': global_sizes,
+        'top': consumers[:top],
+    }
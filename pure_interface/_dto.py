@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+Generation of data transfer object implementations of interfaces without methods, see PureInterface.make_dto.
+This module is only imported when the first DTO type is made.
+"""
+from __future__ import division, print_function, absolute_import
+
+import keyword
+import operator
+import re
+
+import six
+
+from pure_interface import get_interface_properties_and_attribute_names
+
+
+# names used by the generated __init__ itself, these cannot also be argument names
+_RESERVED_NAMES = frozenset(('_pi_self', '_pi_setattr'))
+_IDENTIFIER = re.compile(r'[A-Za-z_][A-Za-z0-9_]*\Z')
+
+
+def _is_identifier(name):
+    if six.PY3:
+        return name.isidentifier()
+    return _IDENTIFIER.match(name) is not None
+
+
+def _check_argument_names(interface, names):
+    """ Raises ValueError if one of names cannot be an argument of the generated __init__ """
+    for name in names:
+        if name in _RESERVED_NAMES or keyword.iskeyword(name) or not _is_identifier(name):
+            raise ValueError('make_dto() cannot use {} attribute {!r} as an argument name'.format(interface.__name__,
+                                                                                                name))
+
+
+def _values_getter(names):
+    """ Returns a function that returns the values of names on an object as a tuple """
+    if not names:
+        return lambda obj: ()
+    if len(names) == 1:
+        getter = operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return operator.attrgetter(*names)
+
+
+def _init_source(names, frozen):
+    """ Returns the source of an __init__ that sets every name from an argument of the same name.
+    The instance argument has a reserved name so that an interface attribute can be called self.
+    Frozen objects cannot use setattr so the slots are set with object.__setattr__.
+    """
+    lines = ['def __init__(_pi_self{}):'.format(''.join(', ' + name for name in names))]
+    for name in names:
+        if frozen:
+            lines.append('    _pi_setattr(_pi_self, {!r}, {})'.format(name, name))
+        else:
+            lines.append('    _pi_self.{0} = {0}'.format(name))
+    if not names:
+        lines.append('    pass')
+    return '\n'.join(lines)
+
+
+def _reconstruct(interface, frozen, values):
+    """ Recreates a pickled DTO, the generated type is found through its interface as it is not a module global """
+    return interface.make_dto(frozen)(*values)
+
+
+def make_dto_type(interface, frozen):
+    """ Returns a new slotted class with a slot for each of the properties and attributes of interface.
+    The class does not inherit the interface, so that its instances have no __dict__, but is registered with it.
+    """
+    if interface._pi.interface_method_names:
+        names = ', '.join(sorted(interface._pi.interface_method_names))
+        raise ValueError('make_dto() requires an interface without methods, {} has {}'.format(interface.__name__,
+                                                                                               names))
+    names = tuple(sorted(get_interface_properties_and_attribute_names(interface)))
+    _check_argument_names(interface, names)
+    values = _values_getter(names)
+    type_name = interface.__name__ + ('FrozenDTO' if frozen else 'DTO')
+
+    namespace = {'_pi_setattr': object.__setattr__}
+    six.exec_(compile(_init_source(names, frozen), '<make_dto {}>'.format(type_name), 'exec'), namespace)
+
+    def __repr__(self):
+        arguments = ', '.join('{}={!r}'.format(name, value) for name, value in zip(names, values(self)))
+        return '{}({})'.format(type(self).__name__, arguments)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return values(self) == values(other)
+
+    def __ne__(self, other):
+        equal = __eq__(self, other)
+        return equal if equal is NotImplemented else not equal
+
+    def __reduce__(self):
+        return _reconstruct, (interface, frozen, values(self))
+
+    attributes = {
+        '__module__': interface.__module__,
+        '__doc__': 'Data transfer object generated by {}.make_dto()'.format(interface.__name__),
+        '__slots__': names,
+        '__init__': namespace['__init__'],
+        '__repr__': __repr__,
+        '__eq__': __eq__,
+        '__ne__': __ne__,
+        '__reduce__': __reduce__,
+        '__hash__': None,
+    }
+    if frozen:
+        def __setattr__(self, name, value):
+            raise AttributeError("'{}' object is read-only".format(type(self).__name__))
+
+        def __delattr__(self, name):
+            raise AttributeError("'{}' object is read-only".format(type(self).__name__))
+
+        def __hash__(self):
+            return hash(values(self))
+
+        attributes['__setattr__'] = __setattr__
+        attributes['__delattr__'] = __delattr__
+        attributes['__hash__'] = __hash__
+    dto_type = type(str(type_name), (object,), attributes)
+    interface.register(dto_type)
+    return dto_type
@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Checking of arguments and return values against the annotations of interface methods, see set_argument_validation.
+This module is only imported when an implementation of an interface declaring pi_validate_arguments is created.
+"""
+from __future__ import division, print_function, absolute_import
+
+import functools
+import inspect
+import types
+from typing import Any, Union
+
+import six
+
+from pure_interface import PureInterfaceType
+
+
+_numeric_annotations = {float: (float,) + six.integer_types,
+                        complex: (complex, float) + six.integer_types}
+
+
+def _annotation_check(annotation, value_name, namespace):
+    """ Returns the source of an expression that is True when value_name matches annotation.
+    Objects used by the expression are added to namespace.
+    Returns None if the annotation cannot be checked at runtime (e.g. Any, TypeVars or forward references).
+    """
+    if annotation is None or annotation is type(None):
+        return '{} is None'.format(value_name)
+    if annotation is Any or annotation is object:
+        return None
+    origin = getattr(annotation, '__origin__', None)
+    if origin is Union or isinstance(annotation, tuple):
+        members = annotation.__args__ if origin is Union else annotation
+        checks = [_annotation_check(member, value_name, namespace) for member in members]
+        if not checks or None in checks:
+            return None
+        return '(' + ' or '.join(checks) + ')'
+    if origin is not None:  # a parameterised generic such as List[int], only the container type is checked
+        annotation = getattr(annotation, '__extra__', None) or origin
+    if not isinstance(annotation, type):
+        return None
+    name = '_pi_t{}'.format(len(namespace))
+    if isinstance(annotation, PureInterfaceType) and annotation._pi.type_is_pure_interface:
+        namespace[name] = annotation
+        return '(isinstance({1}, {0}) or {0}.provided_by({1}))'.format(name, value_name)
+    namespace[name] = _numeric_annotations.get(annotation, annotation)
+    return 'isinstance({}, {})'.format(value_name, name)
+
+
+def _annotation_name(annotation):
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return repr(annotation)
+
+
+def _argument_type_error(interface, func_name, arg_name, value, annotation):
+    raise TypeError('{}.{}() argument "{}" must be {}, not {}'.format(
+        interface.__name__, func_name, arg_name, _annotation_name(annotation), type(value).__name__))
+
+
+def _return_type_error(interface, func_name, value, annotation):
+    raise TypeError('{}.{}() must return {}, not {}'.format(
+        interface.__name__, func_name, _annotation_name(annotation), type(value).__name__))
+
+
+def _get_argument_checks(interface, name):
+    """ Returns (checks, namespace) for the annotations of the interface method name.
+    checks maps argument names (and 'return') to check expressions and is computed once per interface method.
+    """
+    try:
+        return interface._pi.argument_checks[name]
+    except KeyError:
+        pass
+    func = interface.__dict__[name]
+    annotations = getattr(func, '__annotations__', None) or {}
+    checks = {}
+    namespace = {}
+    for arg_name, annotation in annotations.items():
+        value_name = '_pi_result' if arg_name == 'return' else arg_name
+        check = _annotation_check(annotation, value_name, namespace)
+        if check is not None:
+            annotation_name = '_pi_a{}'.format(len(namespace))
+            namespace[annotation_name] = annotation
+            checks[arg_name] = (check, annotation_name)
+    result = interface._pi.argument_checks[name] = (checks, namespace)
+    return result
+
+
+if six.PY2:
+    def _full_argspec(func):
+        spec = inspect.getargspec(func)
+        return spec.args, spec.varargs, spec.keywords, spec.defaults or (), [], {}
+else:
+    def _full_argspec(func):
+        spec = inspect.getfullargspec(func)
+        return spec.args, spec.varargs, spec.varkw, spec.defaults or (), spec.kwonlyargs, spec.kwonlydefaults or {}
+
+
+def _validated_method(func, interface, name):
+    """ Returns a function with the same signature as func that checks its arguments and return value against the
+    annotations of the interface method name when interface._pi.validate_arguments is True.
+    Returns None if there is nothing to check.
+    """
+    checks, check_namespace = _get_argument_checks(interface, name)
+    args, varargs, varkw, defaults, kwonlyargs, kwonlydefaults = _full_argspec(func)
+    all_args = list(args) + list(kwonlyargs)
+    if not checks or any(arg.startswith('_pi_') for arg in all_args):
+        return None
+    namespace = dict(check_namespace)
+    namespace.update(_pi_func=func, _pi_attributes=interface._pi, _pi_interface=interface,
+                     _pi_argument_error=_argument_type_error, _pi_return_error=_return_type_error)
+    params = []
+    first_default = len(args) - len(defaults)
+    for i, arg in enumerate(args):
+        if i >= first_default:
+            namespace['_pi_d{}'.format(i)] = defaults[i - first_default]
+            params.append('{0}=_pi_d{1}'.format(arg, i))
+        else:
+            params.append(arg)
+    call_args = list(args)
+    if varargs:
+        params.append('*' + varargs)
+        call_args.append('*' + varargs)
+    elif kwonlyargs:
+        params.append('*')
+    for arg in kwonlyargs:
+        if arg in kwonlydefaults:
+            namespace['_pi_k_' + arg] = kwonlydefaults[arg]
+            params.append('{0}=_pi_k_{0}'.format(arg))
+        else:
+            params.append(arg)
+        call_args.append('{0}={0}'.format(arg))
+    if varkw:
+        params.append('**' + varkw)
+        call_args.append('**' + varkw)
+    call = '_pi_func({})'.format(', '.join(call_args))
+    none_defaults = set(args[first_default:][i] for i, value in enumerate(defaults) if value is None)
+    none_defaults.update(arg for arg, value in kwonlydefaults.items() if value is None)
+
+    lines = ['def _pi_validated({}):'.format(', '.join(params)),
+             '    if _pi_attributes.validate_arguments:']
+    for arg in all_args:
+        if arg not in checks:
+            continue
+        check, annotation_name = checks[arg]
+        if arg in none_defaults:
+            check = '{} is None or {}'.format(arg, check)
+        lines.append('        if not ({}):'.format(check))
+        lines.append('            _pi_argument_error(_pi_interface, {!r}, {!r}, {}, {})'.format(
+            name, arg, arg, annotation_name))
+    if 'return' in checks:
+        check, annotation_name = checks['return']
+        lines.append('        _pi_result = {}'.format(call))
+        lines.append('        if not ({}):'.format(check))
+        lines.append('            _pi_return_error(_pi_interface, {!r}, _pi_result, {})'.format(name, annotation_name))
+        lines.append('        return _pi_result')
+    lines.append('    return {}'.format(call))
+    six.exec_('\n'.join(lines), namespace)
+    method = namespace['_pi_validated']
+    functools.update_wrapper(method, func)
+    method.__wrapped__ = func
+    method._pi_validates = name
+    return method
+
+
+def _install_argument_validators(cls):
+    """ Replaces the methods of cls that implement interface methods with annotations with validating methods """
+    seen = set()
+    for interface in cls._pi.type_interfaces:
+        if interface._pi.validate_arguments is None:
+            continue
+        for name, value in interface.__dict__.items():
+            if name in seen or not isinstance(value, types.FunctionType):
+                continue
+            seen.add(name)
+            for base in cls.__mro__:
+                if name in base.__dict__:
+                    func = base.__dict__[name]
+                    break
+            else:
+                continue
+            if not isinstance(func, types.FunctionType) or getattr(func, '_pi_validates', None) == name or \
+                    getattr(func, '__isabstractmethod__', False):
+                continue
+            method = _validated_method(func, interface, name)
+            if method is not None:
+                setattr(cls, name, method)
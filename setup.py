@@ -4,7 +4,8 @@ from setuptools import setup
 setup(
     name='pure_interface',
     version='3.1.1',
-    py_modules=['pure_interface', 'pure_contracts'],
+    packages=['pure_interface'],
+    py_modules=['pure_contracts'],
     url='https://github.com/aranzgeo/pure_interface',
     install_requires=['six', 'typing'],
     extras_require={'contracts': ['PyContracts>=1.7']},
@@ -3,6 +3,7 @@ from __future__ import absolute_import, division, print_function, unicode_litera
 
 import pure_interface
 
+import mock
 import unittest
 
 
@@ -281,6 +282,76 @@ class TestAdaptionToInterfaceOnly(unittest.TestCase):
         self.assertIsInstance(speaker, TalkerToSpeaker)
         self.assertIs(speaker._talker, a_talker)
 
+    def test_wrapper_is_slotted(self):
+        s = ITopicSpeaker.interface_only(TopicSpeaker('Python'))
+        self.assertFalse(hasattr(s, '__dict__'))
+        self.assertIn('topic', type(s).__dict__)
+        self.assertIn('speak', type(s).__dict__)
+
+    def test_wrapper_forwards_attribute_writes(self):
+        topic_speaker = TopicSpeaker('Python')
+        s = ITopicSpeaker.interface_only(topic_speaker)
+        s.topic = 'Interfaces'
+        self.assertEqual(topic_speaker.topic, 'Interfaces')
+        with self.assertRaises(AttributeError):
+            s.other = 'x'
+
+    def test_wrapper_missing_implementation_attribute(self):
+        class Incomplete(object):
+            pass
+
+        s = ITopicSpeaker.interface_only(Incomplete())
+        with self.assertRaises(AttributeError) as exc:
+            s.topic
+        self.assertIn('topic', str(exc.exception))
+
+    def test_wrapper_forwards_special_methods(self):
+        class ISized(pure_interface.PureInterface):
+            def __len__(self):
+                pass
+
+        class Sized(object):
+            def __len__(self):
+                return 3
+
+        s = ISized.interface_only(Sized())
+        self.assertEqual(len(s), 3)
+
+    def test_wrapper_keeps_its_own_init(self):
+        class IInit(pure_interface.PureInterface):
+            def __init__(self, x):
+                pass
+
+            def value(self):
+                pass
+
+        class Init(object):
+            def __init__(self, x):
+                self.x = x
+
+            def value(self):
+                return self.x
+
+        s = IInit.interface_only(Init(2))
+        self.assertEqual(s.value(), 2)
+        self.assertIs(IInit.adapt(s, interface_only=True), s)
+
+    def test_wrapper_forwarding_eq_is_hashable(self):
+        class IEqOnly(pure_interface.PureInterface):
+            def __eq__(self, other):
+                pass
+
+        class Eq(object):
+            def __eq__(self, other):
+                return True
+
+            def __hash__(self):
+                return 7
+
+        s = IEqOnly.interface_only(Eq())
+        self.assertEqual(hash(s), 7)
+        self.assertEqual({s: 1}[s], 1)
+
     def test_adapter_to_sub_interface_used(self):
         a_sleeper = Sleeper()
         speaker = ISpeaker.adapt_or_none(a_sleeper, interface_only=False)
@@ -310,3 +381,394 @@ class TestAdaptionToInterfaceOnly(unittest.TestCase):
         a = IA.adapt_or_none(4, interface_only=False)
         self.assertIsInstance(a, IntToA)
 
+
+class TestAdapterSelection(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pure_interface.is_development = True
+
+    def test_predicate_selects_adapter(self):
+        class IA(pure_interface.PureInterface):
+            foo = None
+
+        class Small(pure_interface.Concrete, IA):
+            def __init__(self, x):
+                self.foo = 'small'
+
+        class Large(pure_interface.Concrete, IA):
+            def __init__(self, x):
+                self.foo = 'large'
+
+        pure_interface.register_adapter(Large, int, IA, predicate=lambda x: x > 10000)
+        pure_interface.register_adapter(Small, int, IA)
+
+        self.assertEqual(IA.adapt(4, interface_only=False).foo, 'small')
+        self.assertEqual(IA.adapt(20000, interface_only=False).foo, 'large')
+
+    def test_failing_predicates_fall_through(self):
+        class IA(pure_interface.PureInterface):
+            foo = None
+
+        class Negative(pure_interface.Concrete, IA):
+            def __init__(self, x):
+                self.foo = x
+
+        pure_interface.register_adapter(Negative, int, IA, predicate=lambda x: x < 0)
+
+        self.assertIsInstance(IA.adapt(-1, interface_only=False), Negative)
+        self.assertIsNone(IA.adapt_or_none(1, interface_only=False))
+
+    def test_only_one_unconditional_adapter(self):
+        class IA(pure_interface.PureInterface):
+            foo = None
+
+        class IntToA(pure_interface.Concrete, IA):
+            def __init__(self, x):
+                self.foo = x
+
+        pure_interface.register_adapter(IntToA, int, IA)
+        pure_interface.register_adapter(IntToA, int, IA, predicate=lambda x: x > 3)
+        with self.assertRaises(ValueError):
+            pure_interface.register_adapter(IntToA, int, IA)
+        with self.assertRaises(ValueError):
+            pure_interface.register_adapter(IntToA, float, IA, predicate=5)
+
+    def test_priority_overrides_interface_preference(self):
+        class IA(pure_interface.PureInterface):
+            foo = None
+
+        class IB(IA):
+            bar = None
+
+        @pure_interface.adapts(int, priority=1)
+        class IntToB(pure_interface.Concrete, IB):
+            def __init__(self, x):
+                self.foo = self.bar = x
+
+        @pure_interface.adapts(int)
+        class IntToA(pure_interface.Concrete, IA):
+            def __init__(self, x):
+                self.foo = x
+
+        a = IA.adapt_or_none(4, interface_only=False)
+        self.assertIsInstance(a, IntToB)
+
+    def test_more_specific_from_type_preferred(self):
+        class IA(pure_interface.PureInterface):
+            foo = None
+
+        class Base(object):
+            pass
+
+        class Derived(Base):
+            pass
+
+        @pure_interface.adapts(Base, priority=10)
+        class BaseToA(pure_interface.Concrete, IA):
+            def __init__(self, x):
+                self.foo = x
+
+        @pure_interface.adapts(Derived)
+        class DerivedToA(pure_interface.Concrete, IA):
+            def __init__(self, x):
+                self.foo = x
+
+        self.assertIsInstance(IA.adapt(Derived(), interface_only=False), DerivedToA)
+        self.assertIsInstance(IA.adapt(Base(), interface_only=False), BaseToA)
+
+    def test_dispatch_table_invalidated_on_registration(self):
+        class IA(pure_interface.PureInterface):
+            foo = None
+
+        class IB(IA):
+            bar = None
+
+        self.assertIsNone(IA.adapt_or_none(4, interface_only=False))
+        self.assertIn(int, IA._pi.adapter_table)
+
+        @pure_interface.adapts(int)
+        class IntToB(pure_interface.Concrete, IB):
+            def __init__(self, x):
+                self.foo = self.bar = x
+
+        self.assertNotIn(int, IA._pi.adapter_table)
+        self.assertIsInstance(IA.adapt(4, interface_only=False), IntToB)
+
+
+class TestAdapterVerification(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pure_interface.is_development = True
+
+    def tearDown(self):
+        pure_interface.adapter_verification = pure_interface.ADAPTER_VERIFY_ALWAYS
+
+    def _make_adapter(self):
+        class IA(pure_interface.PureInterface):
+            def foo(self):
+                pass
+
+        class Good(pure_interface.Concrete, IA):
+            def foo(self):
+                return 1
+
+        class Bad(object):
+            pass
+
+        results = []
+
+        def adapter(x):
+            return results.pop(0)
+
+        pure_interface.register_adapter(adapter, int, IA)
+        return IA, Good, Bad, results, adapter
+
+    def test_verify_always(self):
+        IA, Good, Bad, results, adapter = self._make_adapter()
+        results.extend([Good(), Bad()])
+        IA.adapt(1, interface_only=False)
+        self.assertNotIn(Good, IA._pi.verified_results)
+        with self.assertRaises(ValueError):
+            IA.adapt(1, interface_only=False)
+
+    def test_verify_once_trusts_result_type(self):
+        pure_interface.adapter_verification = pure_interface.ADAPTER_VERIFY_ONCE
+        IA, Good, Bad, results, adapter = self._make_adapter()
+        results.extend([Good(), Good()])
+        IA.adapt(1, interface_only=False)
+        self.assertIn(Good, IA._pi.verified_results)
+        with mock.patch.object(IA, '_class_structural_type_check') as type_check:
+            with mock.patch.object(IA, 'provided_by', return_value=False):
+                IA.adapt(1, allow_implicit=True, interface_only=False)
+        type_check.assert_not_called()
+
+    def test_verify_once_checks_new_result_type(self):
+        pure_interface.adapter_verification = pure_interface.ADAPTER_VERIFY_ONCE
+        IA, Good, Bad, results, adapter = self._make_adapter()
+        results.extend([Good(), Bad()])
+        self.assertIsInstance(IA.adapt(1, interface_only=False), Good)
+        with self.assertRaises(ValueError):
+            IA.adapt(1, interface_only=False)
+
+    def test_verify_once_does_not_trust_instance_attributes(self):
+        pure_interface.adapter_verification = pure_interface.ADAPTER_VERIFY_ONCE
+
+        class IB(pure_interface.PureInterface):
+            foo = None
+
+        class DTO(object):
+            pass
+
+        results = [DTO(), DTO()]
+        results[0].foo = 1
+
+        def adapter(x):
+            return results.pop(0)
+
+        pure_interface.register_adapter(adapter, int, IB)
+        IB.adapt(1, allow_implicit=True, interface_only=False)
+        with self.assertRaises(ValueError):
+            IB.adapt(1, allow_implicit=True, interface_only=False)
+
+    def test_verify_never(self):
+        pure_interface.adapter_verification = pure_interface.ADAPTER_VERIFY_NEVER
+        IA, Good, Bad, results, adapter = self._make_adapter()
+        results.append(Bad())
+        self.assertIsInstance(IA.adapt(1, interface_only=False), Bad)
+
+
+class TestInterfaceOnlyReuse(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pure_interface.is_development = True
+
+    def test_same_implementation_reuses_wrapper(self):
+        topic_speaker = TopicSpeaker('Python')
+        s = ITopicSpeaker.interface_only(topic_speaker)
+        self.assertIs(s, ITopicSpeaker.interface_only(topic_speaker))
+        self.assertIs(s, ITopicSpeaker.adapt(topic_speaker))
+        self.assertIsNot(s, ITopicSpeaker.interface_only(TopicSpeaker('Python')))
+
+    def test_wrapping_wrapper_returns_it(self):
+        s = ISpeaker.interface_only(Speaker())
+        self.assertIs(s, ISpeaker.interface_only(s))
+        self.assertIs(s, ISpeaker.adapt(s))
+        self.assertIs(s, ISpeaker.adapt(s, interface_only=False))
+
+    def test_sub_interface_wrapper_is_rewrapped(self):
+        topic_speaker = TopicSpeaker('Python')
+        t = ITopicSpeaker.interface_only(topic_speaker)
+        s = ISpeaker.adapt(t)
+        self.assertIs(pure_interface.unwrap(s), topic_speaker)
+        self.assertNotIsInstance(s, ITopicSpeaker)
+        with self.assertRaises(AttributeError):
+            s.topic
+
+    def test_wrappers_are_not_kept_alive(self):
+        topic_speaker = TopicSpeaker('Python')
+        ITopicSpeaker.interface_only(topic_speaker)
+        self.assertNotIn(id(topic_speaker), ITopicSpeaker._pi.wrappers)
+
+    def test_unwrap(self):
+        topic_speaker = TopicSpeaker('Python')
+        self.assertIs(pure_interface.unwrap(ISpeaker.interface_only(topic_speaker)), topic_speaker)
+        self.assertIs(pure_interface.unwrap(topic_speaker), topic_speaker)
+
+
+class IReader(pure_interface.PureInterface):
+    def read(self):
+        pass
+
+
+class ISeekable(pure_interface.PureInterface):
+    position = None
+
+    def seek(self, position):
+        pass
+
+
+class IReadSeeker(IReader, ISeekable):
+    pass
+
+
+class File(object):
+    def __init__(self, text):
+        self.text = text
+
+
+class Stream(object):
+    def __init__(self, text):
+        self.text = text
+
+
+@pure_interface.adapts(File)
+class FileReadSeeker(pure_interface.Concrete, IReadSeeker):
+    def __init__(self, f):
+        self.text = f.text
+        self.position = 0
+
+    def read(self):
+        return self.text[self.position:]
+
+    def seek(self, position):
+        self.position = position
+
+
+@pure_interface.adapts(Stream)
+class StreamReader(pure_interface.Concrete, IReader):
+    def __init__(self, stream):
+        self.text = stream.text
+
+    def read(self):
+        return self.text
+
+
+@pure_interface.adapts(Stream)
+class StreamSeeker(pure_interface.Concrete, ISeekable):
+    def __init__(self, stream):
+        self.position = 0
+
+    def seek(self, position):
+        self.position = position
+
+
+class TestAdaptAll(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pure_interface.is_development = True
+
+    def test_common_adapter_called_once(self):
+        class Document(object):
+            text = 'hello'
+
+        calls = []
+
+        @pure_interface.adapts(Document, IReadSeeker)
+        def document_to_read_seeker(document):
+            calls.append(document)
+            return FileReadSeeker(document)
+
+        r = pure_interface.adapt_all(Document(), [IReader, ISeekable], interface_only=False)
+        self.assertEqual(len(calls), 1)
+        self.assertIsInstance(r, FileReadSeeker)
+
+    def test_provided_object_returned(self):
+        f = FileReadSeeker(File('hello'))
+        self.assertIs(pure_interface.adapt_all(f, [IReader, ISeekable], interface_only=False), f)
+
+    def test_interface_only_wrapper(self):
+        f = File('hello')
+        r = pure_interface.adapt_all(f, [IReader, ISeekable], interface_only=True)
+        self.assertIsInstance(r, IReader)
+        self.assertIsInstance(r, ISeekable)
+        r.seek(1)
+        self.assertEqual(r.read(), 'ello')
+        self.assertEqual(r.position, 1)
+        with self.assertRaises(AttributeError):
+            r.text
+        self.assertIsInstance(pure_interface.unwrap(r), FileReadSeeker)
+
+    def test_separate_adapters_combined(self):
+        s = Stream('hello')
+        r = pure_interface.adapt_all(s, [IReader, ISeekable], interface_only=False)
+        self.assertEqual(r.read(), 'hello')
+        r.seek(3)
+        self.assertEqual(r.position, 3)
+        self.assertIsInstance(r, IReader)
+        self.assertIsInstance(r, ISeekable)
+        self.assertIs(pure_interface.unwrap(r), r)
+
+    def test_composite_type_cached(self):
+        r1 = pure_interface.adapt_all(Stream('a'), [IReader, ISeekable])
+        r2 = pure_interface.adapt_all(Stream('b'), [IReader, ISeekable])
+        r3 = pure_interface.adapt_all(Stream('b'), [ISeekable, IReader])
+        self.assertIs(type(r1), type(r2))
+        self.assertIsNot(type(r1), type(r3))
+
+    def test_single_interface(self):
+        r = pure_interface.adapt_all(File('a'), [IReader], interface_only=True)
+        self.assertIsInstance(r, pure_interface._ImplementationWrapper)
+
+    def test_common_adapter_preferred(self):
+        class Document(object):
+            text = 'hello'
+
+        @pure_interface.adapts(Document, IReader)
+        def document_to_reader(document):
+            return StreamReader(document)
+
+        @pure_interface.adapts(Document, ISeekable)
+        def document_to_seekable(document):
+            return StreamSeeker(document)
+
+        @pure_interface.adapts(Document, IReadSeeker)
+        def document_to_read_seeker(document):
+            return FileReadSeeker(document)
+
+        r = pure_interface.adapt_all(Document(), [IReader, ISeekable], interface_only=False)
+        self.assertIsInstance(r, FileReadSeeker)
+        self.assertIsInstance(pure_interface.adapt_all(Document(), [IReader], interface_only=False), StreamReader)
+
+    def test_foreign_wrapper_not_unwrapped(self):
+        reader = IReader.interface_only(FileReadSeeker(File('a')))
+        self.assertIsNone(ISeekable.adapt_or_none(reader))
+        with self.assertRaises(ValueError):
+            pure_interface.adapt_all(reader, [ISeekable], interface_only=False)
+        with self.assertRaises(ValueError):
+            pure_interface.adapt_all(reader, [IReader, ISeekable], interface_only=False)
+        self.assertIs(pure_interface.adapt_all(reader, [IReader], interface_only=True), reader)
+
+    def test_covering_wrapper_keeps_hidden_attributes(self):
+        wrapper = IReadSeeker.interface_only(FileReadSeeker(File('a')))
+        adapted = pure_interface.adapt_all(wrapper, [IReader, ISeekable], interface_only=False)
+        self.assertIs(adapted, wrapper)
+        self.assertEqual('a', adapted.read())
+        self.assertFalse(hasattr(adapted, 'text'))
+        adapted = pure_interface.adapt_all(wrapper, [IReader, ISeekable], interface_only=True)
+        self.assertFalse(hasattr(adapted, 'text'))
+
+    def test_cannot_adapt_raises(self):
+        with self.assertRaises(ValueError):
+            pure_interface.adapt_all(Talker4(), [IReader, ISeekable])
+        with self.assertRaises(ValueError):
+            pure_interface.adapt_all(File('a'), [])
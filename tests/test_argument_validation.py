@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import unittest
+from typing import List, Optional, Union
+
+import six
+
+import pure_interface
+
+
+class IShape(pure_interface.PureInterface):
+    def area(self):
+        pass
+
+
+class Square(object):
+    def __init__(self, side):
+        self.side = side
+
+    def area(self):
+        return self.side ** 2
+
+
+IShape.register(Square)
+
+
+class ICanvas(pure_interface.PureInterface):
+    pi_validate_arguments = True
+
+    def draw(self, shape, scale=1.0, label=None):
+        pass
+    draw.__annotations__ = {'shape': IShape, 'scale': float, 'label': six.text_type, 'return': bool}
+
+    def colours(self, names, *others, **options):
+        pass
+    colours.__annotations__ = {'names': List[six.text_type], 'return': Union[int, List[int]]}
+
+    def clear(self):
+        pass
+
+
+class Canvas(pure_interface.Concrete, ICanvas):
+    def __init__(self):
+        self.result = True
+
+    def draw(self, shape, scale=1.0, label=None):
+        return self.result
+
+    def colours(self, names, *others, **options):
+        return [len(names), len(others), len(options)]
+
+    def clear(self):
+        pass
+
+
+class IPlotter(ICanvas):
+    def plot(self, points):
+        pass
+    plot.__annotations__ = {'points': Optional[list]}
+
+
+class DrawMixin(object):
+    def draw(self, shape, scale=1.0, label=None):
+        return 'not a bool'
+
+
+class Plotter(DrawMixin, pure_interface.Concrete, IPlotter):
+    def colours(self, names, *others, **options):
+        return 3
+
+    def clear(self):
+        pass
+
+    def plot(self, points):
+        return None
+
+
+class IUnchecked(pure_interface.PureInterface):
+    def draw(self, shape):
+        pass
+    draw.__annotations__ = {'shape': IShape}
+
+
+class Unchecked(pure_interface.Concrete, IUnchecked):
+    def draw(self, shape):
+        return shape
+
+
+class TestArgumentValidation(unittest.TestCase):
+    def tearDown(self):
+        pure_interface.set_argument_validation(ICanvas, True)
+        pure_interface.set_argument_validation(IPlotter, True)
+
+    def test_valid_arguments(self):
+        canvas = Canvas()
+        self.assertTrue(canvas.draw(Square(2)))
+        self.assertTrue(canvas.draw(Square(2), 2.0, 'square'))
+        self.assertTrue(canvas.draw(shape=Square(2), label=None, scale=3))  # int is acceptable for float
+
+    def test_invalid_argument(self):
+        canvas = Canvas()
+        with self.assertRaises(TypeError) as exc:
+            canvas.draw(3)
+        self.assertEqual('ICanvas.draw() argument "shape" must be IShape, not int', str(exc.exception))
+        with self.assertRaises(TypeError):
+            canvas.draw(Square(2), scale='big')
+        with self.assertRaises(TypeError):
+            canvas.draw(Square(2), label=3)
+
+    def test_invalid_return_value(self):
+        canvas = Canvas()
+        canvas.result = 1.0
+        with self.assertRaises(TypeError) as exc:
+            canvas.draw(Square(2))
+        self.assertEqual('ICanvas.draw() must return bool, not float', str(exc.exception))
+
+    def test_generics_and_varargs(self):
+        canvas = Canvas()
+        self.assertEqual([1, 2, 1], canvas.colours(['red'], 'a', 'b', c=1))
+        with self.assertRaises(TypeError):
+            canvas.colours('red')
+
+    def test_disable(self):
+        canvas = Canvas()
+        pure_interface.set_argument_validation(ICanvas, False)
+        self.assertTrue(canvas.draw('square'))
+        pure_interface.set_argument_validation(ICanvas, True)
+        with self.assertRaises(TypeError):
+            canvas.draw('square')
+
+    def test_undeclared_interface_is_not_checked(self):
+        self.assertFalse(hasattr(Unchecked.__dict__['draw'], '__wrapped__'))
+        self.assertEqual('square', Unchecked().draw('square'))
+        with self.assertRaises(ValueError):
+            pure_interface.set_argument_validation(IUnchecked, True)
+        with self.assertRaises(ValueError):
+            pure_interface.set_argument_validation(Canvas, True)
+
+    def test_unannotated_method_not_wrapped(self):
+        self.assertFalse(hasattr(Canvas.__dict__['clear'], '__wrapped__'))
+
+    def test_wrapper_keeps_function_attributes(self):
+        method = Canvas.__dict__['draw']
+        self.assertEqual('draw', method.__name__)
+        self.assertEqual('draw', method.__wrapped__.__name__)
+        self.assertIsNot(method, method.__wrapped__)
+
+    def test_subclass_is_not_wrapped_twice(self):
+        class SubCanvas(Canvas):
+            pass
+        self.assertNotIn('draw', SubCanvas.__dict__)
+        with self.assertRaises(TypeError):
+            SubCanvas().draw('square')
+
+    def test_sub_interface_and_mixin(self):
+        self.assertTrue(IPlotter._pi.validate_arguments)
+        plotter = Plotter()
+        self.assertIsNone(plotter.plot(None))
+        self.assertIsNone(plotter.plot([1, 2]))
+        with self.assertRaises(TypeError):
+            plotter.plot((1, 2))
+        with self.assertRaises(TypeError):
+            plotter.draw(Square(1))  # the mixin's draw returns a str
+        self.assertEqual(3, plotter.colours(['red']))
+
+    def test_sub_interface_switch(self):
+        pure_interface.set_argument_validation(IPlotter, False)
+        self.assertIsNone(Plotter().plot((1, 2)))
+        with self.assertRaises(TypeError):
+            Plotter().draw(Square(1))  # draw is checked against ICanvas
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import abc
+import collections
+import gc
+import unittest
+import warnings
+import weakref
+
+import mock
+import six
+
+import pure_interface
+from pure_interface import PureInterface, Concrete, _checks
+
+
+class ISpeaker(PureInterface):
+    def speak(self, words):
+        pass
+
+
+class ABCMover(six.with_metaclass(abc.ABCMeta, object)):
+    @abc.abstractmethod
+    def move(self, x, y=None):
+        pass
+
+
+class SpeakerMixin(object):
+    def speak(self, words):
+        return words
+
+
+def make_duck():
+    class Duck(object):
+        def speak(self, words):
+            return words
+    return Duck
+
+
+class TestCaches(unittest.TestCase):
+    def setUp(self):
+        self.saved_is_development = pure_interface.is_development
+        pure_interface.is_development = True
+
+    def tearDown(self):
+        pure_interface.is_development = self.saved_is_development
+
+    def test_structural_subclasses_are_weak(self):
+        duck = make_duck()
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertTrue(ISpeaker.provided_by(duck()))
+        self.assertIn(duck, pure_interface.implementations_of(ISpeaker, include_structural=True))
+        duck_ref = weakref.ref(duck)
+        del duck
+        gc.collect()
+        self.assertIsNone(duck_ref())
+        self.assertEqual(0, len(ISpeaker._pi.structural_subclasses))
+
+    def test_missing_method_warnings_are_bounded(self):
+        saved = pure_interface.missing_method_warnings
+        pure_interface.missing_method_warnings = collections.deque(maxlen=2)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                for name in ('A', 'B', 'C'):
+                    type(str(name), (Concrete, ISpeaker), {})
+            self.assertEqual(2, len(pure_interface.missing_method_warnings))
+            self.assertIn('C does not implement speak', pure_interface.missing_method_warnings[-1])
+        finally:
+            pure_interface.missing_method_warnings = saved
+
+    def test_composite_wrapper_types_are_bounded(self):
+        class Speaker(Concrete, ISpeaker):
+            def speak(self, words):
+                return words
+
+        saved = pure_interface._MAX_COMPOSITE_WRAPPER_TYPES
+        pure_interface._MAX_COMPOSITE_WRAPPER_TYPES = 2
+        try:
+            for _ in range(3):
+                sub_interface = type(str('ISub'), (ISpeaker,), {})
+                pure_interface.adapt_all(Speaker(), [ISpeaker, sub_interface], allow_implicit=True,
+                                         interface_only=True)
+            self.assertEqual(2, len(pure_interface._composite_wrapper_types))
+        finally:
+            pure_interface._MAX_COMPOSITE_WRAPPER_TYPES = saved
+
+    def test_composite_wrapper_types_evict_least_recently_used(self):
+        class Speaker(Concrete, ISpeaker):
+            def speak(self, words):
+                return words
+
+        saved = pure_interface._MAX_COMPOSITE_WRAPPER_TYPES
+        pure_interface._MAX_COMPOSITE_WRAPPER_TYPES = 2
+        try:
+            sub_interfaces = [type(str('ISub'), (ISpeaker,), {}) for _ in range(3)]
+            wrapper_types = []
+            for sub_interface in sub_interfaces[:2] + sub_interfaces[:1] + sub_interfaces[2:]:
+                wrapper = pure_interface.adapt_all(Speaker(), [ISpeaker, sub_interface], allow_implicit=True,
+                                                   interface_only=True)
+                wrapper_types.append(type(wrapper))
+            self.assertIs(wrapper_types[0], wrapper_types[2])
+            self.assertIn((ISpeaker, sub_interfaces[0]), pure_interface._composite_wrapper_types)
+            self.assertNotIn((ISpeaker, sub_interfaces[1]), pure_interface._composite_wrapper_types)
+        finally:
+            pure_interface._MAX_COMPOSITE_WRAPPER_TYPES = saved
+
+    def test_hierarchy_forgets_dead_interfaces(self):
+        sub_interface = type(str('ISub'), (ISpeaker,), {})
+        index = sub_interface._pi.hierarchy_id
+        del sub_interface
+        gc.collect()
+        type(str('IOther'), (ISpeaker,), {})  # adding an interface clears the dead entries
+        hierarchy = pure_interface._hierarchy
+        self.assertNotIn(index, hierarchy.interfaces)
+        self.assertNotIn(index, hierarchy.ancestors)
+        self.assertNotIn(index, hierarchy.descendants[ISpeaker._pi.hierarchy_id])
+
+    def test_abc_bases_are_analysed_once(self):
+        with mock.patch.object(pure_interface, '_type_is_pure_interface',
+                               wraps=pure_interface._type_is_pure_interface) as analyse:
+            type(str('IMover'), (PureInterface, ABCMover), {})
+            type(str('IMover'), (PureInterface, ABCMover), {})
+        self.assertEqual(1, len([call for call in analyse.call_args_list if call[0][0] is ABCMover]))
+
+    def test_mixins_are_checked_once_per_interface_set(self):
+        with mock.patch.object(_checks, '_check_method_signatures', wraps=_checks._check_method_signatures) as check:
+            type(str('Speaker'), (SpeakerMixin, Concrete, ISpeaker), {})
+            type(str('Speaker'), (SpeakerMixin, Concrete, ISpeaker), {})
+            mixin_checks = [call for call in check.call_args_list if call[0][1] == 'SpeakerMixin']
+            self.assertEqual(1, len(mixin_checks))
+            sub_interface = type(str('ISub'), (ISpeaker,), {})
+            type(str('Speaker'), (SpeakerMixin, Concrete, sub_interface), {})
+            mixin_checks = [call for call in check.call_args_list if call[0][1] == 'SpeakerMixin']
+            self.assertEqual(2, len(mixin_checks))
+
+    def test_mixins_are_checked_for_each_interface_order(self):
+        class IWords(PureInterface):
+            def speak(self, words):
+                pass
+
+        class IVolume(PureInterface):
+            def speak(self, words, volume):
+                pass
+
+        type(str('Speaker'), (SpeakerMixin, Concrete, IWords, IVolume), {})
+        with self.assertRaises(pure_interface.InterfaceError):
+            type(str('Speaker'), (SpeakerMixin, Concrete, IVolume, IWords), {})
+
+    def test_bad_mixin_is_not_remembered(self):
+        class BadMixin(object):
+            def speak(self):
+                pass
+
+        for _ in range(2):
+            with self.assertRaises(pure_interface.InterfaceError):
+                type(str('Speaker'), (BadMixin, Concrete, ISpeaker), {})
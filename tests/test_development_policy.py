@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import tempfile
+import unittest
+
+import mock
+
+import pure_interface
+
+
+class ISpeaker(pure_interface.PureInterface):
+    def speak(self, volume):
+        pass
+
+
+class TestDevelopmentPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = pure_interface.DevelopmentPolicy()
+
+    def tearDown(self):
+        pure_interface.development_policy.clear()
+        pure_interface.is_development = True
+
+    def test_unset_settings_follow_is_development(self):
+        settings = self.policy.resolve('mypkg')
+        self.assertEqual(settings, (None, None, None, None))
+
+    def test_prefix_matching(self):
+        self.policy.set('mypkg', True)
+        self.policy.set('mypkg.vendor', False)
+        self.assertTrue(self.policy.resolve('mypkg').check_signatures)
+        self.assertTrue(self.policy.resolve('mypkg.sub').check_signatures)
+        self.assertFalse(self.policy.resolve('mypkg.vendor.x').check_signatures)
+        self.assertIsNone(self.policy.resolve('mypkgx').check_signatures)
+
+    def test_longest_prefix_wins_per_setting(self):
+        self.policy.set('', False)
+        self.policy.set('mypkg', warn_structural=True)
+        settings = self.policy.resolve('mypkg.sub')
+        self.assertTrue(settings.warn_structural)
+        self.assertFalse(settings.check_signatures)
+
+    def test_resolution_cached(self):
+        self.policy.set('mypkg', True)
+        self.assertIs(self.policy.resolve('mypkg'), self.policy.resolve('mypkg'))
+        self.policy.set('mypkg', False)
+        self.assertFalse(self.policy.resolve('mypkg').interface_only)
+
+    def test_unknown_setting(self):
+        with self.assertRaises(ValueError):
+            self.policy.set('mypkg', frobnicate=True)
+
+    def test_load(self):
+        self.policy.load('mypkg=1, vendor=off\n# comment\nmypkg.sub:interface_only=no')
+        self.assertTrue(self.policy.resolve('mypkg').interface_only)
+        self.assertFalse(self.policy.resolve('mypkg.sub').interface_only)
+        self.assertTrue(self.policy.resolve('mypkg.sub').check_signatures)
+        self.assertFalse(self.policy.resolve('vendor').warn_incomplete)
+        with self.assertRaises(ValueError):
+            self.policy.load('mypkg=maybe')
+        with self.assertRaises(ValueError):
+            self.policy.load('mypkg')
+
+    def test_load_environment(self):
+        fd, path = tempfile.mkstemp()
+        with os.fdopen(fd, 'w') as f:
+            f.write('mypkg=1\n')
+        try:
+            self.policy.load_environment({'PURE_INTERFACE_DEVELOPMENT_FILE': path,
+                                          'PURE_INTERFACE_DEVELOPMENT': 'vendor=0'})
+        finally:
+            os.remove(path)
+        self.assertTrue(self.policy.resolve('mypkg').check_signatures)
+        self.assertFalse(self.policy.resolve('vendor').check_signatures)
+
+    def test_signature_checks_disabled_for_module(self):
+        pure_interface.is_development = True
+        pure_interface.development_policy.set(__name__, check_signatures=False)
+
+        class BadSpeaker(pure_interface.Concrete, ISpeaker):
+            def speak(self, loudness):
+                pass
+
+    def test_signature_checks_enabled_for_module(self):
+        pure_interface.is_development = False
+        pure_interface.development_policy.set(__name__, check_signatures=True)
+
+        with self.assertRaises(pure_interface.InterfaceError):
+            class BadSpeaker(pure_interface.Concrete, ISpeaker):
+                def speak(self, loudness):
+                    pass
+
+    def test_incomplete_warning_disabled_for_module(self):
+        pure_interface.is_development = True
+        pure_interface.development_policy.set(__name__, warn_incomplete=False)
+        warn = mock.MagicMock()
+        with mock.patch('warnings.warn', warn):
+            class Incomplete(pure_interface.Concrete, ISpeaker):
+                pass
+        warn.assert_not_called()
+
+    def test_interface_only_default(self):
+        pure_interface.is_development = False
+        pure_interface.development_policy.set(__name__, interface_only=True)
+
+        class Speaker(object):
+            def speak(self, volume):
+                pass
+
+        s = ISpeaker.adapt(Speaker(), allow_implicit=True)
+        self.assertIsInstance(s, pure_interface._ImplementationWrapper)
+
+    def test_signatures_are_not_computed_in_production(self):
+        pure_interface.is_development = False
+        with mock.patch.object(pure_interface, 'getargspec', wraps=pure_interface.getargspec) as getargspec:
+            class IListener(pure_interface.PureInterface):
+                def hear(self, sound):
+                    pass
+
+            class Listener(pure_interface.Concrete, IListener):
+                def hear(self, sound):
+                    pass
+        getargspec.assert_not_called()
+        self.assertEqual({'hear'}, IListener._pi.interface_method_names)
+        self.assertEqual(['self', 'sound'], IListener._pi.interface_method_signatures['hear'].args)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import gc
+import unittest
+import weakref
+
+import pure_interface
+from pure_interface import PureInterface, Concrete, interface_dispatch
+
+
+class IShape(PureInterface):
+    def area(self):
+        pass
+
+
+class ISquare(IShape):
+    def side(self):
+        pass
+
+
+class IText(PureInterface):
+    def text(self):
+        pass
+
+
+class Circle(Concrete, IShape):
+    def area(self):
+        return 3
+
+
+class Square(Concrete, ISquare):
+    def area(self):
+        return 4
+
+    def side(self):
+        return 2
+
+
+class Label(Concrete, IText):
+    def text(self):
+        return 'label'
+
+
+class Word(object):
+    def __init__(self, word):
+        self.word = word
+
+
+class ShapedText(Concrete, IShape, IText):
+    def area(self):
+        return 1
+
+    def text(self):
+        return 'shaped'
+
+
+class TestInterfaceDispatch(unittest.TestCase):
+    def setUp(self):
+        @interface_dispatch
+        def describe(obj, prefix=''):
+            """ describes obj """
+            return prefix + 'unknown'
+
+        @describe.register(IShape)
+        def describe_shape(shape, prefix=''):
+            return prefix + 'shape {}'.format(shape.area())
+
+        @describe.register(ISquare)
+        def describe_square(square, prefix=''):
+            return prefix + 'square {}'.format(square.side())
+
+        self.describe = describe
+
+    def test_dispatch(self):
+        self.assertEqual('shape 3', self.describe(Circle()))
+        self.assertEqual('square 2', self.describe(Square()))
+        self.assertEqual('> unknown', self.describe(1, prefix='> '))
+        self.assertEqual('describe', self.describe.__name__)
+        self.assertEqual(' describes obj ', self.describe.__doc__)
+
+    def test_registered_class(self):
+        class Blob(object):
+            def area(self):
+                return 7
+
+        IShape.register(Blob)
+        self.assertEqual('shape 7', self.describe(Blob()))
+
+    def test_adapt(self):
+        adapter = lambda word: Label()
+        pure_interface.register_adapter(adapter, Word, IText)
+        self.assertEqual('unknown', self.describe(Word('a')))
+
+        @self.describe.register(IText, adapt=True)
+        def describe_text(text, prefix=''):
+            return 'text ' + text.text()
+
+        self.assertEqual('text label', self.describe(Word('a')))
+
+    def test_adapter_registration_clears_cache(self):
+        class Number(object):
+            pass
+
+        @self.describe.register(IText, adapt=True)
+        def describe_text(text, prefix=''):
+            return 'text ' + text.text()
+
+        self.assertEqual('unknown', self.describe(Number()))
+        adapter = lambda number: Label()
+        pure_interface.register_adapter(adapter, Number, IText)
+        self.assertEqual('text label', self.describe(Number()))
+
+    def test_predicate(self):
+        class Thing(object):
+            def __init__(self, label):
+                self.label = label
+
+        adapter = lambda thing: Label()
+        pure_interface.register_adapter(adapter, Thing, IText, predicate=lambda thing: thing.label)
+
+        @self.describe.register(IText, adapt=True)
+        def describe_text(text, prefix=''):
+            return 'text ' + text.text()
+
+        self.assertEqual('text label', self.describe(Thing(True)))
+        self.assertEqual('unknown', self.describe(Thing(False)))
+
+    def test_ambiguous(self):
+        self.describe.register(IText, lambda text, prefix='': 'text')
+        with self.assertRaises(RuntimeError):
+            self.describe(ShapedText())
+
+    def test_register_non_interface(self):
+        with self.assertRaises(ValueError):
+            self.describe.register(Circle, lambda circle: None)
+
+    def test_register_pure_interface(self):
+        with self.assertRaises(ValueError) as exc:
+            self.describe.register(PureInterface, lambda obj: None)
+        self.assertIn('PureInterface cannot be registered', str(exc.exception))
+
+    def test_cache(self):
+        self.assertIs(self.describe.dispatch(Circle), self.describe.dispatch(Circle))
+        self.describe.register(IText, lambda text, prefix='': 'text')
+        self.assertEqual('text', self.describe(Label()))
+
+    def test_types_are_not_kept_alive(self):
+        class Temporary(object):
+            pass
+
+        self.assertEqual('unknown', self.describe(Temporary()))
+        temporary_ref = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+        self.assertIsNone(temporary_ref())
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import copy
+import pickle
+import unittest
+import weakref
+
+import pure_interface
+from pure_interface import PureInterface, Concrete
+
+
+class IPoint(PureInterface):
+    x = None
+    y = None
+
+    @property
+    def label(self):
+        pass
+
+
+class IPoint3d(IPoint):
+    z = None
+
+
+class IShape(PureInterface):
+    name = None
+
+    def area(self):
+        pass
+
+
+IPointDTO = IPoint.make_dto()
+IPointFrozenDTO = IPoint.make_dto(frozen=True)
+
+
+class TestMakeDto(unittest.TestCase):
+    def test_dto(self):
+        point = IPointDTO(label='a', x=1, y=2)
+        self.assertEqual((1, 2, 'a'), (point.x, point.y, point.label))
+        self.assertIsInstance(point, IPoint)
+        self.assertTrue(IPoint.provided_by(point))
+        self.assertIn(IPointDTO, pure_interface.implementations_of(IPoint))
+        self.assertEqual('IPointDTO', IPointDTO.__name__)
+        self.assertEqual(__name__, IPointDTO.__module__)
+        point.x = 3
+        self.assertEqual(3, point.x)
+
+    def test_positional_arguments_are_alphabetical(self):
+        self.assertEqual(IPointDTO(label='a', x=1, y=2), IPointDTO('a', 1, 2))
+
+    def test_missing_argument_raises(self):
+        with self.assertRaises(TypeError):
+            IPointDTO(x=1, y=2)
+
+    def test_slots(self):
+        point = IPointDTO('a', 1, 2)
+        self.assertEqual(('label', 'x', 'y'), IPointDTO.__slots__)
+        self.assertFalse(hasattr(point, '__dict__'))
+        with self.assertRaises(AttributeError):
+            point.colour = 'red'
+
+    def test_repr(self):
+        self.assertEqual("IPointDTO(label='a', x=1, y=2)", repr(IPointDTO(str('a'), 1, 2)))
+
+    def test_eq(self):
+        point = IPointDTO('a', 1, 2)
+        self.assertEqual(point, IPointDTO('a', 1, 2))
+        self.assertNotEqual(point, IPointDTO('a', 1, 3))
+        self.assertFalse(point != IPointDTO('a', 1, 2))
+        self.assertNotEqual(point, IPointFrozenDTO('a', 1, 2))
+        with self.assertRaises(TypeError):
+            hash(point)
+
+    def test_frozen(self):
+        point = IPointFrozenDTO('a', 1, 2)
+        self.assertEqual(1, point.x)
+        with self.assertRaises(AttributeError):
+            point.x = 3
+        with self.assertRaises(AttributeError):
+            del point.x
+        self.assertEqual(hash(point), hash(IPointFrozenDTO('a', 1, 2)))
+        self.assertEqual('IPointFrozenDTO', IPointFrozenDTO.__name__)
+
+    def test_copy_and_pickle(self):
+        for point in (IPointDTO('a', 1, 2), IPointFrozenDTO('a', 1, 2)):
+            self.assertEqual(point, copy.copy(point))
+            self.assertEqual(point, copy.deepcopy(point))
+        point_type = IPoint3d.make_dto(frozen=True)  # not bound to a module global
+        for point in (IPointDTO('a', 1, 2), point_type('a', 1, 2, 3)):
+            self.assertEqual(point, pickle.loads(pickle.dumps(point, 2)))
+
+    def test_type_is_cached(self):
+        self.assertIs(IPointDTO, IPoint.make_dto())
+        self.assertIs(IPointFrozenDTO, IPoint.make_dto(frozen=True))
+        self.assertIsNot(IPointDTO, IPointFrozenDTO)
+
+    def test_sub_interface(self):
+        point_type = IPoint3d.make_dto()
+        self.assertEqual(('label', 'x', 'y', 'z'), point_type.__slots__)
+        self.assertIsInstance(point_type('a', 1, 2, 3), IPoint)
+
+    def test_methods_raise(self):
+        with self.assertRaises(ValueError):
+            IShape.make_dto()
+
+    def test_attribute_called_self(self):
+        class ISelf(PureInterface):
+            self = None
+            other = None
+
+        for frozen in (False, True):
+            dto = ISelf.make_dto(frozen)(other=1, self=2)
+            self.assertEqual((1, 2), (dto.other, dto.self))
+
+    def test_reserved_attribute_name_raises(self):
+        class IReserved(PureInterface):
+            _pi_self = None
+
+        with self.assertRaises(ValueError) as exc:
+            IReserved.make_dto()
+        self.assertIn("'_pi_self'", str(exc.exception))
+        keyword_interface = type(IReserved)(str('IKeyword'), (PureInterface,), {str('class'): None})
+        with self.assertRaises(ValueError):
+            keyword_interface.make_dto()
+
+    def test_not_interface_raises(self):
+        class Point(Concrete, IPoint):
+            def __init__(self):
+                self.label = 'a'
+                self.x = self.y = 0
+
+        with self.assertRaises(ValueError):
+            Point.make_dto()
+
+
+class TestSlottedImplementation(unittest.TestCase):
+    def test_interface_bases_are_not_slotted(self):
+        class Point(Concrete, IPoint):
+            __slots__ = ('x',)
+
+            def __init__(self):
+                self.label = 'a'  # an AttributeProperty stores the value in __dict__
+                self.x = self.y = 0
+
+        point = Point()
+        self.assertEqual('a', point.label)
+        self.assertIs(point, weakref.ref(point)())
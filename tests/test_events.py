@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import threading
+import unittest
+import warnings
+
+import pure_interface
+from pure_interface import (PureInterface, Concrete, InterfaceDefined, ImplementationDefined,
+                            IncompleteImplementation, StructuralMatch, AdapterInvoked, AdaptionFailed)
+
+
+class ISpeaker(PureInterface):
+    def speak(self, words):
+        pass
+
+
+class Speaker(Concrete, ISpeaker):
+    def speak(self, words):
+        return words
+
+
+class Talker(object):
+    def talk(self, words):
+        return words
+
+
+def talker_to_speaker(talker):
+    return Speaker()
+
+
+pure_interface.register_adapter(talker_to_speaker, Talker, ISpeaker)
+
+
+class TestEvents(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.subscribed = []
+
+    def tearDown(self):
+        for event_type, listener in self.subscribed:
+            pure_interface.unsubscribe(event_type, listener)
+
+    def subscribe(self, event_type, listener=None, asynchronous=False):
+        listener = listener or self.events.append
+        pure_interface.subscribe(event_type, listener, asynchronous=asynchronous)
+        self.subscribed.append((event_type, listener))
+
+    def test_interface_defined(self):
+        self.subscribe(InterfaceDefined)
+
+        class IAnimal(PureInterface):
+            def move(self):
+                pass
+
+        self.assertEqual([InterfaceDefined(IAnimal)], self.events)
+
+    def test_implementation_defined(self):
+        self.subscribe(ImplementationDefined)
+
+        class Speaker2(Concrete, ISpeaker):
+            def speak(self, words):
+                return words
+
+        self.assertEqual([ImplementationDefined(Speaker2, (ISpeaker,))], self.events)
+
+    def test_incomplete_implementation(self):
+        self.subscribe(IncompleteImplementation)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+
+            class Mute(Concrete, ISpeaker):
+                pass
+
+        self.assertEqual([IncompleteImplementation(Mute, frozenset(['speak']))], self.events)
+
+    def test_structural_match(self):
+        self.subscribe(StructuralMatch)
+
+        class Parrot(object):
+            def speak(self, words):
+                return words
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            ISpeaker.provided_by(Parrot())
+            ISpeaker.provided_by(Parrot())
+        self.assertEqual([StructuralMatch(ISpeaker, Parrot)], self.events)
+
+    def test_adapter_invoked(self):
+        self.subscribe(AdapterInvoked)
+        ISpeaker.adapt(Talker(), interface_only=False)
+        ISpeaker.adapt(Speaker(), interface_only=False)
+        self.assertEqual(1, len(self.events))
+        event = self.events[0]
+        self.assertIs(ISpeaker, event.interface)
+        self.assertIs(Talker, event.obj_type)
+        self.assertEqual('talker_to_speaker', event.adapter.__name__)
+        self.assertGreaterEqual(event.duration, 0.0)
+
+    def test_adapt_all_adapter_invoked(self):
+        self.subscribe(AdapterInvoked)
+        pure_interface.adapt_all(Talker(), [ISpeaker], interface_only=False)
+        self.assertEqual(1, len(self.events))
+
+    def test_adaption_failed(self):
+        self.subscribe(AdaptionFailed)
+        self.assertIsNone(ISpeaker.adapt_or_none(1))
+        self.assertEqual([AdaptionFailed(ISpeaker, 1, 'no adapter')], self.events)
+
+    def test_unsubscribe(self):
+        pure_interface.subscribe(AdaptionFailed, self.events.append)
+        pure_interface.unsubscribe(AdaptionFailed, self.events.append)
+        ISpeaker.adapt_or_none(1)
+        self.assertEqual([], self.events)
+        self.assertNotIn(AdaptionFailed, pure_interface._listeners)
+        with self.assertRaises(ValueError):
+            pure_interface.unsubscribe(AdaptionFailed, self.events.append)
+
+    def test_unknown_event_type(self):
+        with self.assertRaises(ValueError):
+            pure_interface.subscribe(object, self.events.append)
+
+    def test_asynchronous_delivery(self):
+        threads = []
+
+        def listener(event):
+            threads.append(threading.current_thread())
+            self.events.append(event)
+
+        self.subscribe(AdaptionFailed, listener, asynchronous=True)
+        ISpeaker.adapt_or_none(1)
+        pure_interface.flush_events()
+        self.assertEqual([AdaptionFailed(ISpeaker, 1, 'no adapter')], self.events)
+        self.assertIsNot(threading.current_thread(), threads[0])
+
+    def test_listener_exception_is_a_warning(self):
+        def listener(event):
+            raise KeyError('broken')
+
+        self.subscribe(InterfaceDefined, listener)
+        self.subscribe(InterfaceDefined)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+
+            class IListened(PureInterface):
+                def speak(self, words):
+                    pass
+
+        self.assertEqual([InterfaceDefined(IListened)], self.events)
+        self.assertEqual([RuntimeWarning], [w.category for w in caught])
+        self.assertIn('broken', str(caught[0].message))
+
+    def test_one_event_thread(self):
+        listeners = [self.events.append for _ in range(8)]
+        threads = [threading.Thread(target=self.subscribe, args=(AdaptionFailed, listener, True))
+                   for listener in listeners]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        event_threads = [t for t in threading.enumerate() if t.name == 'pure_interface events']
+        self.assertEqual(1, len(event_threads))
@@ -2,6 +2,7 @@
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import pure_interface
+from pure_interface import _checks
 
 import unittest
 import inspect
@@ -115,7 +116,7 @@ class TestFunctionSignatureChecks(unittest.TestCase):
         concrete_sig = pure_interface.getargspec(impl_func)
         reality = test_call(impl_func, interface_sig)
         self.assertEqual(expected_result, reality, 'Reality does not match expectations')
-        result = pure_interface._signatures_are_consistent(concrete_sig, interface_sig)
+        result = _checks._signatures_are_consistent(concrete_sig, interface_sig)
         self.assertEqual(expected_result, result, 'Signature test gave wrong answer')
 
     def test_tests(self):
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import gc
+import json
+import unittest
+
+from pure_interface import *
+
+
+class IA(PureInterface):
+    a = None
+
+
+class IB(IA):
+    b = None
+
+
+class IC(IA):
+    c = None
+
+
+class ID(IB, IC):
+    d = None
+
+
+class IE(PureInterface):
+    e = None
+
+
+class BD(Concrete, ID):
+    pass
+
+
+class CE(Concrete, IC, IE):
+    pass
+
+
+class BE(Concrete, IB, IE):
+    pass
+
+
+class TestInterfaceHierarchy(unittest.TestCase):
+    def test_is_interface_ancestor(self):
+        self.assertTrue(is_interface_ancestor(IA, ID))
+        self.assertTrue(is_interface_ancestor(IB, ID))
+        self.assertFalse(is_interface_ancestor(ID, IA))
+        self.assertFalse(is_interface_ancestor(IB, IC))
+        self.assertFalse(is_interface_ancestor(IA, IA))
+        with self.assertRaises(ValueError):
+            is_interface_ancestor(BD, IA)
+        with self.assertRaises(ValueError):
+            is_interface_ancestor(PureInterface, IA)
+
+    def test_get_interface_ancestors(self):
+        self.assertEqual(get_interface_ancestors(ID), [IA, IB, IC])
+        self.assertEqual(get_interface_ancestors(IA), [])
+
+    def test_get_interface_descendants(self):
+        self.assertEqual(get_interface_descendants(IA), [IB, IC, ID])
+        self.assertEqual(get_interface_descendants(IC), [ID])
+        self.assertEqual(get_interface_descendants(ID), [])
+
+    def test_dead_interfaces_not_returned(self):
+        class IX(IE):
+            pass
+
+        self.assertEqual(get_interface_descendants(IE), [IX])
+        del IX
+        gc.collect()
+        self.assertEqual(get_interface_descendants(IE), [])
+
+    def test_least_common_interfaces(self):
+        self.assertEqual(least_common_interfaces([BD, CE]), [IC])
+        self.assertEqual(least_common_interfaces([BD, BE]), [IB])
+        self.assertEqual(least_common_interfaces([CE, BE]), [IA, IE])
+        self.assertEqual(least_common_interfaces([BD]), [ID])
+        self.assertEqual(least_common_interfaces([BD, int]), [])
+        self.assertEqual(least_common_interfaces([]), [])
+
+    def test_export_json(self):
+        graph = json.loads(export_interface_hierarchy('json'))
+        ids = dict((node['name'], node['id']) for node in graph['nodes'])
+        edges = set((edge['source'], edge['target']) for edge in graph['edges'])
+        name = __name__ + '.{}'
+        self.assertIn((ids[name.format('ID')], ids[name.format('IB')]), edges)
+        self.assertIn((ids[name.format('ID')], ids[name.format('IC')]), edges)
+        self.assertNotIn((ids[name.format('ID')], ids[name.format('IA')]), edges)
+
+    def test_export_dot(self):
+        dot = export_interface_hierarchy('dot')
+        self.assertTrue(dot.startswith('digraph interfaces {'))
+        self.assertIn('label="{}.ID"'.format(__name__), dot)
+        with self.assertRaises(ValueError):
+            export_interface_hierarchy('xml')
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import unittest
+import warnings
+
+import pure_interface
+from pure_interface import PureInterface, Concrete, InterfaceError
+
+
+class IRecord(PureInterface):
+    table = None
+
+    @property
+    def key(self):
+        pass
+
+    def save(self, connection, commit=True):
+        pass
+
+    def load(self, connection):
+        pass
+
+
+def __init__(self, key=1):
+    self.table = 'records'
+    self.key = key
+
+
+def save(self, connection, commit=True):
+    return connection
+
+
+def load(self, connection):
+    return connection
+
+
+class SubMeta(pure_interface.PureInterfaceType):
+    pass
+
+
+class ISubMetaRecord(pure_interface.six.with_metaclass(SubMeta, PureInterface)):
+    def save(self, connection):
+        pass
+
+
+class TestImplement(unittest.TestCase):
+    def setUp(self):
+        self.saved_warnings = pure_interface.missing_method_warnings
+        self.saved_is_development = pure_interface.is_development
+        pure_interface.missing_method_warnings = []
+        pure_interface.is_development = True
+
+    def tearDown(self):
+        pure_interface.missing_method_warnings = self.saved_warnings
+        pure_interface.is_development = self.saved_is_development
+
+    def test_implement_matches_metaclass(self):
+        namespace = {'__init__': __init__, 'save': save, 'load': load}
+        record_type = pure_interface.implement(IRecord, 'Record', namespace)
+        expected = type(str('Record'), (Concrete, IRecord), namespace)
+        self.assertEqual(expected.__mro__[1:], record_type.__mro__[1:])
+        self.assertEqual(__name__, record_type.__module__)
+        self.assertEqual(expected.__abstractmethods__, record_type.__abstractmethods__)
+        self.assertEqual(expected._pi.abstractproperties, record_type._pi.abstractproperties)
+        self.assertEqual((IRecord,), record_type._pi.type_interfaces)
+        self.assertIsInstance(record_type.__dict__['key'], pure_interface.AttributeProperty)
+        self.assertIn(record_type, pure_interface.implementations_of(IRecord))
+        record = record_type(3)
+        self.assertEqual(3, record.key)
+        self.assertTrue(IRecord.provided_by(record))
+
+    def test_module(self):
+        record_type = pure_interface.implement(IRecord, 'Record', {'save': save, 'load': load}, module='records')
+        self.assertEqual('records', record_type.__module__)
+
+    def test_missing_attribute_raises(self):
+        record_type = pure_interface.implement(IRecord, 'Record', {'save': save, 'load': load})
+        with self.assertRaises(TypeError):
+            record_type()
+
+    def test_incomplete_warns(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            pure_interface.implement(IRecord, 'Record', {'__init__': __init__, 'save': save})
+        self.assertEqual(1, len(caught))
+        self.assertEqual(__file__.replace('.pyc', '.py'), caught[0].filename.replace('.pyc', '.py'))
+        self.assertEqual(['Incomplete Implementation: Record does not implement load'],
+                         list(pure_interface.missing_method_warnings))
+
+    def test_partial_implementation(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            record_type = pure_interface.implement(IRecord, 'Record', {'pi_partial_implementation': True})
+        self.assertEqual([], caught)
+        self.assertNotIn('pi_partial_implementation', record_type.__dict__)
+
+    def test_bad_signature_raises(self):
+        def bad_save(self, connection, transaction):
+            pass
+
+        with self.assertRaises(InterfaceError):
+            pure_interface.implement(IRecord, 'Record', {'save': bad_save, 'load': load})
+
+    def test_verified_signatures_are_cached(self):
+        pure_interface.implement(IRecord, 'Record', {'save': save, 'load': load})
+        verified = IRecord._pi.verified_signatures
+        self.assertIn(('save', save.__code__, 1), verified)
+        self.assertIn(('load', load.__code__, 0), verified)
+
+        def save_defaults(self, connection, commit=True, extra=None):
+            pass
+
+        # the same code with different defaults is checked again
+        pure_interface.implement(IRecord, 'Record', {'save': save_defaults, 'load': load})
+        self.assertIn(('save', save_defaults.__code__, 2), verified)
+
+    def test_not_interface_raises(self):
+        record_type = pure_interface.implement(IRecord, 'Record', {'save': save, 'load': load})
+        with self.assertRaises(ValueError):
+            pure_interface.implement(record_type, 'Record', {})
+
+    def test_sub_metaclass(self):
+        record_type = pure_interface.implement(ISubMetaRecord, 'Record', {'save': load})
+        self.assertIs(SubMeta, type(record_type))
+        self.assertIn(record_type, pure_interface.implementations_of(ISubMetaRecord))
+
+
+class TestImplementAll(unittest.TestCase):
+    def setUp(self):
+        self.saved_warnings = pure_interface.missing_method_warnings
+        self.saved_is_development = pure_interface.is_development
+        pure_interface.missing_method_warnings = []
+        pure_interface.is_development = True
+
+    def tearDown(self):
+        pure_interface.missing_method_warnings = self.saved_warnings
+        pure_interface.is_development = self.saved_is_development
+
+    def test_implement_all(self):
+        classes = [('Record{}'.format(i), {'__init__': __init__, 'save': save, 'load': load}) for i in range(3)]
+        record_types = pure_interface.implement_all(IRecord, classes)
+        self.assertEqual(['Record0', 'Record1', 'Record2'], [cls.__name__ for cls in record_types])
+        for record_type in record_types:
+            self.assertTrue(IRecord.provided_by(record_type()))
+
+    def test_one_warning(self):
+        classes = [('Record{}'.format(i), {'__init__': __init__}) for i in range(3)]
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            pure_interface.implement_all(IRecord, classes)
+        self.assertEqual(1, len(caught))
+        self.assertEqual(6, len(pure_interface.missing_method_warnings))
+        self.assertIn('Record2 does not implement save', str(caught[0].message))
+
+    def test_checked_before_created(self):
+        def bad_load(self):
+            pass
+
+        classes = [('Good', {'save': save, 'load': load}), ('Bad', {'save': save, 'load': bad_load})]
+        implementations = len(pure_interface.implementations_of(IRecord))
+        with self.assertRaises(InterfaceError):
+            pure_interface.implement_all(IRecord, classes)
+        self.assertEqual(implementations, len(pure_interface.implementations_of(IRecord)))
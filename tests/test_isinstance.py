@@ -103,3 +103,82 @@ class TestIsInstanceChecks(unittest.TestCase):
             IAnimal.provided_by(Cat3(), allow_implicit=True)
 
         warn.assert_not_called()
+
+
+class IStructuralAnimal(pure_interface.PureInterface):
+    pi_structural = True
+
+    def speak(self, volume):
+        pass
+
+    @property
+    def height(self):
+        pass
+
+
+class IStructuralPet(IStructuralAnimal):
+    def name(self):
+        pass
+
+
+class Dog(object):
+    height = 3
+
+    def speak(self, volume):
+        return volume
+
+
+class Rock(object):
+    height = 1
+
+
+class TestStructuralIsInstance(unittest.TestCase):
+    def test_declaration(self):
+        self.assertTrue(IStructuralAnimal._pi.structural)
+        self.assertTrue(IStructuralPet._pi.structural)
+        self.assertFalse(IAnimal._pi.structural)
+        self.assertNotIn('pi_structural', IStructuralAnimal.__dict__)
+
+    def test_isinstance(self):
+        self.assertIsInstance(Dog(), IStructuralAnimal)
+        self.assertTrue(issubclass(Dog, IStructuralAnimal))
+        self.assertNotIsInstance(Rock(), IStructuralAnimal)
+        self.assertNotIsInstance(Dog(), IStructuralPet)
+        self.assertNotIsInstance(Dog(), IAnimal)
+        self.assertIn(Dog, pure_interface.implementations_of(IStructuralAnimal, include_structural=True))
+
+    def test_checked_once_per_class(self):
+        class Cat(object):
+            height = 2
+
+            def speak(self, volume):
+                return volume
+
+        with mock.patch.object(IStructuralAnimal, '_class_structural_type_check',
+                               wraps=IStructuralAnimal._class_structural_type_check) as check:
+            for _ in range(3):
+                self.assertIsInstance(Cat(), IStructuralAnimal)
+        self.assertEqual(1, check.call_count)
+
+    def test_no_warning(self):
+        class Cow(object):
+            height = 2
+
+            def speak(self, volume):
+                return volume
+
+        warn = mock.MagicMock()
+        with mock.patch('warnings.warn', warn):
+            self.assertTrue(IStructuralAnimal.provided_by(Cow()))
+        warn.assert_not_called()
+
+    def test_nominal_implementations_not_structural(self):
+        class Horse(pure_interface.Concrete, IStructuralAnimal):
+            height = 4
+
+            def speak(self, volume):
+                return volume
+
+        self.assertIsInstance(Horse(), IStructuralAnimal)
+        self.assertIsInstance(IStructuralAnimal.interface_only(Horse()), IStructuralAnimal)
+        self.assertNotIn(Horse, IStructuralAnimal._pi.structural_subclasses)
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import gc
+import unittest
+
+import pure_interface
+from pure_interface import PureInterface, Concrete
+
+
+class IPlant(PureInterface):
+    @property
+    def height(self):
+        pass
+
+    def grow(self, amount):
+        pass
+
+
+class Plant(Concrete, IPlant):
+    def __init__(self):
+        self.height = 1
+
+    def grow(self, amount):
+        self.height += amount
+
+
+class TestMemoryReport(unittest.TestCase):
+    def test_report_structure(self):
+        IPlant._pi.interface_method_signatures  # signatures are computed on first use
+        report = pure_interface.memory_report()
+        self.assertEqual(set(pure_interface.MEMORY_CATEGORIES), set(report['categories']))
+        self.assertGreater(report['classes'], 2)
+        self.assertEqual(report['total'], sum(report['categories'].values()) + sum(report['global'].values()))
+        entry = report['interfaces']['{}.IPlant'.format(__name__)]
+        self.assertEqual(1, entry['count'])
+        self.assertGreater(entry['signatures'], 0)
+        self.assertEqual(entry['total'], sum(entry[category] for category in pure_interface.MEMORY_CATEGORIES))
+        self.assertIn('signature_cache', report['global'])
+
+    def test_top_consumers(self):
+        report = pure_interface.memory_report(top=3)
+        self.assertEqual(3, len(report['top']))
+        sizes = [size for size, name in report['top']]
+        self.assertEqual(sorted(sizes, reverse=True), sizes)
+
+    def test_attribute_properties(self):
+        before = pure_interface.memory_report()['categories']['attribute_properties']
+
+        class Plant2(Concrete, IPlant):
+            def grow(self, amount):
+                pass
+
+        after = pure_interface.memory_report()['categories']['attribute_properties']
+        self.assertGreater(after, before)
+
+    def test_wrappers_are_counted(self):
+        name = '{}.IPlant'.format(__name__)
+        plant = Plant()
+        before = pure_interface.memory_report()['interfaces'][name]['wrappers']
+        wrapper = IPlant.interface_only(plant)
+        after = pure_interface.memory_report()['interfaces'][name]['wrappers']
+        self.assertGreater(after, before)
+        del wrapper
+
+    def test_dead_classes_are_not_reported(self):
+        def make_interface():
+            class ITemporary(PureInterface):
+                def method(self):
+                    pass
+            return ITemporary
+
+        name = '{}.ITemporary'.format(__name__)
+        interfaces = [make_interface() for i in range(3)]
+        self.assertEqual(3, pure_interface.memory_report()['interfaces'][name]['count'])
+        del interfaces
+        gc.collect()
+        self.assertNotIn(name, pure_interface.memory_report()['interfaces'])
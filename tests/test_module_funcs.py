@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 from __future__ import absolute_import, division, print_function, unicode_literals
 
-
+import gc
 import unittest
 
+import pure_interface
+
 from pure_interface import *
 
 
@@ -85,3 +87,57 @@ class TestModuleFunctions(unittest.TestCase):
         self.assertEqual(get_type_interfaces(Car), [])
         self.assertEqual(get_type_interfaces(len), [])
         self.assertEqual(get_type_interfaces('hello'), [])
+
+    def test_implementations_of(self):
+        self.assertEqual(implementations_of(IAnimal), {Cat, Dog, Mongrel})
+        self.assertEqual(implementations_of(ILandAnimal), {Dog, Mongrel})
+        self.assertEqual(implementations_of(Car), set())
+        self.assertEqual(implementations_of('hello'), set())
+
+    def test_implementations_of_registered(self):
+        class IFlyer(PureInterface):
+            def fly(self):
+                pass
+
+        class Bird(object):
+            pass
+
+        IFlyer.register(Bird)
+        self.assertEqual(implementations_of(IFlyer), {Bird})
+        IFlyer.interface_only(Bird())
+        self.assertEqual(implementations_of(IFlyer), {Bird})
+
+    def test_implementations_of_structural(self):
+        class IFlyer(PureInterface):
+            def fly(self):
+                pass
+
+        class Plane(object):
+            def fly(self):
+                pass
+
+        IFlyer.provided_by(Plane())
+        self.assertEqual(implementations_of(IFlyer), set())
+        self.assertEqual(implementations_of(IFlyer, include_structural=True), {Plane})
+
+    def test_implementations_of_is_weak(self):
+        class IFlyer(PureInterface):
+            def fly(self):
+                pass
+
+        class Bat(Concrete, IFlyer):
+            def fly(self):
+                pass
+
+        self.assertEqual(len(implementations_of(IFlyer)), 1)
+        del Bat
+        gc.collect()
+        self.assertEqual(len(implementations_of(IFlyer)), 0)
+
+    def test_all(self):
+        for name in pure_interface.__all__:
+            self.assertTrue(hasattr(pure_interface, name), name)
+        for name in ('os', 'time', 'six', 'Any', 'is_development', 'getargspec'):
+            self.assertNotIn(name, pure_interface.__all__)
+        from pure_interface import PI
+        self.assertIs(pure_interface.PI, PI)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import gc
+import sys
+import unittest
+import weakref
+
+import pure_interface
+from pure_interface import PureInterface, Concrete, InterfaceError
+
+protocols = """
+import typing
+
+
+class SupportsClose(typing.Protocol):
+    name: str
+
+    def close(self, force: bool = False) -> None:
+        ...
+
+    @property
+    def size(self) -> int:
+        ...
+
+
+class SupportsRead(SupportsClose, typing.Protocol):
+    def read(self, size: int = -1) -> bytes:
+        return b''
+"""
+
+if sys.version_info >= (3, 8):
+    exec(protocols)
+
+
+class File(object):
+    name = 'file'
+    size = 0
+
+    def close(self, force=False):
+        pass
+
+
+class Socket(object):
+    def send(self, data):
+        pass
+
+
+class ClosingMixin(object):
+    def close(self, force=False):
+        pass
+
+
+@unittest.skipIf(sys.version_info < (3, 8), 'typing.Protocol requires Python 3.8')
+class TestProtocolInterface(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pure_interface.is_development = True
+
+    def test_members(self):
+        interface = pure_interface.protocol_interface(SupportsClose)
+        self.assertTrue(pure_interface.type_is_pure_interface(interface))
+        self.assertEqual('SupportsClose', interface.__name__)
+        self.assertEqual(SupportsClose.__module__, interface.__module__)
+        self.assertEqual(frozenset(['close']), pure_interface.get_interface_method_names(interface))
+        self.assertEqual(frozenset(['size']), pure_interface.get_interface_property_names(interface))
+        self.assertEqual(frozenset(['name']), pure_interface.get_interface_attribute_names(interface))
+
+    def test_inherited_members(self):
+        interface = pure_interface.protocol_interface(SupportsRead)
+        self.assertEqual(frozenset(['close', 'read']), pure_interface.get_interface_method_names(interface))
+
+    def test_interface_is_reused(self):
+        self.assertIs(pure_interface.protocol_interface(SupportsClose),
+                      pure_interface.protocol_interface(SupportsClose))
+
+    def test_not_protocol_raises(self):
+        for cls in (File, PureInterface, 1):
+            with self.assertRaises(ValueError):
+                pure_interface.protocol_interface(cls)
+
+    def test_structural_isinstance(self):
+        interface = pure_interface.protocol_interface(SupportsClose)
+        self.assertTrue(interface._pi.structural)
+        self.assertTrue(isinstance(File(), interface))
+        self.assertFalse(isinstance(Socket(), interface))
+        self.assertTrue(interface.provided_by(File()))
+        self.assertIn(File, pure_interface.implementations_of(interface, include_structural=True))
+
+    def test_signatures_are_those_of_the_protocol(self):
+        interface = pure_interface.protocol_interface(SupportsClose)
+        self.assertIs(SupportsClose.__dict__['close'], interface._pi.interface_method_functions['close'])
+        with self.assertRaises(InterfaceError):
+            class BadFile(Concrete, interface):
+                def close(self):
+                    pass
+
+    def test_default_implementations_are_allowed(self):
+        interface = pure_interface.protocol_interface(SupportsRead)
+        self.assertEqual(frozenset(['close', 'read', 'size']), interface.__abstractmethods__)
+
+    def test_base_of_interface(self):
+        class IFile(pure_interface.protocol_interface(SupportsClose)):
+            def write(self, data):
+                pass
+
+        class Implementation(Concrete, IFile):
+            def __init__(self):
+                self.name = 'file'
+                self.size = 1
+
+            def close(self, force=False):
+                pass
+
+            def write(self, data):
+                pass
+
+        self.assertEqual(frozenset(['close', 'write']), pure_interface.get_interface_method_names(IFile))
+        interface = pure_interface.protocol_interface(SupportsClose)
+        implementation = Implementation()
+        self.assertTrue(interface.provided_by(implementation, allow_implicit=False))
+        self.assertIs(implementation, interface.adapt(implementation, interface_only=False))
+
+    def test_register_adapter(self):
+        adapter = lambda socket: File()
+        pure_interface.register_adapter(adapter, Socket, SupportsClose)
+        interface = pure_interface.protocol_interface(SupportsClose)
+        self.assertIsInstance(interface.adapt(Socket(), interface_only=False), File)
+        self.assertIsInstance(pure_interface.adapt_all(Socket(), [SupportsClose], interface_only=False), File)
+
+    def test_adapts(self):
+        class Pipe(object):
+            pass
+
+        @pure_interface.adapts(Pipe, SupportsClose)
+        def pipe_to_file(pipe):
+            return File()
+
+        interface = pure_interface.protocol_interface(SupportsClose)
+        self.assertTrue(interface.can_adapt(Pipe()))
+
+    def test_interface_dispatch(self):
+        @pure_interface.interface_dispatch
+        def close(obj):
+            return 'cannot close'
+
+        @close.register(SupportsClose)
+        def close_file(file):
+            return 'closed'
+
+        self.assertEqual('closed', close(File()))
+        self.assertEqual('cannot close', close(Socket()))
+
+    def test_mixin_with_protocol(self):
+        interface = pure_interface.protocol_interface(SupportsClose)
+
+        class Closer(ClosingMixin, Concrete, interface):
+            def __init__(self):
+                self.name = 'closer'
+                self.size = 0
+
+        self.assertTrue(interface.provided_by(Closer()))
+
+    def test_protocols_are_not_kept_alive(self):
+        import typing
+
+        class Temporary(typing.Protocol):
+            def close(self):
+                pass
+
+        interface = pure_interface.protocol_interface(Temporary)
+        protocol_ref = weakref.ref(Temporary)
+        del Temporary
+        gc.collect()
+        self.assertIsNone(protocol_ref())
+        self.assertEqual(frozenset(['close']), pure_interface.get_interface_method_names(interface))
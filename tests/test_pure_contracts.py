@@ -44,3 +44,93 @@ class TestPureContracts(unittest.TestCase):
                 def speak(self, volume):
                     if volume > 0:
                         return 'hello' + '!'*volume
+
+
+@unittest.skipIf(not have_contracts, 'PyContracts not found')
+class TestContractSampling(unittest.TestCase):
+    def tearDown(self):
+        pure_contracts.set_contract_sampling(pure_contracts.CheckAll())
+
+    def make_plant_type(self):
+        class SampledPlant(pure_contracts.Concrete, IPlant):
+            def set_height(self, height):
+                return height
+        return SampledPlant
+
+    def test_inherited_method_is_checked(self):
+        self.assertEqual(5.0, Plant().set_height(5.0))
+        with self.assertRaises(contracts.ContractNotRespected):
+            Plant().set_height(5)
+
+    def test_spec_is_shared(self):
+        plant_type = self.make_plant_type()
+        spec = IPlant.__dict__['set_height']._pi_contract_spec
+        self.assertIs(spec, plant_type.set_height._pi_contract_spec)
+        self.assertIs(spec, Plant.set_height._pi_contract_spec)
+
+    def test_every_nth(self):
+        plant_type = self.make_plant_type()
+        pure_contracts.set_contract_sampling(pure_contracts.EveryNth(3))
+        p = plant_type()
+        with self.assertRaises(contracts.ContractNotRespected):
+            p.set_height('first')
+        self.assertEqual('second', p.set_height('second'))
+        self.assertEqual('third', p.set_height('third'))
+        with self.assertRaises(contracts.ContractNotRespected):
+            p.set_height('fourth')
+
+    def test_first_n(self):
+        plant_type = self.make_plant_type()
+        pure_contracts.set_contract_sampling(pure_contracts.FirstN(2))
+        p = plant_type()
+        p.set_height(1.0)
+        with self.assertRaises(contracts.ContractNotRespected):
+            p.set_height('second')
+        self.assertEqual('third', p.set_height('third'))
+
+    def test_interface_policy(self):
+        plant_type = self.make_plant_type()
+        pure_contracts.set_contract_sampling(pure_contracts.FirstN(0), IPlant)
+        self.assertEqual('tall', plant_type().set_height('tall'))
+        pure_contracts.set_contract_sampling(None, IPlant)
+        with self.assertRaises(contracts.ContractNotRespected):
+            plant_type().set_height('tall')
+
+    def test_sub_class_inherits_contracts(self):
+        plant_type = self.make_plant_type()
+
+        class Tree(plant_type):
+            def set_height(self, height):
+                return height * 2
+
+        self.assertEqual(4.0, Tree().set_height(2.0))
+        with self.assertRaises(contracts.ContractNotRespected):
+            Tree().set_height(2)
+
+    def test_stats(self):
+        plant_type = self.make_plant_type()
+        name = '{}.SampledPlant.set_height'.format(__name__)
+        pure_contracts.set_contract_sampling(pure_contracts.EveryNth(2))
+        pure_contracts.reset_contract_stats()
+        p = plant_type()
+        for i in range(4):
+            p.set_height(1.0)
+        with self.assertRaises(contracts.ContractNotRespected):
+            p.set_height('x')
+        stats = pure_contracts.contract_stats()[name]
+        self.assertEqual(5, stats['calls'])
+        self.assertEqual(3, stats['checked'])
+        self.assertEqual(1, stats['violations'])
+        self.assertGreater(stats['check_time'], 0.0)
+        pure_contracts.reset_contract_stats()
+        stats = pure_contracts.contract_stats()[name]
+        self.assertEqual(0, stats['calls'])
+        self.assertEqual(0, stats['violations'])
+
+    def test_disable_all(self):
+        plant_type = self.make_plant_type()
+        contracts.disable_all()
+        try:
+            self.assertEqual('tall', plant_type().set_height('tall'))
+        finally:
+            contracts.enable_all()
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import unittest
+import warnings
+
+import pure_interface
+from pure_interface import PureInterface, Concrete
+
+
+class ISpeaker(PureInterface):
+    volume = None
+
+    def speak(self, words):
+        pass
+
+
+class Speaker(Concrete, ISpeaker):
+    def __init__(self):
+        self.volume = 1
+
+    def speak(self, words):
+        return words
+
+
+class Talker(object):
+    def talk(self, words):
+        return words
+
+
+def talker_to_speaker(talker):
+    speaker = Speaker()
+    speaker.speak = talker.talk
+    return speaker
+
+
+pure_interface.register_adapter(talker_to_speaker, Talker, ISpeaker)
+
+
+class Duck(object):
+    volume = 2
+
+    def speak(self, words):
+        return words
+
+
+class TestStats(unittest.TestCase):
+    def setUp(self):
+        pure_interface.enable_stats()
+        pure_interface.reset_stats()
+
+    def tearDown(self):
+        pure_interface.enable_stats(False)
+
+    def test_disabled_stats_are_zero(self):
+        pure_interface.enable_stats(False)
+        ISpeaker.adapt(Talker(), interface_only=False)
+        stats = pure_interface.stats()
+        self.assertFalse(stats['enabled'])
+        self.assertEqual(0, stats['adapt_calls'])
+        self.assertEqual([], stats['hot_adapters'])
+        self.assertIsNone(pure_interface._stats)
+
+    def test_adapt_counters(self):
+        talker = Talker()
+        for i in range(3):
+            ISpeaker.adapt(talker, interface_only=False)
+        ISpeaker.adapt(Speaker(), interface_only=False)
+        ISpeaker.adapt_or_none(1)
+        stats = pure_interface.stats()
+        self.assertTrue(stats['enabled'])
+        self.assertEqual(5, stats['adapt_calls'])
+        self.assertEqual(4, stats['adapter_lookups'])
+        self.assertEqual(1, stats['adaption_failures'])
+        self.assertEqual([{'interface': 'ISpeaker', 'adapter': 'talker_to_speaker', 'calls': 3}],
+                         stats['hot_adapters'])
+        self.assertEqual(3, stats['verifications'] + stats['verifications_skipped'])
+        self.assertEqual(pure_interface.adapter_verification, stats['adapter_verification'])
+
+    def test_instances(self):
+        class Counted(Concrete, ISpeaker):
+            def __init__(self):
+                self.volume = 1
+
+            def speak(self, words):
+                return words
+
+        Counted()
+        Counted()
+        stats = pure_interface.stats()
+        self.assertEqual(2, stats['instances']['{}.Counted'.format(__name__)])
+        pure_interface.reset_stats()
+        self.assertNotIn('{}.Counted'.format(__name__), pure_interface.stats()['instances'])
+        pure_interface.enable_stats(False)
+        Counted()
+        pure_interface.enable_stats()
+        self.assertNotIn('{}.Counted'.format(__name__), pure_interface.stats()['instances'])
+
+    def test_wrappers_created(self):
+        speaker = Speaker()
+        wrapper = ISpeaker.interface_only(speaker)
+        self.assertIs(wrapper, ISpeaker.interface_only(speaker))  # reuses the live wrapper
+        ISpeaker.adapt(Speaker(), interface_only=True)
+        self.assertEqual(2, pure_interface.stats()['wrappers_created'])
+
+    def test_structural_checks(self):
+        class Parrot(object):
+            volume = 1
+
+            def speak(self, words):
+                return words
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            ISpeaker.provided_by(Parrot())
+            ISpeaker.provided_by(Parrot())
+            ISpeaker.provided_by(1)
+        stats = pure_interface.stats()
+        self.assertEqual(2, stats['structural_checks'])
+        self.assertEqual(1, stats['structural_matches'])
+        self.assertEqual(1, stats['instance_structural_checks'])
+
+    def test_reset(self):
+        ISpeaker.adapt(Talker(), interface_only=False)
+        pure_interface.reset_stats()
+        stats = pure_interface.stats()
+        self.assertEqual(0, stats['adapt_calls'])
+        self.assertEqual([], stats['hot_adapters'])
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+from __future__ import absolute_import, division, print_function, unicode_literals
+
+import os
+import subprocess
+import sys
+import unittest
+
+STRIPPED_SCRIPT = '''
+import pure_interface
+from pure_interface import PureInterface, Concrete
+
+assert pure_interface.is_stripped
+assert not pure_interface.is_development
+
+
+class IAnimal(PureInterface):
+    height = None
+
+    @property
+    def weight(self):
+        pass
+
+    def speak(self, volume):
+        print('not checked in strip mode')
+
+
+class Animal(Concrete, IAnimal):
+    def __init__(self):
+        self.height = 5
+        self.weight = 6
+
+    def speak(self, loudness):
+        return 'hello'
+
+
+class Incomplete(Concrete, IAnimal):
+    pass
+
+
+try:
+    IAnimal()
+except TypeError:
+    pass
+else:
+    raise AssertionError('interface instantiated')
+
+try:
+    Incomplete()
+except TypeError:
+    pass
+else:
+    raise AssertionError('incomplete implementation instantiated')
+
+a = Animal()
+assert a.weight == 6
+assert isinstance(Animal.__dict__['weight'], pure_interface.AttributeProperty)
+assert IAnimal._pi.interface_method_names == {'speak'}
+assert IAnimal.adapt(a) is a
+assert not pure_interface.missing_method_warnings
+print('OK')
+'''
+
+
+class TestStripMode(unittest.TestCase):
+    def test_stripped_runtime_behaviour(self):
+        env = dict(os.environ, PURE_INTERFACE_STRIP='1')
+        root = os.path.join(os.path.dirname(__file__), '..')
+        process = subprocess.Popen([sys.executable, '-c', STRIPPED_SCRIPT], cwd=root, env=env,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        out, err = process.communicate()
+        self.assertEqual(process.returncode, 0, err.decode('utf-8'))
+        self.assertEqual(out.decode('utf-8').strip(), 'OK')